@@ -0,0 +1,114 @@
+"""Login throughput benchmark.
+
+Starts the application under uvicorn once per password hashing pool size,
+drives `POST /api/access/login` with concurrent clients and reports logins
+per second, rejected (429) requests and latency percentiles.  Needs a
+migrated database; the benchmark user is created when missing.
+
+    python scripts/bench_login.py --workers 1 2 4 --concurrency 32 --requests 500
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+import httpx
+
+from app.domain.accounts.services import UserService
+from app.lib import db
+
+EMAIL = "login-benchmark@example.com"
+PASSWORD = "login-benchmark"  # noqa: S105
+
+
+async def ensure_user() -> None:
+    async with UserService.new() as users_service:
+        if await users_service.get_one_or_none(email=EMAIL) is None:
+            await users_service.create({"email": EMAIL, "password": PASSWORD, "name": "Login Benchmark"})
+            await users_service.repository.session.commit()
+    await db.engine.dispose()
+
+
+async def start_server(workers: int, queue_depth: int, port: int) -> asyncio.subprocess.Process:
+    env = {
+        **os.environ,
+        "APP_PASSWORD_HASH_WORKERS": str(workers),
+        "APP_PASSWORD_HASH_QUEUE_DEPTH": str(queue_depth),
+        "LOG_LEVEL": "40",
+    }
+    server = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "app.asgi:create_app",
+        "--factory",
+        "--port",
+        str(port),
+        "--log-level",
+        "warning",
+        env=env,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    for _ in range(200):
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:
+            await asyncio.sleep(0.1)
+            continue
+        writer.close()
+        return server
+    server.terminate()
+    msg = "Server did not start"
+    raise RuntimeError(msg)
+
+
+async def run(url: str, concurrency: int, requests: int) -> tuple[list[float], list[int], float]:
+    latencies: list[float] = []
+    statuses: list[int] = []
+    remaining = iter(range(requests))
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60) as client:
+
+        async def user_loop() -> None:
+            for _ in remaining:
+                started = time.perf_counter()
+                response = await client.post("/api/access/login", data={"username": EMAIL, "password": PASSWORD})
+                latencies.append(time.perf_counter() - started)
+                statuses.append(response.status_code)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(user_loop() for _ in range(concurrency)))
+        return latencies, statuses, time.perf_counter() - started
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="pool sizes to benchmark")
+    parser.add_argument("--queue-depth", type=int, default=16, help="APP_PASSWORD_HASH_QUEUE_DEPTH for every run")
+    parser.add_argument("--concurrency", type=int, default=32, help="concurrent clients")
+    parser.add_argument("--requests", type=int, default=500, help="logins per pool size")
+    parser.add_argument("--port", type=int, default=8089, help="port for the benchmarked server")
+    args = parser.parse_args()
+
+    await ensure_user()
+    print(f"{'workers':>8} {'ok':>6} {'429':>6} {'logins/s':>9} {'p50 ms':>8} {'p99 ms':>8}")  # noqa: T201
+    for workers in args.workers:
+        server = await start_server(workers, args.queue_depth, args.port)
+        try:
+            latencies, statuses, elapsed = await run(f"http://127.0.0.1:{args.port}", args.concurrency, args.requests)
+        finally:
+            server.terminate()
+            await server.wait()
+        ok = [latency for latency, status in zip(latencies, statuses, strict=True) if status == 201]
+        quantiles = statistics.quantiles(ok, n=100) if len(ok) > 1 else [float("nan")] * 99
+        print(  # noqa: T201
+            f"{workers:>8} {len(ok):>6} {statuses.count(429):>6} {len(ok) / elapsed:>9.1f} "
+            f"{quantiles[49] * 1000:>8.1f} {quantiles[98] * 1000:>8.1f}",
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -23,9 +23,11 @@ def create_app() -> Litestar:
         cache,
         constants,
         cors,
+        crypt,
         db,
         exceptions,
         log,
+        plugin,
         repository,
         settings,
         static_files,
@@ -37,7 +39,10 @@ def create_app() -> Litestar:
 
     return Litestar(
         response_cache_config=cache.config,
-        stores=StoreRegistry(default_factory=cache.redis_store_factory),
+        stores=StoreRegistry(
+            stores={cache.config.store: cache.response_store},
+            default_factory=cache.redis_store_factory,
+        ),
         cors_config=cors.config,
         dependencies=dependencies,
         exception_handlers={
@@ -45,14 +50,19 @@ def create_app() -> Litestar:
         },
         debug=settings.app.DEBUG,
         before_send=[log.controller.BeforeSendHandler()],
-        middleware=[log.controller.middleware_factory],
+        middleware=[log.controller.middleware_factory, cache.single_flight_middleware],
         logging_config=log.config,
         openapi_config=domain.openapi.config,
         route_handlers=[*domain.routes],
-        plugins=[db.plugin, domain.plugins.aiosql],
-        on_shutdown=[cache.redis.aclose],
-        on_startup=[lambda: log.configure(log.default_processors)],  # type: ignore[arg-type]
-        on_app_init=[domain.security.auth.on_app_init, repository.on_app_init],
+        plugins=[db.plugin, domain.plugins.aiosql, domain.plugins.saq],
+        on_shutdown=[db.write_behind.flusher.shutdown, db.on_shutdown, cache.redis.aclose, crypt.on_shutdown],
+        on_startup=[lambda: log.configure(log.default_processors), db.write_behind.flusher.startup],  # type: ignore[arg-type]
+        on_app_init=[
+            domain.security.auth.on_app_init,
+            repository.on_app_init,
+            plugin.on_app_init,
+            log.controller.on_app_init,
+        ],
         static_files_config=static_files.config,
         signature_namespace=domain.signature_namespace,
     )
@@ -6,7 +6,7 @@ from uuid import UUID
 
 from litestar.contrib.jwt import OAuth2Login
 from litestar.dto import DTOData
-from litestar.pagination import OffsetPagination
+from litestar.pagination import CursorPagination, OffsetPagination
 from litestar.types import TypeEncodersMap
 from pydantic import UUID4
 from saq import Queue
@@ -23,6 +23,7 @@ from app.domain.projects.models import ProjectService
 from app.domain.sprintlogs.models import SprintlogService
 from app.domain.tags.models import Tag
 from app.domain.teams.models import Team, TeamMember
+from app.lib.pagination import KeysetPagination
 
 from . import (
     accounts,
@@ -90,6 +91,8 @@ signature_namespace: Mapping[str, Any] = {
     "Tag": Tag,
     "OAuth2Login": OAuth2Login,
     "OffsetPagination": OffsetPagination,
+    "CursorPagination": CursorPagination,
+    "KeysetPagination": KeysetPagination,
     "SprintlogService": SprintlogService,
     "ProjectService": ProjectService,
     "UserService": accounts.services.UserService,
@@ -1,4 +1,4 @@
 """User Account domain logic."""
-from . import controllers, dependencies, dtos, guards, models, services
+from . import cache, controllers, dependencies, dtos, guards, models, services
 
-__all__ = ["models", "guards", "services", "controllers", "dependencies", "dtos"]
+__all__ = ["cache", "models", "guards", "services", "controllers", "dependencies", "dtos"]
@@ -0,0 +1,179 @@
+"""Cached user and team membership snapshots for request authentication.
+
+`current_user_from_token` resolves the JWT subject to a user with its team
+memberships on every authenticated request.  The result is stored as a
+compact snapshot in a [`TwoTierCache`][app.lib.cache.TwoTierCache] keyed by
+email and turned back into detached `User`, `TeamMember` and `Team`
+instances on a hit.  The password hash is never cached.
+
+Services that change users, teams or memberships call `invalidate` (or one
+of the lookup helpers) with the session doing the change; the entries are
+evicted once that session commits, so a concurrent request cannot refill
+the cache with the old rows in between.
+"""
+from __future__ import annotations
+
+from datetime import datetime  # noqa: TCH003
+from typing import TYPE_CHECKING
+from uuid import UUID  # noqa: TCH003
+
+import msgspec
+from sqlalchemy import select
+
+from app.domain.accounts.models import User
+from app.domain.teams.models import Team, TeamMember, TeamRoles
+from app.lib import constants
+from app.lib.cache import TwoTierCache, invalidate_after_commit
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import Session
+
+__all__ = [
+    "dump_user",
+    "get_user",
+    "invalidate",
+    "invalidate_team",
+    "invalidate_users",
+    "load_user",
+    "set_user",
+    "user_cache",
+]
+
+user_cache = TwoTierCache(
+    "user",
+    expiration=constants.USER_CACHE_EXPIRATION,
+    local_expiration=constants.USER_CACHE_LOCAL_EXPIRATION,
+    local_size=constants.USER_CACHE_LOCAL_SIZE,
+)
+"""Process wide user snapshot cache."""
+
+
+class _TeamSnapshot(msgspec.Struct, array_like=True):
+    id: UUID
+    slug: str
+    name: str
+    description: str | None
+    is_active: bool
+
+
+class _MembershipSnapshot(msgspec.Struct, array_like=True):
+    id: UUID
+    team_id: UUID
+    role: TeamRoles
+    is_owner: bool
+    team: _TeamSnapshot
+
+
+class _UserSnapshot(msgspec.Struct, array_like=True):
+    id: UUID
+    email: str
+    name: str | None
+    is_active: bool
+    is_superuser: bool
+    is_verified: bool
+    verified_at: datetime | None
+    created_at: datetime
+    updated_at: datetime
+    teams: list[_MembershipSnapshot]
+
+
+_encoder = msgspec.msgpack.Encoder()
+_decoder = msgspec.msgpack.Decoder(_UserSnapshot)
+
+
+def dump_user(user: User) -> bytes:
+    """Serialize `user` and its loaded team memberships."""
+    return _encoder.encode(
+        _UserSnapshot(
+            id=user.id,
+            email=user.email,
+            name=user.name,
+            is_active=user.is_active,
+            is_superuser=user.is_superuser,
+            is_verified=user.is_verified,
+            verified_at=user.verified_at,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+            teams=[
+                _MembershipSnapshot(
+                    id=member.id,
+                    team_id=member.team_id,
+                    role=member.role,
+                    is_owner=member.is_owner,
+                    team=_TeamSnapshot(
+                        id=member.team.id,
+                        slug=member.team.slug,
+                        name=member.team.name,
+                        description=member.team.description,
+                        is_active=member.team.is_active,
+                    ),
+                )
+                for member in user.teams
+            ],
+        ),
+    )
+
+
+def load_user(data: bytes) -> User:
+    """Rebuild a detached `User` from a snapshot made by `dump_user`."""
+    snapshot = _decoder.decode(data)
+    user = User(
+        id=snapshot.id,
+        email=snapshot.email,
+        name=snapshot.name,
+        is_active=snapshot.is_active,
+        is_superuser=snapshot.is_superuser,
+        is_verified=snapshot.is_verified,
+        verified_at=snapshot.verified_at,
+        created_at=snapshot.created_at,
+        updated_at=snapshot.updated_at,
+    )
+    user.teams = [
+        TeamMember(
+            id=member.id,
+            user_id=snapshot.id,
+            team_id=member.team_id,
+            role=member.role,
+            is_owner=member.is_owner,
+            team=Team(
+                id=member.team.id,
+                slug=member.team.slug,
+                name=member.team.name,
+                description=member.team.description,
+                is_active=member.team.is_active,
+            ),
+        )
+        for member in snapshot.teams
+    ]
+    return user
+
+
+async def get_user(email: str) -> User | None:
+    data = await user_cache.get(email)
+    return load_user(data) if data is not None else None
+
+
+async def set_user(user: User) -> None:
+    await user_cache.set(user.email, dump_user(user))
+
+
+def invalidate(session: AsyncSession | Session, emails: Iterable[str]) -> None:
+    """Evict the snapshots of `emails` once `session` commits."""
+    invalidate_after_commit(session, user_cache, keys=emails)
+
+
+async def invalidate_users(session: AsyncSession, user_ids: Iterable[UUID]) -> None:
+    """Evict the snapshots of the users with `user_ids` once `session` commits."""
+    emails = await session.scalars(select(User.email).where(User.id.in_(list(user_ids))))
+    invalidate(session, emails)
+
+
+async def invalidate_team(session: AsyncSession, team_id: UUID) -> None:
+    """Evict the snapshots of every member of `team_id` once `session` commits."""
+    emails = await session.scalars(
+        select(User.email).join(TeamMember, TeamMember.user_id == User.id).where(TeamMember.team_id == team_id),
+    )
+    invalidate(session, emails)
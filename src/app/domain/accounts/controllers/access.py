@@ -15,7 +15,7 @@ from app.domain.accounts.dtos import AccountLogin, AccountLoginDTO, AccountRegis
 from app.domain.accounts.guards import requires_active_user
 from app.domain.accounts.models import User
 from app.domain.accounts.services import UserService
-from app.lib import log
+from app.lib import log, settings
 
 __all__ = ["AccessController", "provides_user_service"]
 
@@ -53,7 +53,24 @@ class AccessController(Controller):
         """Authenticate a user."""
         obj = data.create_instance()
         user = await users_service.authenticate(obj.username, obj.password)
-        return security.auth.login(user.email)
+        if settings.app.JWT_TEAM_CLAIMS:
+            user = await users_service.get_one(id=user.id, statement=security.USER_WITH_TEAMS)
+        return security.login(user)
+
+    @post(
+        operation_id="AccountRefresh",
+        name="account:refresh",
+        path=urls.ACCOUNT_REFRESH,
+        media_type=MediaType.JSON,
+        cache=False,
+        guards=[requires_active_user],
+        summary="Refresh Token",
+        description="Issue a new access token reflecting the current team memberships.",
+        return_dto=None,
+    )
+    async def refresh(self, current_user: User) -> Response[OAuth2Login]:
+        """Reissue the access token of the current user."""
+        return security.login(current_user)
 
     @post(
         operation_id="AccountRegister",
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Any
 
 from litestar.exceptions import PermissionDeniedException
 from pydantic import SecretStr
+from sqlalchemy import select
+from sqlalchemy.orm import InstrumentedAttribute
 
+from app.domain.accounts import cache
 from app.lib import crypt
 from app.lib.repository import SQLAlchemyAsyncRepository
 from app.lib.service import SQLAlchemyAsyncRepositoryService
@@ -81,6 +85,51 @@ class UserService(SQLAlchemyAsyncRepositoryService[User]):
         db_obj.hashed_password = await crypt.get_password_hash(data["new_password"])
         await self.repository.update(db_obj)
 
+    async def update(
+        self,
+        data: User | dict[str, Any],
+        item_id: Any | None = None,
+        attribute_names: Iterable[str] | None = None,
+        with_for_update: bool | None = None,
+        auto_commit: bool | None = None,
+        auto_expunge: bool | None = None,
+        auto_refresh: bool | None = None,
+        id_attribute: str | InstrumentedAttribute | None = None,
+    ) -> User:
+        """Update a user and evict its cached snapshot, under the old and new email."""
+        if item_id is None:
+            item_id = data.get("id") if isinstance(data, dict) else data.id
+        old_email = await self.repository.session.scalar(select(User.email).where(User.id == item_id))
+        db_obj = await super().update(
+            data=data,
+            item_id=item_id,
+            attribute_names=attribute_names,
+            with_for_update=with_for_update,
+            auto_commit=auto_commit,
+            auto_expunge=auto_expunge,
+            auto_refresh=auto_refresh,
+            id_attribute=id_attribute,
+        )
+        cache.invalidate(self.repository.session, [db_obj.email] if old_email is None else [db_obj.email, old_email])
+        return db_obj
+
+    async def delete(
+        self,
+        item_id: Any,
+        auto_commit: bool | None = None,
+        auto_expunge: bool | None = None,
+        id_attribute: str | InstrumentedAttribute | None = None,
+    ) -> User:
+        """Delete a user and evict its cached snapshot."""
+        db_obj = await super().delete(
+            item_id=item_id,
+            auto_commit=auto_commit,
+            auto_expunge=auto_expunge,
+            id_attribute=id_attribute,
+        )
+        cache.invalidate(self.repository.session, [db_obj.email])
+        return db_obj
+
     async def to_model(self, data: User | dict[str, Any], operation: str | None = None) -> User:
         if isinstance(data, dict) and "password" in data:
             password: SecretStr | str | None = data.pop("password", None)
@@ -1,3 +1,3 @@
-from . import controllers, dependencies, dtos, queries
+from . import controllers, dependencies, dtos, models, queries
 
-__all__ = ["controllers", "dependencies", "dtos", "queries"]
+__all__ = ["controllers", "dependencies", "dtos", "models", "queries"]
@@ -11,10 +11,10 @@ from pydantic import TypeAdapter
 from app.domain import urls
 from app.domain.accounts.guards import requires_active_user
 from app.domain.analytics.dependencies import provides_analytic_queries
-from app.domain.analytics.dtos import NewUsersByWeekDTO
-from app.lib import log
+from app.domain.analytics.dtos import NewUsersByWeekDTO, SprintBurndownDayDTO
+from app.lib import cache, log
 
-from .dtos import NewUsersByWeek
+from .dtos import NewUsersByWeek, SprintBurndownDay
 
 if TYPE_CHECKING:
     from litestar_aiosql.service import AiosqlQueryManager
@@ -42,6 +42,7 @@ class StatsController(Controller):
         summary="Weekly New Users",
         description="List New Users by Week.",
         cache=1000,
+        cache_key_builder=cache.shared_cache_key_builder,
         return_dto=NewUsersByWeekDTO,
     )
     async def weekly_new_users(self, analytic_queries: AiosqlQueryManager) -> OffsetPagination[NewUsersByWeek]:
@@ -53,3 +54,30 @@ class StatsController(Controller):
             limit=len(results),
             offset=0,
         )
+
+    @get(
+        operation_id="StatsSprintBurndown",
+        name="stats:sprint-burndown",
+        path=urls.STATS_SPRINT_BURNDOWN,
+        summary="Sprint Burndown",
+        description="Daily scope and remaining work of a sprint.",
+        return_dto=SprintBurndownDayDTO,
+    )
+    async def sprint_burndown(
+        self,
+        analytic_queries: AiosqlQueryManager,
+        project_slug: str,
+        sprint_number: int,
+    ) -> OffsetPagination[SprintBurndownDay]:
+        """Sprint burndown / burnup by day."""
+        results = await analytic_queries.select(
+            "sprint_burndown",
+            project_slug=project_slug,
+            sprint_number=sprint_number,
+        )
+        return OffsetPagination[SprintBurndownDay](
+            items=TypeAdapter(list[SprintBurndownDay]).validate_python(results),
+            total=len(results),
+            limit=len(results),
+            offset=0,
+        )
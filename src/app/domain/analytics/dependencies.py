@@ -26,7 +26,7 @@ async def provides_analytic_queries(
     db_session: AsyncSession,
 ) -> AsyncGenerator[AiosqlQueryManager, None]:
     """Construct repository and service objects for the request."""
-    db_connection = await db_session.connection()
+    db_connection = await db_session.connection(bind_arguments={"replica": True})
     raw_connection = await db_connection.get_raw_connection()
     if not raw_connection.driver_connection:
         msg = "Unable to fetch raw connection from session."
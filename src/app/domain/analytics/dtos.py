@@ -1,11 +1,11 @@
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
 
 from litestar.dto import DataclassDTO
 
 from app.lib import dto
 
-__all__ = ["NewUsersByWeek", "NewUsersByWeekDTO"]
+__all__ = ["NewUsersByWeek", "NewUsersByWeekDTO", "SprintBurndownDay", "SprintBurndownDayDTO"]
 
 
 @dataclass
@@ -18,3 +18,20 @@ class NewUsersByWeekDTO(DataclassDTO[NewUsersByWeek]):
     """NewUsersByWeek."""
 
     config = dto.config()
+
+
+@dataclass
+class SprintBurndownDay:
+    day: date
+    items: int
+    points: int
+    est_days: float
+    remaining_items: int
+    remaining_points: int
+    remaining_est_days: float
+
+
+class SprintBurndownDayDTO(DataclassDTO[SprintBurndownDay]):
+    """SprintBurndownDay."""
+
+    config = dto.config()
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from datetime import date, datetime  # noqa: TCH003
+
+from sqlalchemy import Index, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.lib.db import orm
+
+__all__ = ["RollupWatermark", "SprintBurndown", "SprintlogDeletion"]
+
+
+class SprintBurndown(orm.TimestampedDatabaseModel):
+    """Daily snapshot of the scope and remaining work of a sprint.
+
+    Maintained by the `rollup_sprint_burndown` worker task, cancelled items
+    are left out and completed items no longer count as remaining.
+    """
+
+    __tablename__ = "sprint_burndown"  # type: ignore[assignment]
+    __table_args__ = (
+        UniqueConstraint("project_slug", "sprint_number", "day"),
+        {"comment": "Daily burndown / burnup rollup per sprint"},
+    )
+    project_slug: Mapped[str] = mapped_column(String(length=100))
+    sprint_number: Mapped[int]
+    day: Mapped[date]
+    items: Mapped[int] = mapped_column(default=0)
+    points: Mapped[int] = mapped_column(default=0)
+    est_days: Mapped[float] = mapped_column(default=0)
+    remaining_items: Mapped[int] = mapped_column(default=0)
+    remaining_points: Mapped[int] = mapped_column(default=0)
+    remaining_est_days: Mapped[float] = mapped_column(default=0)
+
+
+class RollupWatermark(orm.DatabaseModel):
+    """Last source `updated_at` a rollup has been brought up to."""
+
+    __tablename__ = "rollup_watermark"  # type: ignore[assignment]
+    name: Mapped[str] = mapped_column(String(length=100), unique=True)
+    watermark: Mapped[datetime]
+
+
+class SprintlogDeletion(orm.TimestampedDatabaseModel):
+    """Sprint a sprintlog was deleted from.
+
+    A deleted sprintlog leaves no row for the `rollup_sprint_burndown`
+    change scan to find, so its sprint is recorded here instead.
+    """
+
+    __tablename__ = "sprint_log_deletion"  # type: ignore[assignment]
+    project_slug: Mapped[str] = mapped_column(String(length=100))
+    sprint_number: Mapped[int]
+
+
+Index("ix_sprint_log_deletion_created_at", SprintlogDeletion.created_at)
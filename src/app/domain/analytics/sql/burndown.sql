@@ -0,0 +1,88 @@
+-- name: rollup-sprint-burndown$
+-- Bring today's sprint_burndown rows up to date for every sprint whose
+-- sprintlogs changed, were moved out of it or were deleted since the
+-- watermark, then advance the watermark and drop the deletions already
+-- rolled up.  Returns the number of sprints rolled up.
+with mark as (
+    select coalesce(
+        (select watermark from rollup_watermark where name = 'sprint_burndown'),
+        '-infinity'::timestamptz
+    ) - make_interval(secs => :overlap) as since
+), changed as (
+    select sprint_log.project_slug, sprint_log.sprint_number
+    from sprint_log, mark
+    where sprint_log.updated_at > mark.since
+    union
+    select sprint_log.project_slug, audit.old_value::integer
+    from audit
+    join sprint_log on sprint_log.id = audit.backlog_id
+    cross join mark
+    where audit.created_at > mark.since
+      and audit.field_name = 'sprint_number'
+      and audit.old_value ~ '^[0-9]+$'
+    union
+    select sprint_log_deletion.project_slug, sprint_log_deletion.sprint_number
+    from sprint_log_deletion, mark
+    where sprint_log_deletion.created_at > mark.since
+), rolled as (
+    insert into sprint_burndown (
+        id, project_slug, sprint_number, day,
+        items, points, est_days,
+        remaining_items, remaining_points, remaining_est_days,
+        created_at, updated_at
+    )
+    select
+        gen_random_uuid(), changed.project_slug, changed.sprint_number, (now() at time zone 'utc')::date,
+        count(sprint_log.id),
+        coalesce(sum(sprint_log.points), 0),
+        coalesce(sum(sprint_log.est_days), 0),
+        count(sprint_log.id) filter (where sprint_log.status <> :completed),
+        coalesce(sum(sprint_log.points) filter (where sprint_log.status <> :completed), 0),
+        coalesce(sum(sprint_log.est_days) filter (where sprint_log.status <> :completed), 0),
+        now(), now()
+    from changed
+    left join sprint_log
+        on sprint_log.project_slug = changed.project_slug
+        and sprint_log.sprint_number = changed.sprint_number
+        and sprint_log.status <> :cancelled
+    group by changed.project_slug, changed.sprint_number
+    on conflict (project_slug, sprint_number, day) do update set
+        items = excluded.items,
+        points = excluded.points,
+        est_days = excluded.est_days,
+        remaining_items = excluded.remaining_items,
+        remaining_points = excluded.remaining_points,
+        remaining_est_days = excluded.remaining_est_days,
+        updated_at = excluded.updated_at
+    returning 1
+), advanced as (
+    insert into rollup_watermark (id, name, watermark)
+    values (gen_random_uuid(), 'sprint_burndown', now())
+    on conflict (name) do update set watermark = excluded.watermark
+), pruned as (
+    delete from sprint_log_deletion
+    using mark
+    where sprint_log_deletion.created_at <= mark.since
+)
+select count(*) from rolled
+
+-- name: sprint-burndown
+-- Daily burndown of a sprint, carrying the last snapshot forward over days
+-- nothing in the sprint changed.
+select days.day::date as day,
+    snapshot.items, snapshot.points, snapshot.est_days,
+    snapshot.remaining_items, snapshot.remaining_points, snapshot.remaining_est_days
+from (
+    select min(day) as first_day
+    from sprint_burndown
+    where project_slug = :project_slug and sprint_number = :sprint_number
+) bounds
+cross join generate_series(bounds.first_day, (now() at time zone 'utc')::date, interval '1 day') as days(day)
+cross join lateral (
+    select items, points, est_days, remaining_items, remaining_points, remaining_est_days
+    from sprint_burndown
+    where project_slug = :project_slug and sprint_number = :sprint_number and day <= days.day
+    order by day desc
+    limit 1
+) snapshot
+order by days.day
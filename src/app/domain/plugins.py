@@ -1,5 +1,6 @@
 from litestar_aiosql import AiosqlConfig, AiosqlPlugin
 from litestar_saq import CronJob, QueueConfig, SAQConfig, SAQPlugin
+from litestar_saq.base import Queue
 from litestar_vite import ViteConfig, VitePlugin
 
 from app.domain.system import tasks
@@ -14,36 +15,60 @@ vite = VitePlugin(
         port=3005,
     ),
 )
-saq = SAQPlugin(
-    config=SAQConfig(
-        redis_url=settings.redis.URL,
-        web_enabled=True,
-        worker_processes=1,
-        queue_configs=[
-            QueueConfig(
-                name="system-tasks",
-                tasks=[tasks.system_task, tasks.system_upkeep],
-                scheduled_tasks=[
-                    CronJob(
-                        function=tasks.system_upkeep,
-                        unique=True,
-                        cron="0 * * * *",
-                        timeout=500,
-                    ),
-                ],
-            ),
-            QueueConfig(
-                name="background-tasks",
-                tasks=[tasks.background_worker_task],
-                scheduled_tasks=[
-                    CronJob(
-                        function=tasks.background_worker_task,
-                        unique=True,
-                        cron="* * * * *",
-                        timeout=300,
-                    ),
-                ],
-            ),
-        ],
-    ),
+saq_config = SAQConfig(
+    redis_url=settings.redis.URL,
+    web_enabled=True,
+    worker_processes=1,
+    queue_configs=[
+        QueueConfig(
+            name="system-tasks",
+            tasks=[tasks.system_task, tasks.rollup_sprint_burndown],
+            scheduled_tasks=[
+                CronJob(
+                    function=tasks.rollup_sprint_burndown,
+                    unique=True,
+                    cron=settings.worker.BURNDOWN_CRON,
+                    timeout=500,
+                ),
+            ],
+        ),
+        QueueConfig(
+            name="plugin-events",
+            tasks=[tasks.deliver_plugin_events, tasks.purge_plugin_events, tasks.run_plugin_task],
+            startup=tasks.plugin_events_startup,
+            shutdown=tasks.plugin_events_shutdown,
+            scheduled_tasks=[
+                CronJob(
+                    function=tasks.deliver_plugin_events,
+                    unique=True,
+                    cron=settings.worker.PLUGIN_OUTBOX_CRON,
+                    timeout=300,
+                ),
+                CronJob(
+                    function=tasks.purge_plugin_events,
+                    unique=True,
+                    cron=settings.worker.PLUGIN_OUTBOX_PURGE_CRON,
+                    timeout=300,
+                ),
+            ],
+        ),
+        QueueConfig(
+            name="background-tasks",
+            tasks=[tasks.background_worker_task],
+            scheduled_tasks=[
+                CronJob(
+                    function=tasks.background_worker_task,
+                    unique=True,
+                    cron="* * * * *",
+                    timeout=300,
+                ),
+            ],
+        ),
+    ],
 )
+saq = SAQPlugin(config=saq_config)
+
+
+def get_queue(name: str) -> Queue:
+    """The task queue `name`, for jobs enqueued outside of request handlers."""
+    return saq_config.get_queues().get(name)
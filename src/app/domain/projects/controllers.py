@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any
 
 from litestar import (
     Controller,
+    Response,
     delete,
     get,  # pylint: disable=unused-import
     post,
@@ -16,6 +17,8 @@ from litestar.status_codes import HTTP_200_OK
 
 from app.domain.accounts.guards import requires_active_user
 from app.domain.accounts.models import User
+from app.lib import cache, constants
+from app.utils import entity_tag
 
 if TYPE_CHECKING:
     from uuid import UUID
@@ -41,14 +44,18 @@ class ApiController(Controller):
     tags = ["Projects API"]
     DETAIL_ROUTE = "/{row_id:uuid}"
 
-    @get(guards=[requires_active_user])
+    @get(
+        guards=[requires_active_user],
+        cache=constants.LIST_CACHE_EXPIRATION,
+        cache_key_builder=cache.tagged_key_builder(lambda _: cache.PROJECTS_TAG),
+    )
     async def filter(
         self,
         service: "ProjectService",
-        filters: list["FilterTypes"] = validation_skip,
+        labeled_filters: list["FilterTypes"] = validation_skip,
     ) -> Sequence[Model]:
         """Get a list of Models."""
-        return await service.list(*filters)
+        return await service.list(*labeled_filters)
 
     @post(guards=[requires_active_user])
     async def create(
@@ -63,9 +70,10 @@ class ApiController(Controller):
         return await service.create(data)
 
     @get(DETAIL_ROUTE, guards=[requires_active_user])
-    async def retrieve(self, service: "ProjectService", row_id: "UUID") -> Model:
+    async def retrieve(self, service: "ProjectService", row_id: "UUID") -> Response[Model]:
         """Get Model by ID."""
-        return await service.get(row_id)
+        obj = await service.get(row_id)
+        return Response(obj, headers={"ETag": entity_tag(obj.version)})
 
     @put(DETAIL_ROUTE, guards=[requires_active_user])
     async def update(
@@ -74,10 +82,12 @@ class ApiController(Controller):
         current_user: User,
         service: "ProjectService",
         row_id: "UUID",
-    ) -> Model:
-        """Update an Model."""
+        if_match_version: int | None,
+    ) -> Response[Model]:
+        """Update an Model, only if it is still at the `If-Match` version when one is sent."""
         data.owner_id = current_user.id
-        return await service.update(item_id=row_id, data=data)
+        obj = await service.update(item_id=row_id, data=data, version=if_match_version)
+        return Response(obj, headers={"ETag": entity_tag(obj.version)})
 
     @delete(DETAIL_ROUTE, status_code=HTTP_200_OK, guards=[requires_active_user])
     async def delete(self, service: "ProjectService", row_id: "UUID") -> Model:
@@ -1,14 +1,10 @@
 """User Account Controllers."""
 from __future__ import annotations
 
-import pkgutil
 from typing import TYPE_CHECKING
 
-import app.plugins
 from app.domain.projects.models import ProjectService
-from app.lib import log
-from app.lib.plugin import ProjectPlugin
-from app.lib.settings import plugin
+from app.lib import constants, log
 
 __all__ = ["provides_service"]
 
@@ -23,27 +19,20 @@ def log_info(message: str) -> None:
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
 
+    from litestar.datastructures import State
     from sqlalchemy.ext.asyncio import AsyncSession
 
+    from app.lib.plugin import PluginRegistry
+
 
 async def provides_service(
     db_session: AsyncSession,
+    state: State,
 ) -> AsyncGenerator[ProjectService, None]:
-    plugins = []
-    for _, name, _ in pkgutil.iter_modules([app.plugins.__path__[0]]):
-        log_info(f"checking plugin {name}")
-        if name not in plugin.ENABLED:
-            log_info(f"skipped {name} plugin in sprintlog")
-            continue
-        module = __import__(f"{app.plugins.__name__}.{name}", fromlist=["*"])
-        log_info(f"module name: {module}")
-        for obj_name in dir(module):
-            obj = getattr(module, obj_name)
-            if isinstance(obj, type) and issubclass(obj, ProjectPlugin) and obj is not ProjectPlugin:
-                plugins.append(obj())
     """Construct repository and ProjectService objects for the request."""
+    registry: PluginRegistry = state[constants.PLUGIN_REGISTRY_STATE_KEY]
     async with ProjectService.new(session=db_session) as service:
-        service.plugins = set(plugins)
+        service.plugins = registry.project
         try:
             yield service
         finally:
@@ -1,19 +1,22 @@
 from collections.abc import Iterable
+from copy import deepcopy
 from datetime import UTC, date, datetime
 from typing import Annotated, Any
 from uuid import UUID
 
 from litestar.contrib.sqlalchemy.dto import SQLAlchemyDTO
-from litestar.contrib.sqlalchemy.repository import SQLAlchemyAsyncRepository
 from litestar.dto import DTOConfig, Mark, dto_field
-from sqlalchemy import ARRAY, ForeignKey, String
+from sqlalchemy import ARRAY, ForeignKey, Index, String, update
 from sqlalchemy.orm import InstrumentedAttribute, Mapped, relationship
 from sqlalchemy.orm import mapped_column as m_col
 
 from app.domain.accounts.models import User
-from app.lib import log
+from app.domain.system.models import PluginEntity, PluginEvent, PluginEventType
+from app.domain.system.services import PluginEventService
+from app.lib import cache, log
 from app.lib.db import orm
-from app.lib.plugin import ProjectPlugin
+from app.lib.plugin import ProjectPlugin, gather_hooks
+from app.lib.repository import SQLAlchemyAsyncRepository
 from app.lib.service import SQLAlchemyAsyncRepositoryService
 
 __all__ = [
@@ -47,7 +50,11 @@ class Project(orm.TimestampedDatabaseModel):
     plugin_meta: Mapped[dict | None] = m_col(
         default=lambda: dict,
         info=dto_field(Mark.READ_ONLY),
-    )  # Relationships
+    )
+    version: Mapped[int] = m_col(server_default="1", info=dto_field(Mark.READ_ONLY))
+    """Row version, bumped by every update; the `ETag` of the project."""
+    __mapper_args__ = {"version_id_col": version}
+    # Relationships
     owner_id: Mapped[UUID | None] = m_col(ForeignKey(User.id), nullable=True)
     owner: Mapped["User"] = relationship(
         "User",
@@ -60,13 +67,28 @@ class Project(orm.TimestampedDatabaseModel):
         super().__init__(**kw)
 
 
+Index("ix_project_labels", Project.labels, postgresql_using="gin")
+
+
 class Repository(SQLAlchemyAsyncRepository[Project]):
     model_type = Project
 
+    async def patch_plugin_meta(self, item_id: UUID, old: dict | None, new: dict | None) -> None:
+        """Write the `plugin_meta` keys changed from `old` to `new` in one UPDATE.
+
+        `updated_at` and the other columns are left untouched; `version` is
+        bumped, as the `ETag` covers `plugin_meta` too.
+        """
+        await self.session.execute(
+            update(Project)
+            .where(Project.id == item_id)
+            .values(plugin_meta=orm.jsonb_patch(Project.plugin_meta, old, new), version=Project.version + 1),
+        )
+
 
 class ProjectService(SQLAlchemyAsyncRepositoryService[Project]):
     repository_type = Repository
-    plugins: set[ProjectPlugin] = set()
+    plugins: tuple[ProjectPlugin, ...] = ()
 
     def __init__(self, **repo_kwargs: Any) -> None:
         self.repository: Repository = self.repository_type(**repo_kwargs)
@@ -86,9 +108,9 @@ class ProjectService(SQLAlchemyAsyncRepositoryService[Project]):
 
         obj: Project = await super().create(data)
 
-        # Call the after_create hook for each registered plugin
-        for plugin in self.plugins:
-            await plugin.after_create(data=obj)
+        # after_create hooks are delivered from the plugin outbox
+        self._record_plugin_event(PluginEventType.create, obj.id)
+        self._invalidate_cache(obj)
 
         return obj
 
@@ -102,25 +124,54 @@ class ProjectService(SQLAlchemyAsyncRepositoryService[Project]):
         auto_expunge: bool | None = None,
         auto_refresh: bool | None = None,
         id_attribute: str | InstrumentedAttribute | None = None,
+        version: int | None = None,
     ) -> Project:
-        # Call the before_update hook for each registered plugin
-        old_data = await self.repository.get(item_id)
+        """Update a project, only if it is still at `version` when one is given."""
         data = await super().to_model(data, "update")
+        if item_id is not None:
+            data = self.repository.set_id_attribute_value(item_id, data)
+        obj, old_data = await self.repository.update_versioned(data, version)
 
-        for plugin in self.plugins:
-            data = await plugin.before_update(
-                item_id=item_id,
-                data=data,
-                old_data=old_data,
-            )
+        # before_update and after_update hooks are delivered from the plugin outbox
+        self._record_plugin_event(PluginEventType.update, obj.id, old_data=old_data)
+        self._invalidate_cache(obj, old_data["slug"])
 
-        obj = await super().update(item_id=item_id, data=data)
+        return obj
 
-        # Call the after_update hook for each registered plugin
-        for plugin in self.plugins:
-            await plugin.after_update(data=obj)
+    def _invalidate_cache(self, obj: Project, *old_slugs: str) -> None:
+        """Drop cached project lists and the responses of `obj` once the session commits."""
+        tags = {cache.project_tag(slug) for slug in (obj.slug, *old_slugs)}
+        cache.invalidate_tags(self.repository.session, cache.PROJECTS_TAG, *tags)
 
-        return obj
+    def _record_plugin_event(
+        self,
+        event: PluginEventType,
+        item_id: UUID,
+        old_data: dict | None = None,
+    ) -> None:
+        if not self.plugins:
+            return
+        payload = {"old_data": old_data} if old_data is not None else None
+        PluginEventService(session=self.repository.session).record(PluginEntity.project, event, item_id, payload)
+
+    async def deliver_plugin_event(self, event: PluginEvent) -> None:
+        """Run the plugin hooks for an outbox event and store the resulting `plugin_meta`."""
+        obj = await self.repository.get_one_or_none(id=event.item_id)
+        if obj is None:
+            return
+        self.repository.session.expunge(obj)
+        plugin_meta = deepcopy(obj.plugin_meta)
+        match event.event:
+            case PluginEventType.create:
+                await gather_hooks(self.plugins, "after_create", data=obj)
+            case PluginEventType.update:
+                old_data = event.old_data
+                for plugin in self.plugins:
+                    obj = await plugin.before_update(item_id=obj.id, data=obj, old_data=old_data)
+                await gather_hooks(self.plugins, "after_update", data=obj)
+        if obj.plugin_meta != plugin_meta:
+            await self.repository.patch_plugin_meta(obj.id, plugin_meta, obj.plugin_meta)
+            self._invalidate_cache(obj)
 
     async def delete(
         self,
@@ -134,10 +185,11 @@ class ProjectService(SQLAlchemyAsyncRepositoryService[Project]):
             await plugin.before_delete(item_id=item_id)
 
         obj: Project = await super().delete(item_id=item_id)
+        self._invalidate_cache(obj)
 
-        # Call the after_delete hook for each registered plugin
-        for plugin in self.plugins:
-            await plugin.after_delete(data=obj)
+        # Run the after_delete hook of every registered plugin concurrently,
+        # the row is already gone so a failing plugin must not fail the request
+        await gather_hooks(self.plugins, "after_delete", suppress_errors=True, data=obj)
 
         return obj
 
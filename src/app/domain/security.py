@@ -2,20 +2,37 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from litestar.contrib.jwt import OAuth2PasswordBearerAuth, Token
+from litestar.contrib.jwt import OAuth2Login, OAuth2PasswordBearerAuth, Token
 from sqlalchemy import select
 from sqlalchemy.orm import joinedload, noload, selectinload
 
 from app.domain import urls
+from app.domain.accounts import cache
 from app.domain.accounts.models import User
 from app.domain.accounts.services import UserService
+from app.domain.teams import claims
 from app.domain.teams.models import TeamMember
 from app.lib import constants, db, settings
 
 if TYPE_CHECKING:
+    from litestar import Response
     from litestar.connection import ASGIConnection, Request
 
-__all__ = ["current_user_from_token", "auth"]
+__all__ = ["current_user_from_token", "auth", "login"]
+
+USER_WITH_TEAMS = (
+    select(User)
+    .options(
+        noload("*"),
+        selectinload(User.teams).options(
+            joinedload(TeamMember.team, innerjoin=True).options(
+                noload("*"),
+            ),
+        ),
+    )
+    .execution_options(populate_existing=True)
+)
+"""User lookup that also loads the team memberships."""
 
 
 async def provide_user(request: Request[User, Token, Any]) -> User:
@@ -33,7 +50,8 @@ async def provide_user(request: Request[User, Token, Any]) -> User:
 async def current_user_from_token(token: Token, connection: ASGIConnection[Any, Any, Any, Any]) -> User | None:
     """Lookup current user from local JWT token.
 
-    Fetches the user information from the database
+    Serves the user and its team memberships from the user snapshot cache
+    and only falls back to the database on a miss.
 
 
     Args:
@@ -45,21 +63,34 @@ async def current_user_from_token(token: Token, connection: ASGIConnection[Any,
         User: User record mapped to the JWT identifier
     """
 
+    user = await cache.get_user(token.sub)
+    if user is None:
+        user = await _fetch_user(token, connection)
+    if user is None or not user.is_active:
+        return None
+    claims.drop_stale_team_claims(token, user)
+    return user
+
+
+async def _fetch_user(token: Token, connection: ASGIConnection[Any, Any, Any, Any]) -> User | None:
     async with UserService.new(
         session=db.config.provide_session(connection.app.state, connection.scope),
-        statement=select(User).options(
-            noload("*"),
-            selectinload(User.teams).options(
-                joinedload(TeamMember.team, innerjoin=True).options(
-                    noload("*"),
-                ),
-            ),
-        ),
+        statement=USER_WITH_TEAMS,
     ) as service:
         user = await service.get_one_or_none(email=token.sub)
-        if user and user.is_active:
-            return user
-    return None
+    if user is not None:
+        await cache.set_user(user)
+    return user
+
+
+def login(user: User) -> Response[OAuth2Login]:
+    """Issue an access token for `user`.
+
+    With `APP_JWT_TEAM_CLAIMS` enabled the token carries the team roles of
+    `user`, whose memberships must be loaded.
+    """
+    token_extras = claims.team_claims(user) if settings.app.JWT_TEAM_CLAIMS else None
+    return auth.login(user.email, token_extras=token_extras)
 
 
 auth = OAuth2PasswordBearerAuth[User](
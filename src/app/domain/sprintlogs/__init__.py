@@ -1,4 +1,4 @@
 """User Account domain logic."""
-from . import controllers, dependencies, models
+from . import controllers, dependencies, models, schemas
 
-__all__ = ["models", "controllers", "dependencies"]
+__all__ = ["models", "controllers", "dependencies", "schemas"]
@@ -2,32 +2,38 @@
 from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, cast
 
-from litestar import Controller, delete, get, post, put
+from litestar import Controller, Response, delete, get, post, put
 from litestar.di import Provide
 from litestar.exceptions import HTTPException
-from litestar.params import Dependency
+from litestar.params import Dependency, Parameter
 from litestar.status_codes import HTTP_200_OK
 
 from app.domain.accounts.guards import requires_active_user
 from app.domain.accounts.models import User
 from app.domain.sprintlogs.dependencies import provides_service
 from app.domain.sprintlogs.models import (
+    BulkUpdateDTO,
     ItemType,
-    Priority,
     Progress,
     ReadDTO,
     SprintlogService,
     Status,
     WriteDTO,
+    project_type_filter,
 )
 from app.domain.sprintlogs.models import SprintLog as Model
-from app.lib import log
+from app.domain.sprintlogs.schemas import BoardSummary, SearchHit
+from app.lib import cache, constants, log
+from app.utils import entity_tag
 
 if TYPE_CHECKING:
     from uuid import UUID
 
     from advanced_alchemy.filters import FilterTypes, LimitOffset
-from litestar.pagination import OffsetPagination
+    from litestar import Request
+
+    from app.lib.pagination import KeysetPagination
+from litestar.pagination import CursorPagination, OffsetPagination
 
 __all__ = [
     "ApiController",
@@ -44,6 +50,16 @@ def log_info(message: str) -> None:
 validation_skip: Any = Dependency(skip_validation=True)
 
 
+def board_cache_key_builder(request: "Request") -> str:
+    project_slug = request.path_params["project_slug"]
+    return cache.tagged_key(cache.project_cache_key("sprintlog-board", project_slug), cache.project_tag(project_slug))
+
+
+project_type_cache_key_builder = cache.tagged_key_builder(
+    lambda request: cache.project_tag(request.path_params["project_type"].rpartition("_")[0]),
+)
+
+
 class ApiController(Controller):
     dto = WriteDTO
     return_dto = ReadDTO
@@ -53,14 +69,24 @@ class ApiController(Controller):
     detail_route = "/detail/{row_id:uuid}"
     project_route = "/project/{project_type:str}"
     slug_route = "{slug:str}"
+    bulk_route = "/bulk"
 
     @get(guards=[requires_active_user])
     async def filter(
         self,
         service: "SprintlogService",
-        filters: list["FilterTypes"] = validation_skip,
+        labeled_filters: list["FilterTypes"] = validation_skip,
     ) -> Sequence[Model]:
-        return await service.list(*filters)
+        return await service.list(*labeled_filters)
+
+    @get("/cursor", guards=[requires_active_user])
+    async def filter_by_cursor(
+        self,
+        service: "SprintlogService",
+        keyset: "KeysetPagination",
+        labeled_filters: list["FilterTypes"] = validation_skip,
+    ) -> "CursorPagination[str, Model]":
+        return await service.list_keyset(keyset, *labeled_filters)
 
     @post(guards=[requires_active_user])
     async def create(
@@ -75,9 +101,48 @@ class ApiController(Controller):
             data.assignee_id = current_user.id
         return await service.create(data)
 
+    @post(bulk_route, guards=[requires_active_user])
+    async def create_many(
+        self,
+        data: list[Model],
+        current_user: User,
+        service: "SprintlogService",
+    ) -> Sequence[Model]:
+        for item in data:
+            if not item.owner_id:
+                item.owner_id = current_user.id
+            if not item.assignee_id:
+                item.assignee_id = current_user.id
+        return await service.create_many(data)
+
+    @put(bulk_route, guards=[requires_active_user], dto=BulkUpdateDTO)
+    async def update_many(
+        self,
+        data: list[Model],
+        current_user: User,
+        service: "SprintlogService",
+    ) -> Sequence[Model]:
+        for item in data:
+            if not item.id:
+                raise HTTPException(status_code=400, detail="Sprintlog.id is required for bulk updates")
+            if not item.owner_id:
+                item.owner_id = current_user.id
+            if not item.assignee_id:
+                item.assignee_id = current_user.id
+        return await service.update_many(data)
+
+    @delete(bulk_route, guards=[requires_active_user], status_code=HTTP_200_OK)
+    async def delete_many(
+        self,
+        service: "SprintlogService",
+        ids: list["UUID"] = Parameter(query="ids"),
+    ) -> Sequence[Model]:
+        return await service.delete_many(ids)
+
     @get(detail_route, guards=[requires_active_user])
-    async def retrieve(self, service: "SprintlogService", row_id: "UUID") -> Model:
-        return await service.get(row_id)
+    async def retrieve(self, service: "SprintlogService", row_id: "UUID") -> Response[Model]:
+        obj = await service.get(row_id)
+        return Response(obj, headers={"ETag": entity_tag(obj.version)})
 
     @put(detail_route, guards=[requires_active_user])
     async def update(
@@ -86,19 +151,25 @@ class ApiController(Controller):
         current_user: User,
         service: "SprintlogService",
         row_id: "UUID",
-    ) -> Model:
-        old_data = await service.get(row_id)
+        if_match_version: int | None,
+    ) -> Response[Model]:
         if not data.owner_id:
             data.owner_id = current_user.id
         if not data.assignee_id:
             data.assignee_id = current_user.id
-        return await service.update(data, row_id, old_data=old_data)
+        obj = await service.update(data, row_id, version=if_match_version)
+        return Response(obj, headers={"ETag": entity_tag(obj.version)})
 
     @delete(detail_route, guards=[requires_active_user], status_code=HTTP_200_OK)
     async def delete(self, service: "SprintlogService", row_id: "UUID") -> Model:
         return await service.delete(row_id)
 
-    @get(project_route, guards=[requires_active_user])
+    @get(
+        project_route,
+        guards=[requires_active_user],
+        cache=constants.LIST_CACHE_EXPIRATION,
+        cache_key_builder=project_type_cache_key_builder,
+    )
     async def filter_by_project_type(
         self,
         service: "SprintlogService",
@@ -107,7 +178,7 @@ class ApiController(Controller):
     ) -> "OffsetPagination[Model]":
         results, total = await service.list_and_count(
             limit_offset,
-            project_type=project_type,
+            project_type_filter(project_type),
         )
         return OffsetPagination(
             items=cast(list, results),
@@ -116,6 +187,48 @@ class ApiController(Controller):
             offset=limit_offset.offset,
         )
 
+    @get(
+        f"{project_route}/cursor",
+        guards=[requires_active_user],
+        cache=constants.LIST_CACHE_EXPIRATION,
+        cache_key_builder=project_type_cache_key_builder,
+    )
+    async def filter_by_project_type_cursor(
+        self,
+        service: "SprintlogService",
+        project_type: str,
+        keyset: "KeysetPagination",
+    ) -> "CursorPagination[str, Model]":
+        return await service.list_keyset(keyset, project_type_filter(project_type))
+
+    @get("/search", guards=[requires_active_user], return_dto=None)
+    async def search(
+        self,
+        service: "SprintlogService",
+        limit_offset: "LimitOffset",
+        q: str = Parameter(min_length=1, max_length=200, description="Web search style query"),
+        project_slug: str | None = None,
+        item_type: ItemType | None = Parameter(query="type", default=None),
+    ) -> "OffsetPagination[SearchHit]":
+        hits, total = await service.search(q, limit_offset, project_slug, item_type)
+        return OffsetPagination(
+            items=hits,
+            total=total,
+            limit=limit_offset.limit,
+            offset=limit_offset.offset,
+        )
+
+    @get(
+        "/board/{project_slug:str}",
+        guards=[requires_active_user],
+        return_dto=None,
+        cache=constants.BOARD_CACHE_EXPIRATION,
+        cache_key_builder=board_cache_key_builder,
+    )
+    async def board(self, service: "SprintlogService", project_slug: str) -> BoardSummary:
+        """Sprint, status and progress totals for a project board."""
+        return await service.board(project_slug)
+
     @get(f"/slug/{slug_route}", guards=[requires_active_user])
     async def retrieve_by_slug(self, service: "SprintlogService", slug: str) -> Model:
         obj: Model | None = await service.repository.get_by_slug(slug)
@@ -132,21 +245,9 @@ class ApiController(Controller):
         slug: str,
         delta: int,
     ) -> Model:
-        obj = await service.repository.get_by_slug(slug)
-        progress_list = list(Progress)
+        obj = await service.shift_progress(slug, delta)
         if obj:
-            current_idx = progress_list.index(obj.progress)
-            next_idx = current_idx + delta
-            if next_idx < 0:
-                next_idx = 0
-            elif next_idx >= len(progress_list):
-                next_idx = len(progress_list) - 1
-            obj.progress = Progress(progress_list[next_idx])
-            if obj.progress != Progress.ready:
-                obj.status = Status.started
-            else:
-                obj.status = Status.checked_in
-            return await service.update(obj, obj.id)
+            return obj
         raise HTTPException(
             status_code=404,
             detail=f"Sprintlog.slug {slug} not available",
@@ -158,38 +259,18 @@ class ApiController(Controller):
         slug: str,
         authorized: bool = False,
     ) -> Model:
-        obj = await service.repository.get_by_slug(slug)
-        progress_list = list(Progress)
+        obj = await service.complete(slug, authorized=authorized)
         if obj:
-            current_idx = progress_list.index(obj.progress)
-            next_idx = 0 if current_idx == len(progress_list) else len(progress_list) - 1
-            obj.progress = Progress(progress_list[next_idx])
-            if obj.status == Status.checked_in:
-                obj.status = Status.completed if authorized else Status.checked_in
-            else:
-                obj.status = Status.checked_in
-            return await service.update(obj, obj.id)
+            return obj
         raise HTTPException(
             status_code=404,
             detail=f"Sprintlog.slug {slug} not available",
         )
 
     async def _circle_progress(self, service: "SprintlogService", slug: str) -> Model:
-        obj = await service.repository.get_by_slug(slug)
-        progress_list = list(Progress)
+        obj = await service.shift_progress(slug, 1, wrap=True)
         if obj:
-            current_idx = progress_list.index(obj.progress)
-            next_idx = current_idx + 1
-            if next_idx < 0:
-                next_idx = len(progress_list)
-            elif next_idx >= len(progress_list):
-                next_idx = 0
-            obj.progress = Progress(progress_list[next_idx])
-            if obj.progress != Progress.ready:
-                obj.status = Status.started
-            else:
-                obj.status = Status.checked_in
-            return await service.update(obj, obj.id)
+            return obj
         raise HTTPException(
             status_code=404,
             detail=f"Sprintlog.slug {slug} not available",
@@ -251,17 +332,9 @@ class ApiController(Controller):
         slug: str,
         delta: int,
     ) -> Model:
-        obj = await service.repository.get_by_slug(slug)
-        priority_list = list(Priority)
+        obj = await service.shift_priority(slug, delta)
         if obj:
-            current_idx = priority_list.index(obj.priority)
-            next_idx = current_idx + delta
-            if next_idx < 0:
-                next_idx = 0
-            elif next_idx >= len(priority_list):
-                next_idx = len(priority_list) - 1
-            obj.priority = Priority(priority_list[next_idx])
-            return await service.update(obj, obj.id)
+            return obj
         raise HTTPException(
             status_code=404,
             detail=f"Sprintlog.slug {slug} not available",
@@ -273,17 +346,9 @@ class ApiController(Controller):
         slug: str,
         delta: int,
     ) -> Model:
-        obj = await service.repository.get_by_slug(slug)
-        priority_list = list(Priority)
+        obj = await service.shift_priority(slug, 1, wrap=True)
         if obj:
-            current_idx = priority_list.index(obj.priority)
-            next_idx = current_idx + 1
-            if next_idx < 0:
-                next_idx = len(priority_list)
-            elif next_idx >= len(priority_list):
-                next_idx = 0
-            obj.priority = Priority(priority_list[next_idx])
-            return await service.update(obj, obj.id)
+            return obj
         raise HTTPException(
             status_code=404,
             detail=f"Sprintlog.slug {slug} not available",
@@ -299,17 +364,9 @@ class ApiController(Controller):
         slug: str,
         delta: int,
     ) -> Model:
-        obj = await service.repository.get_by_slug(slug)
-        status_list = list(Status)
+        obj = await service.shift_status(slug, delta)
         if obj:
-            current_idx = status_list.index(obj.status)
-            next_idx = current_idx + delta
-            if next_idx < 0:
-                next_idx = 0
-            elif next_idx >= len(status_list):
-                next_idx = len(status_list) - 1
-            obj.status = Status(status_list[next_idx])
-            return await service.update(obj, obj.id)
+            return obj
         raise HTTPException(
             status_code=404,
             detail=f"Sprintlog.slug {slug} not available",
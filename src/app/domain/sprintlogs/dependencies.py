@@ -1,17 +1,13 @@
 """User Account Controllers."""
 from __future__ import annotations
 
-import pkgutil
 from typing import TYPE_CHECKING
 
 from sqlalchemy import select
 from sqlalchemy.orm import joinedload
 
-import app.plugins
 from app.domain.sprintlogs.models import SprintLog, SprintlogService
-from app.lib import log
-from app.lib.plugin import SprintlogPlugin
-from app.lib.settings import plugin
+from app.lib import constants, log
 
 __all__ = ["provides_service"]
 
@@ -26,26 +22,24 @@ def log_info(message: str) -> None:
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
 
+    from litestar.datastructures import State
     from sqlalchemy.ext.asyncio import AsyncSession
 
+    from app.lib.plugin import PluginRegistry
+
 
 async def provides_service(
     db_session: AsyncSession,
+    state: State,
 ) -> AsyncGenerator[SprintlogService, None]:
-    plugins = []
-    for _, name, _ in pkgutil.iter_modules([app.plugins.__path__[0]]):
-        if name not in plugin.ENABLED:
-            continue
-        module = __import__(f"{app.plugins.__name__}.{name}", fromlist=["*"])
-        for obj_name in dir(module):
-            obj = getattr(module, obj_name)
-            if isinstance(obj, type) and issubclass(obj, SprintlogPlugin) and obj is not SprintlogPlugin:
-                plugins.append(obj())
+    registry: PluginRegistry = state[constants.PLUGIN_REGISTRY_STATE_KEY]
     async with SprintlogService.new(
         session=db_session,
-        statement=select(SprintLog).order_by(SprintLog.updated_at.desc()).options(joinedload(SprintLog.project)),
+        statement=select(SprintLog)
+        .order_by(SprintLog.updated_at.desc(), SprintLog.id.desc())
+        .options(joinedload(SprintLog.project)),
     ) as service:
-        service.plugins = set(plugins)
+        service.plugins = registry.sprintlog
         try:
             yield service
         finally:
@@ -1,31 +1,71 @@
+import asyncio
 import secrets
-from collections.abc import Iterable
+from collections.abc import Generator, Iterable, Sequence
+from copy import deepcopy
+from dataclasses import replace
 from datetime import UTC, date, datetime, timedelta
 from enum import StrEnum
 from typing import Annotated, Any, cast
 from uuid import UUID
 
+from advanced_alchemy.filters import CollectionFilter, LimitOffset
 from litestar.contrib.sqlalchemy.dto import SQLAlchemyDTO
-from litestar.dto import DTOConfig, Mark, dto_field
-from sqlalchemy import ARRAY, ForeignKey, SQLColumnExpression, String
+from litestar.dto import DTOConfig, DTOField, Mark, dto_field
+from litestar.dto.data_structures import DTOFieldDefinition
+from sqlalchemy import (
+    ARRAY,
+    DDL,
+    ColumnElement,
+    Computed,
+    ForeignKey,
+    Index,
+    SQLColumnExpression,
+    String,
+    and_,
+    case,
+    event,
+    false,
+    func,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.ext.associationproxy import AssociationProxy, association_proxy
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.orm import InstrumentedAttribute, Mapped, relationship
+from sqlalchemy.orm import InstrumentedAttribute, Mapped, aliased, relationship
 from sqlalchemy.orm import mapped_column as m_col
 
 from app.domain.accounts.models import User
+from app.domain.analytics.models import SprintlogDeletion
 from app.domain.projects.models import Project
-from app.lib.db import orm
-from app.lib.plugin import SprintlogPlugin
+from app.domain.sprintlogs.schemas import (
+    BoardSummary,
+    BoardTotals,
+    ProgressTotals,
+    SearchHit,
+    SprintTotals,
+    StatusTotals,
+)
+from app.domain.system.models import PluginEntity, PluginEvent, PluginEventType
+from app.domain.system.services import PluginEventService
+from app.lib import cache, serialization
+from app.lib.db import orm, write_behind
+from app.lib.exceptions import PreconditionFailedError
+from app.lib.plugin import SprintlogPlugin, gather_hooks
 from app.lib.repository import SQLAlchemyAsyncSlugRepository
 from app.lib.service import SQLAlchemyAsyncRepositoryService
 
 __all__ = [
+    "Audit",
+    "BulkUpdateDTO",
     "SprintLog",
     "ReadDTO",
     "Repository",
     "SprintlogService",
     "WriteDTO",
+    "audit_diff",
+    "project_type_filter",
 ]
 
 
@@ -77,6 +117,19 @@ class ItemType(StrEnum):
     self = "self"
 
 
+SEARCH_CONFIG = "english"
+"""Text search configuration used for the sprintlog search vector and queries."""
+LABELS_TEXT_FUNCTION = DDL(
+    "CREATE OR REPLACE FUNCTION sprint_log_labels_text(labels text[]) RETURNS text "
+    "LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$ SELECT array_to_string(labels, ' ') $$",
+)
+"""Labels as one text to parse with `SEARCH_CONFIG`.
+
+`array_to_string` is only stable, which a generated column does not
+accept; joining text elements does not depend on any setting.
+"""
+
+
 class SprintLog(orm.TimestampedDatabaseModel):
     title: Mapped[str] = m_col(String(length=200), index=True)
     description: Mapped[str | None]
@@ -119,11 +172,26 @@ class SprintLog(orm.TimestampedDatabaseModel):
     end_date: Mapped[date] = m_col(default=datetime.now(tz=UTC).date)
     due_date: Mapped[date] = m_col(default=datetime.now(tz=UTC).date)
     labels: Mapped[list[str]] = m_col(ARRAY(String), nullable=True)
+    search_vector: Mapped[str] = m_col(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(sprint_log_labels_text(labels), '')), 'C')",
+            persisted=True,
+        ),
+        deferred=True,
+        info=dto_field(Mark.PRIVATE),
+    )
     plugin_meta: Mapped[dict | None] = m_col(
         default=lambda: dict,
         info=dto_field(Mark.READ_ONLY),
         nullable=True,
-    )  # Relationships
+    )
+    version: Mapped[int] = m_col(server_default="1", info=dto_field(Mark.READ_ONLY))
+    """Row version, bumped by every update; the `ETag` of the item."""
+    __mapper_args__ = {"version_id_col": version}
+    # Relationships
     assignee_id: Mapped[UUID | None] = m_col(ForeignKey(User.id))
     owner_id: Mapped[UUID | None] = m_col(ForeignKey(User.id))
     project_slug: Mapped[str] = m_col(ForeignKey(Project.slug), nullable=True)
@@ -150,6 +218,7 @@ class SprintLog(orm.TimestampedDatabaseModel):
     audits: Mapped[list["Audit"]] = relationship(
         "Audit",
         lazy="noload",
+        passive_deletes=True,
         info=dto_field(Mark.READ_ONLY),
     )
     project_name: AssociationProxy[str] = association_proxy(
@@ -188,38 +257,284 @@ class SprintLog(orm.TimestampedDatabaseModel):
 SprintLog.registry.update_type_annotation_map(
     {Category: String, Priority: String, Progress: String, ItemType: String},
 )
+Index(
+    "ix_sprint_log_project_slug_type_updated_at",
+    SprintLog.project_slug,
+    SprintLog.type,
+    SprintLog.updated_at.desc(),
+)
+event.listen(SprintLog.__table__, "before_create", LABELS_TEXT_FUNCTION)
+Index("ix_sprint_log_search_vector", SprintLog.search_vector, postgresql_using="gin")
+Index("ix_sprint_log_labels", SprintLog.labels, postgresql_using="gin")
+Index(
+    "ix_sprint_log_project_slug_sprint_number",
+    SprintLog.project_slug,
+    SprintLog.sprint_number,
+    postgresql_include=["status", "progress", "points", "est_days"],
+)
+
+
+def project_type_filter(project_type: str) -> ColumnElement[bool]:
+    """Index friendly equivalent of `SprintLog.project_type == project_type`.
+
+    Item types never contain an underscore, so the value splits on its last
+    one into the project slug and the type.
+    """
+    project_slug, sep, item_type = project_type.rpartition("_")
+    if not sep:
+        return false()
+    return and_(SprintLog.project_slug == project_slug, SprintLog.type == item_type)
 
 
 class Audit(orm.TimestampedDatabaseModel):
-    backlog_id: Mapped[UUID] = m_col(ForeignKey(SprintLog.id))
+    backlog_id: Mapped[UUID] = m_col(ForeignKey(SprintLog.id, ondelete="CASCADE"), index=True)
     field_name: Mapped[str]
     old_value: Mapped[str]
     new_value: Mapped[str]
 
 
+Index("ix_audit_created_at", Audit.created_at)
+Index("ix_sprint_log_updated_at", SprintLog.updated_at)
+
+AUDIT_IGNORED_FIELDS = frozenset({"id", "created_at", "updated_at", "plugin_meta", "version"})
+
+
+def _audit_value(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, list | dict):
+        return serialization.to_json(value).decode()
+    return str(value)
+
+
+def audit_diff(item_id: UUID, old_data: dict[str, Any], new_data: dict[str, Any]) -> list[dict[str, Any]]:
+    """`Audit` rows for the fields that changed between two `to_dict()` snapshots."""
+    return [
+        {
+            "backlog_id": item_id,
+            "field_name": field_name,
+            "old_value": _audit_value(old_value),
+            "new_value": _audit_value(new_data[field_name]),
+        }
+        for field_name, old_value in old_data.items()
+        if field_name not in AUDIT_IGNORED_FIELDS
+        and field_name in new_data
+        and _audit_value(old_value) != _audit_value(new_data[field_name])
+    ]
+
+
 WriteDTO = SQLAlchemyDTO[Annotated[SprintLog, DTOConfig(exclude={"id", "created_at", "updated_at"},max_nested_depth=2)]]
 ReadDTO = SQLAlchemyDTO[Annotated[SprintLog, DTOConfig(exclude={ "audits"},max_nested_depth=2)]]
 
 
+class BulkUpdateDTO(
+    SQLAlchemyDTO[Annotated[SprintLog, DTOConfig(exclude={"created_at", "updated_at"}, max_nested_depth=2)]],
+):
+    """Bulk update body.
+
+    Each item may carry the `version` it was read at, which single updates
+    take from `If-Match` instead.
+    """
+
+    @classmethod
+    def generate_field_definitions(cls, model_type: type[SprintLog]) -> Generator[DTOFieldDefinition, None, None]:
+        for field_definition in super().generate_field_definitions(model_type):
+            if field_definition.name == "version":
+                yield replace(field_definition, dto_field=DTOField(), default=None)
+            else:
+                yield field_definition
+
+
+def _shift(
+    column: InstrumentedAttribute[Any],
+    members: list[Any],
+    offset: int,
+    wrap: bool = False,
+) -> ColumnElement[Any]:
+    """CASE expression moving `column` `offset` steps along `members`.
+
+    Steps past either end stop at the first / last member, or wrap around
+    when `wrap` is set.
+    """
+    last = len(members) - 1
+    targets = {
+        member: members[(idx + offset) % len(members) if wrap else min(max(idx + offset, 0), last)]
+        for idx, member in enumerate(members)
+    }
+    return case(targets, value=column, else_=column)
+
+
+def _new_sprintlog_slug(sprintlog: SprintLog) -> str:
+    return f"{sprintlog.project_slug}-S{sprintlog.sprint_number}-{secrets.token_hex(2)}"
+
+
 class Repository(SQLAlchemyAsyncSlugRepository[SprintLog]):
     model_type = SprintLog
 
     async def get_available_sprintlog_slug(self, sprintlog: SprintLog) -> str | None:
-        project_slug: str  = sprintlog.project_slug
         if not sprintlog.slug:
-            token = secrets.token_hex(2)
-            slug = f"{project_slug}-S{sprintlog.sprint_number}-{token}"
+            slug = _new_sprintlog_slug(sprintlog)
             if await self._is_slug_unique(slug):
                 return slug
         return sprintlog.slug
 
+    async def allocate_sprintlog_slugs(self, sprintlogs: Sequence[SprintLog]) -> None:
+        """Give every sprintlog without a slug a unique one.
+
+        Candidates for the whole batch are checked with a single query, and
+        only the ones that collide are drawn again.
+        """
+        taken = {sprintlog.slug for sprintlog in sprintlogs if sprintlog.slug}
+        pending = [sprintlog for sprintlog in sprintlogs if not sprintlog.slug]
+        while pending:
+            for sprintlog in pending:
+                sprintlog.slug = _new_sprintlog_slug(sprintlog)
+            existing = await self.session.scalars(
+                select(SprintLog.slug).where(SprintLog.slug.in_([sprintlog.slug for sprintlog in pending])),
+            )
+            taken.update(existing)
+            retry = []
+            for sprintlog in pending:
+                if sprintlog.slug in taken:
+                    retry.append(sprintlog)
+                else:
+                    taken.add(sprintlog.slug)
+            pending = retry
+
+    async def search(
+        self,
+        query: str,
+        *filters: ColumnElement[bool],
+        limit: int,
+        offset: int,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Rank sprintlogs matching a web search style `query`.
+
+        Matches are ranked from the GIN indexed `search_vector`; highlights
+        are only built for the rows on the requested page.
+        """
+        tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+        rank = func.ts_rank_cd(SprintLog.search_vector, tsquery)
+        page = (
+            select(SprintLog.id, rank.label("rank"), func.count().over().label("total"))
+            .where(SprintLog.search_vector.op("@@")(tsquery), *filters)
+            .order_by(rank.desc(), SprintLog.updated_at.desc(), SprintLog.id.desc())
+            .limit(limit)
+            .offset(offset)
+            .subquery()
+        )
+        statement = (
+            select(
+                SprintLog.id,
+                SprintLog.slug,
+                SprintLog.title,
+                SprintLog.project_slug,
+                SprintLog.type,
+                SprintLog.status,
+                SprintLog.progress,
+                SprintLog.priority,
+                page.c.rank,
+                func.ts_headline(SEARCH_CONFIG, SprintLog.title, tsquery, "HighlightAll=true").label(
+                    "title_highlight",
+                ),
+                func.ts_headline(
+                    SEARCH_CONFIG,
+                    func.coalesce(SprintLog.description, ""),
+                    tsquery,
+                    "MaxFragments=2, MinWords=5, MaxWords=20",
+                ).label("snippet"),
+                page.c.total,
+            )
+            .join(page, SprintLog.id == page.c.id)
+            .order_by(page.c.rank.desc(), SprintLog.updated_at.desc(), SprintLog.id.desc())
+        )
+        rows = (await self.session.execute(statement)).mappings().all()
+        total = rows[0]["total"] if rows else 0
+        return [{key: value for key, value in row.items() if key != "total"} for row in rows], total
+
+    async def board_totals(self, project_slug: str) -> list[dict[str, Any]]:
+        """Per sprint, per status, per progress and overall totals of a project.
+
+        One GROUP BY over grouping sets; `grouping` tells which set a row
+        belongs to.  Covered by `ix_sprint_log_project_slug_sprint_number`.
+        """
+        group = func.grouping(SprintLog.sprint_number, SprintLog.status, SprintLog.progress)
+        statement = (
+            select(
+                group.label("grouping"),
+                SprintLog.sprint_number,
+                SprintLog.status,
+                SprintLog.progress,
+                func.count().label("count"),
+                func.coalesce(func.sum(SprintLog.points), 0).label("points"),
+                func.coalesce(func.sum(SprintLog.est_days), 0).label("est_days"),
+            )
+            .where(SprintLog.project_slug == project_slug)
+            .group_by(
+                func.grouping_sets(
+                    tuple_(SprintLog.sprint_number),
+                    tuple_(SprintLog.status),
+                    tuple_(SprintLog.progress),
+                    tuple_(),
+                ),
+            )
+        )
+        return [dict(row) for row in (await self.session.execute(statement)).mappings()]
+
     async def _get_due_date(self, beg_date: date, est_days: float = 3.0) -> date:
         return beg_date + timedelta(days=est_days)
 
+    async def transition(self, slug: str, **values: Any) -> tuple[SprintLog, dict[str, Any]] | None:
+        """Apply a state transition in a single round trip.
+
+        The new values are SQL expressions of the row's current state, so the
+        update is atomic: the row is locked first, concurrent transitions of
+        the same row queue on the lock and each one sees the result of the
+        previous one.  The updated row is selected back together with its
+        joined relationships and the values it had before.
+
+        Returns:
+            The updated item and its previous values of the `values` keys, or
+            `None` when no item has the slug.
+        """
+        before = (
+            select(SprintLog.id, *(getattr(SprintLog, name) for name in values))
+            .where(SprintLog.slug == slug)
+            .with_for_update()
+            .cte("before")
+        )
+        moved = (
+            update(SprintLog)
+            .where(SprintLog.id == before.c.id)
+            .values(updated_at=datetime.now(UTC), version=SprintLog.version + 1, **values)
+            .returning(*SprintLog.__table__.columns, *(before.c[name].label(f"old_{name}") for name in values))
+            .cte("moved")
+        )
+        statement = select(aliased(SprintLog, moved), *(moved.c[f"old_{name}"] for name in values))
+        row = (await self.session.execute(statement.execution_options(populate_existing=True))).unique().one_or_none()
+        if row is None:
+            return None
+        obj, *old_values = row
+        return obj, dict(zip(values, old_values, strict=True))
+
+    async def patch_plugin_meta(self, item_id: UUID, old: dict | None, new: dict | None) -> None:
+        """Write the `plugin_meta` keys changed from `old` to `new` in one UPDATE.
+
+        `updated_at` and the other columns are left untouched; `version` is
+        bumped, as the `ETag` covers `plugin_meta` too.
+        """
+        await self.session.execute(
+            update(SprintLog)
+            .where(SprintLog.id == item_id)
+            .values(plugin_meta=orm.jsonb_patch(SprintLog.plugin_meta, old, new), version=SprintLog.version + 1),
+        )
+
 
 class SprintlogService(SQLAlchemyAsyncRepositoryService[SprintLog]):
     repository_type = Repository
-    plugins: set[SprintlogPlugin] = set()
+    plugins: tuple[SprintlogPlugin, ...] = ()
 
     def __init__(self, **repo_kwargs: Any) -> None:
         self.repository: Repository = self.repository_type(**repo_kwargs)
@@ -254,13 +569,72 @@ class SprintlogService(SQLAlchemyAsyncRepositoryService[SprintLog]):
             data.plugin_meta = {}
 
         obj = await super().create(data)
-        # Call the after_create hook for each
-        for plugin in self.plugins:
-            after = await plugin.after_create(data=obj)
-            obj = await super().update(item_id=obj.id, data=after)
+        # after_create hooks are delivered from the plugin outbox
+        self._record_plugin_event(PluginEventType.create, obj.id)
+        self._invalidate_cache(obj.project_slug)
 
         return obj
 
+    async def create_many(
+        self,
+        data: list[SprintLog | dict[str, Any]] | list[SprintLog],
+        auto_commit: bool | None = None,
+        auto_expunge: bool | None = None,
+    ) -> Sequence[SprintLog]:
+        """Create a batch of sprintlogs with one multi-row INSERT."""
+        items = [await self.to_model(datum, "create_many") for datum in data]
+        await self.repository.allocate_sprintlog_slugs(items)
+        for plugin in self.plugins:
+            items = [await plugin.before_create(data=item) for item in items]
+        if len(self.plugins) == 0:
+            for item in items:
+                item.plugin_meta = {}
+
+        objs = await self.repository.add_many(items)
+        for obj in objs:
+            self._record_plugin_event(PluginEventType.create, obj.id)
+        self._invalidate_cache(*(obj.project_slug for obj in objs))
+        return await self._reload(obj.id for obj in objs)
+
+    async def update_many(
+        self,
+        data: list[SprintLog | dict[str, Any]] | list[SprintLog],
+        auto_commit: bool | None = None,
+        auto_expunge: bool | None = None,
+    ) -> Sequence[SprintLog]:
+        """Update a batch of sprintlogs with one executemany UPDATE by primary key.
+
+        Only the attributes set on each item are written; each row is matched
+        on the `version` sent with the item or, without one, on the version
+        it was loaded with.  The UPDATE bumps it.
+
+        Raises:
+            PreconditionFailedError: An item is no longer at the version sent with it.
+            ConcurrentUpdateError: An item was updated after it was loaded.
+        """
+        items = [await self.to_model(datum, "update") for datum in data]
+        ids = [item.id for item in items]
+        existing = await self.repository.list(CollectionFilter("id", ids), auto_expunge=True)
+        old_data = {obj.id: obj.to_dict() for obj in existing}
+        for item in items:
+            if item.version is not None and item.id in old_data and item.version != old_data[item.id]["version"]:
+                msg = f"SprintLog {item.id} is at version {old_data[item.id]['version']}, not {item.version}"
+                raise PreconditionFailedError(msg)
+        now = datetime.now(UTC)
+        await self.repository.update_many(
+            [
+                {**item.to_dict(), "updated_at": now, "version": item.version or old_data[item.id]["version"]}
+                for item in items
+                if item.id in old_data
+            ],
+        )
+        for item in items:
+            self._record_audit(old_data.get(item.id), item)
+            self._record_plugin_event(PluginEventType.update, item.id, old_data=old_data.get(item.id))
+        objs = await self._reload(ids)
+        self._invalidate_cache(*(obj.project_slug for obj in existing), *(obj.project_slug for obj in objs))
+        return objs
+
     async def update(
         self,
         data: SprintLog | dict[str, Any],
@@ -272,23 +646,181 @@ class SprintlogService(SQLAlchemyAsyncRepositoryService[SprintLog]):
         auto_expunge: bool | None = None,
         auto_refresh: bool | None = None,
         id_attribute: str | InstrumentedAttribute | None = None,
+        version: int | None = None,
     ) -> SprintLog:
-        # Call the before_update hook for each registered plugin        if isinstance(data,SprintLog):
+        """Update an item, only if it is still at `version` when one is given.
+
+        `old_data` is only needed when `data` is the loaded item itself,
+        already modified; otherwise the values before the update come from
+        the one SELECT the update makes.
+        """
+        if isinstance(old_data, SprintLog):
+            old_data = old_data.to_dict()
         data = await self.to_model(data, "update")
-        for plugin in self.plugins:
-            data = await plugin.before_update(
-                item_id=item_id,
-                data=data,
-                old_data=old_data,
-            )
+        if item_id is not None:
+            data = self.repository.set_id_attribute_value(item_id, data)
+        obj, loaded_data = await self.repository.update_versioned(data, version)
+        old_data = old_data or loaded_data
+        self._record_audit(old_data, obj)
+        # before_update and after_update hooks are delivered from the plugin outbox
+        self._record_plugin_event(PluginEventType.update, obj.id, old_data=old_data)
+        self._invalidate_cache(obj.project_slug, (old_data or {}).get("project_slug"))
 
-        obj = await super().update(item_id=item_id, data=data)
+        return obj
+
+    async def shift_progress(self, slug: str, offset: int, wrap: bool = False) -> SprintLog | None:
+        """Move the progress along `Progress`.  A ready item is checked in, anything else is started."""
+        progress = _shift(SprintLog.progress, list(Progress), offset, wrap)
+        status = case((progress == Progress.ready, Status.checked_in), else_=Status.started)
+        return await self._transition(slug, progress=progress, status=status)
+
+    async def complete(self, slug: str, authorized: bool = False) -> SprintLog | None:
+        """Mark the progress ready and check the item in.
+
+        Authorized users complete an item that is already checked in.
+        """
+        status: Any = Status.checked_in
+        if authorized:
+            status = case((SprintLog.status == Status.checked_in, Status.completed), else_=Status.checked_in)
+        return await self._transition(slug, progress=Progress.ready, status=status)
+
+    async def shift_priority(self, slug: str, offset: int, wrap: bool = False) -> SprintLog | None:
+        return await self._transition(slug, priority=_shift(SprintLog.priority, list(Priority), offset, wrap))
+
+    async def shift_status(self, slug: str, offset: int, wrap: bool = False) -> SprintLog | None:
+        return await self._transition(slug, status=_shift(SprintLog.status, list(Status), offset, wrap))
+
+    async def _transition(self, slug: str, **values: Any) -> SprintLog | None:
+        moved = await self.repository.transition(slug, **values)
+        if moved is None:
+            return None
+        obj, replaced = moved
+        old_data = {**obj.to_dict(), **replaced}
+        self._record_audit(old_data, obj)
+        self._record_plugin_event(PluginEventType.update, obj.id, old_data=old_data)
+        self._invalidate_cache(obj.project_slug)
+        return obj
+
+    def _record_audit(self, old_data: dict | None, obj: SprintLog) -> None:
+        """Queue field level history, written in one INSERT when the session commits."""
+        if old_data is not None:
+            write_behind.queue(self.repository.session, Audit, audit_diff(obj.id, old_data, obj.to_dict()))
+
+    def _record_deletions(self, *objs: SprintLog) -> None:
+        """Add the sprints of deleted items for the burndown rollup to the delete transaction."""
+        sprints = {(obj.project_slug, obj.sprint_number) for obj in objs}
+        self.repository.session.add_all(
+            SprintlogDeletion(project_slug=project_slug, sprint_number=sprint_number)
+            for project_slug, sprint_number in sprints
+        )
 
-        # Call the after_update hook for each registered plugin
+    def _record_plugin_event(
+        self,
+        event: PluginEventType,
+        item_id: UUID,
+        old_data: dict | None = None,
+    ) -> None:
+        if not self.plugins:
+            return
+        payload = {"old_data": old_data} if old_data is not None else None
+        PluginEventService(session=self.repository.session).record(PluginEntity.sprintlog, event, item_id, payload)
+
+    def _invalidate_cache(self, *project_slugs: str | None) -> None:
+        """Drop cached responses of the projects once the session commits."""
+        tags = {cache.project_tag(project_slug) for project_slug in project_slugs if project_slug}
+        cache.invalidate_tags(self.repository.session, *tags)
+
+    async def deliver_plugin_event(self, event: PluginEvent) -> None:
+        """Run the plugin hooks for an outbox event and store the resulting `plugin_meta`."""
+        obj = await self.repository.get_one_or_none(id=event.item_id)
+        if obj is None:
+            return
+        self.repository.session.expunge(obj)
+        plugin_meta = deepcopy(obj.plugin_meta)
+        match event.event:
+            case PluginEventType.create:
+                await gather_hooks(self.plugins, "after_create", data=obj)
+            case PluginEventType.update:
+                old_data = event.old_data
+                for plugin in self.plugins:
+                    obj = await plugin.before_update(item_id=obj.id, data=obj, old_data=old_data)
+                await gather_hooks(self.plugins, "after_update", data=obj, old_data=old_data)
+        if obj.plugin_meta != plugin_meta:
+            await self.repository.patch_plugin_meta(obj.id, plugin_meta, obj.plugin_meta)
+            self._invalidate_cache(obj.project_slug)
+
+    async def delete_many(
+        self,
+        item_ids: list[Any],
+        auto_commit: bool | None = None,
+        auto_expunge: bool | None = None,
+        id_attribute: str | InstrumentedAttribute | None = None,
+        chunk_size: int | None = None,
+    ) -> Sequence[SprintLog]:
+        """Delete a batch of sprintlogs with one DELETE.  Unknown ids are ignored."""
+        objs = await self.repository.list(CollectionFilter("id", item_ids))
         for plugin in self.plugins:
-            await plugin.after_update(data=obj, old_data=old_data)
+            for obj in objs:
+                await plugin.before_delete(item_id=obj.id)
 
-        return obj
+        await self.repository.delete_many([obj.id for obj in objs])
+        self._record_deletions(*objs)
+        self._invalidate_cache(*(obj.project_slug for obj in objs))
+
+        await asyncio.gather(
+            *(gather_hooks(self.plugins, "after_delete", suppress_errors=True, data=obj) for obj in objs),
+        )
+        return objs
+
+    async def search(
+        self,
+        query: str,
+        limit_offset: LimitOffset,
+        project_slug: str | None = None,
+        item_type: ItemType | None = None,
+    ) -> tuple[list[SearchHit], int]:
+        filters: list[ColumnElement[bool]] = []
+        if project_slug:
+            filters.append(SprintLog.project_slug == project_slug)
+        if item_type:
+            filters.append(SprintLog.type == item_type)
+        rows, total = await self.repository.search(
+            query,
+            *filters,
+            limit=limit_offset.limit,
+            offset=limit_offset.offset,
+        )
+        return [SearchHit(**row) for row in rows], total
+
+    async def board(self, project_slug: str) -> BoardSummary:
+        summary = BoardSummary(project_slug=project_slug, total=BoardTotals(), sprints=[], statuses=[], progress=[])
+        for row in await self.repository.board_totals(project_slug):
+            totals = {"count": row["count"], "points": row["points"], "est_days": row["est_days"]}
+            match row["grouping"]:
+                case 0b011:
+                    summary.sprints.append(SprintTotals(sprint_number=row["sprint_number"], **totals))
+                case 0b101:
+                    summary.statuses.append(StatusTotals(status=row["status"], **totals))
+                case 0b110:
+                    summary.progress.append(ProgressTotals(progress=row["progress"], **totals))
+                case _:
+                    summary.total = BoardTotals(**totals)
+        statuses, progress = list(Status), list(Progress)
+        summary.sprints.sort(key=lambda sprint: sprint.sprint_number)
+        summary.statuses.sort(key=lambda row: statuses.index(row.status) if row.status in statuses else len(statuses))
+        summary.progress.sort(
+            key=lambda row: progress.index(row.progress) if row.progress in progress else len(progress)
+        )
+        return summary
+
+    async def _reload(self, item_ids: Iterable[UUID]) -> Sequence[SprintLog]:
+        """Select rows written in bulk back with their relationships in one query, in the order of `item_ids`."""
+        item_ids = list(item_ids)
+        statement = self.repository.statement + (lambda s: s.execution_options(populate_existing=True))
+        objs = {
+            obj.id: obj for obj in await self.repository.list(CollectionFilter("id", item_ids), statement=statement)
+        }
+        return [objs[item_id] for item_id in item_ids if item_id in objs]
 
     async def delete(
         self,
@@ -302,9 +834,11 @@ class SprintlogService(SQLAlchemyAsyncRepositoryService[SprintLog]):
             await plugin.before_delete(item_id=item_id)
 
         obj = await self.repository.delete(item_id)
+        self._record_deletions(obj)
+        self._invalidate_cache(obj.project_slug)
 
-        # Call the after_delete hook for each registered plugin
-        for plugin in self.plugins:
-            await plugin.after_delete(data=obj)
+        # Run the after_delete hook of every registered plugin concurrently,
+        # the row is already gone so a failing plugin must not fail the request
+        await gather_hooks(self.plugins, "after_delete", suppress_errors=True, data=obj)
 
         return obj
@@ -0,0 +1,51 @@
+from uuid import UUID  # noqa: TCH003
+
+from app.lib.schema import BaseModel
+
+__all__ = ["BoardSummary", "BoardTotals", "ProgressTotals", "SearchHit", "SprintTotals", "StatusTotals"]
+
+
+class SearchHit(BaseModel):
+    """Full-text search match with its rank and highlighted fragments."""
+
+    id: UUID
+    slug: str
+    title: str
+    title_highlight: str
+    snippet: str
+    project_slug: str
+    type: str
+    status: str
+    progress: str
+    priority: str
+    rank: float
+
+
+class BoardTotals(BaseModel):
+    """Item count and effort sums for a group of sprintlogs."""
+
+    count: int = 0
+    points: int = 0
+    est_days: float = 0
+
+
+class SprintTotals(BoardTotals):
+    sprint_number: int
+
+
+class StatusTotals(BoardTotals):
+    status: str
+
+
+class ProgressTotals(BoardTotals):
+    progress: str
+
+
+class BoardSummary(BaseModel):
+    """Aggregates a project board is drawn from."""
+
+    project_slug: str
+    total: BoardTotals
+    sprints: list[SprintTotals]
+    statuses: list[StatusTotals]
+    progress: list[ProgressTotals]
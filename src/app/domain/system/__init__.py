@@ -1,3 +1,3 @@
-from . import controllers, dtos, tasks
+from . import controllers, dtos, models, services, tasks
 
-__all__ = ["controllers", "dtos", "tasks"]
+__all__ = ["controllers", "dtos", "models", "services", "tasks"]
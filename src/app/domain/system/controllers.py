@@ -2,14 +2,17 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Literal, TypeVar
 
-from litestar import Controller, MediaType, get
+from litestar import Controller, MediaType, get, post
 from litestar.response import Response
 
+from app.domain import urls
+from app.domain.accounts.guards import requires_superuser
 from app.domain.system.dtos import SystemHealth
 from app.lib import constants, log
 from app.lib.cache import redis
 
 if TYPE_CHECKING:
+    from litestar.datastructures import State
     from litestar_saq import Queue
     from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -36,7 +39,12 @@ class SystemController(Controller):
         description="Execute a health check against backend components.  Returns system information including database and cache status.",
         signature_namespace={"SystemHealth": SystemHealth},
     )
-    async def check_system_health(self, db_session: AsyncSession, task_queues: list[Queue]) -> Response[SystemHealth]:
+    async def check_system_health(
+        self,
+        db_session: AsyncSession,
+        task_queues: list[Queue],
+        state: State,
+    ) -> Response[SystemHealth]:
         """Check database available and returns app config info."""
         try:
             db_ping = True
@@ -48,6 +56,7 @@ class SystemController(Controller):
         cache_status = "online" if cache_ping else "offline"
         worker_ping = bool([await queue.info() for queue in task_queues])
         worker_status = "online" if worker_ping else "offline"
+        plugins = await state[constants.PLUGIN_REGISTRY_STATE_KEY].health()
         healthy = bool(worker_ping and cache_ping and db_ping)
         if healthy:
             await logger.adebug(
@@ -55,6 +64,7 @@ class SystemController(Controller):
                 database_status=db_status,
                 cache_status=cache_status,
                 worker_status=worker_status,
+                plugins=plugins,
             )
         else:
             await logger.awarn(
@@ -62,10 +72,33 @@ class SystemController(Controller):
                 database_status=db_status,
                 cache_status=cache_status,
                 worker_status=worker_status,
+                plugins=plugins,
             )
 
         return Response(
-            content=SystemHealth(database_status=db_status, cache_status=cache_status, worker_status=worker_status),  # type: ignore
+            content=SystemHealth(
+                database_status=db_status,  # type: ignore[arg-type]
+                cache_status=cache_status,  # type: ignore[arg-type]
+                worker_status=worker_status,  # type: ignore[arg-type]
+                plugins=plugins,
+            ),
             status_code=200 if db_ping and cache_ping and worker_ping else 500,
             media_type=MediaType.JSON,
         )
+
+    @post(
+        operation_id="SystemPluginsReload",
+        name="system:plugins-reload",
+        path=urls.SYSTEM_PLUGINS_RELOAD,
+        guards=[requires_superuser],
+        cache=False,
+        summary="Reload Plugins",
+        description="Re-import the enabled plugin modules and rebuild the plugin instances for this worker process.",
+    )
+    async def reload_plugins(self, state: State) -> list[str]:
+        """Reload the plugin registry."""
+        registry = state[constants.PLUGIN_REGISTRY_STATE_KEY]
+        await registry.shutdown()
+        await registry.reload().startup()
+        await logger.ainfo("Reloaded plugins", plugins=registry.names())
+        return registry.names()
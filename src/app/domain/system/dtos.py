@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import Literal
+from dataclasses import dataclass, field
+from typing import Any, Literal
 
 from litestar.dto import DataclassDTO
 
@@ -15,6 +15,7 @@ class SystemHealth:
     worker_status: Literal["online", "offline"]
     app: str = settings.app.NAME
     version: str = settings.app.BUILD_NUMBER
+    plugins: dict[str, dict[str, Any]] = field(default_factory=dict)
 
 
 class SystemHealthDTO(DataclassDTO[SystemHealth]):
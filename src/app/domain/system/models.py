@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from enum import StrEnum
+from uuid import UUID  # noqa: TCH003
+
+from sqlalchemy import Index, String, Text, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.lib import serialization
+from app.lib.db import orm
+
+__all__ = ["PluginEntity", "PluginEvent", "PluginEventStatus", "PluginEventType"]
+
+
+class PluginEntity(StrEnum):
+    """Domain object a plugin event refers to."""
+
+    sprintlog = "sprintlog"
+    project = "project"
+
+
+class PluginEventType(StrEnum):
+    """Lifecycle step that produced a plugin event."""
+
+    create = "create"
+    update = "update"
+
+
+class PluginEventStatus(StrEnum):
+    """Delivery state of a plugin event."""
+
+    pending = "pending"
+    delivered = "delivered"
+    failed = "failed"
+
+
+class PluginEvent(orm.TimestampedDatabaseModel):
+    """Transactional outbox row for plugin side effects.
+
+    Rows are written in the same transaction as the change that caused them
+    and delivered to the plugins by the `plugin-events` worker queue.
+    """
+
+    __tablename__ = "plugin_outbox"  # type: ignore[assignment]
+    __table_args__ = (
+        Index(
+            "ix_plugin_outbox_pending",
+            "available_at",
+            "created_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+        {"comment": "Pending plugin hook deliveries"},
+    )
+    entity: Mapped[PluginEntity] = mapped_column(String(length=50))
+    event: Mapped[PluginEventType] = mapped_column(String(length=50))
+    item_id: Mapped[UUID] = mapped_column(index=True)
+    payload: Mapped[dict | None]
+    status: Mapped[PluginEventStatus] = mapped_column(
+        String(length=50),
+        default=PluginEventStatus.pending,
+    )
+    attempts: Mapped[int] = mapped_column(default=0)
+    available_at: Mapped[datetime] = mapped_column(default=lambda: datetime.now(UTC))
+    delivered_at: Mapped[datetime | None]
+    last_error: Mapped[str | None] = mapped_column(Text)
+
+    @property
+    def old_data(self) -> dict | None:
+        """Row values from before an update, as JSON types (strings for dates, ids and enums).
+
+        Depending on the engine's JSON codecs the payload reads back either as
+        a mapping or as its encoded form.
+        """
+        payload = self.payload if isinstance(self.payload, dict) else serialization.eval_from_b64(self.payload)
+        return (payload or {}).get("old_data")
@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import Any, Literal
 
 from app.lib import settings
 from app.lib.schema import CamelizedBaseModel
@@ -14,6 +14,7 @@ class SystemHealth(CamelizedBaseModel):
     database_status: Literal["online", "offline"]
     cache_status: Literal["online", "offline"]
     worker_status: Literal["online", "offline"]
+    plugins: dict[str, dict[str, Any]] = {}
 
     class Config:
         """Schema configuration."""
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import and_, delete, exists, or_, select, update
+from sqlalchemy.orm import aliased
+
+from app.domain.system.models import PluginEntity, PluginEvent, PluginEventStatus, PluginEventType
+from app.lib import serialization, settings
+from app.lib.repository import SQLAlchemyAsyncRepository
+from app.lib.service import SQLAlchemyAsyncRepositoryService
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+__all__ = ["PluginEventRepository", "PluginEventService"]
+
+
+class PluginEventRepository(SQLAlchemyAsyncRepository[PluginEvent]):
+    """Plugin Outbox Repository."""
+
+    model_type = PluginEvent
+
+    async def claim_pending(self, limit: int, lease: timedelta) -> list[PluginEvent]:
+        """Lease a batch of deliverable events.
+
+        An event is deliverable once its `available_at` has passed and no
+        older event for the same item is still pending, so hooks for one item
+        are always delivered in order.  Claimed rows get their lease and
+        attempt counter bumped in the same statement.
+        """
+        now = datetime.now(UTC)
+        previous = aliased(PluginEvent)
+        candidates = (
+            select(PluginEvent.id)
+            .where(
+                PluginEvent.status == PluginEventStatus.pending,
+                PluginEvent.available_at <= now,
+                ~exists().where(
+                    and_(
+                        previous.item_id == PluginEvent.item_id,
+                        previous.status == PluginEventStatus.pending,
+                        previous.created_at < PluginEvent.created_at,
+                    ),
+                ),
+            )
+            .order_by(PluginEvent.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        statement = (
+            update(PluginEvent)
+            .where(PluginEvent.id.in_(candidates.scalar_subquery()))
+            .values(available_at=now + lease, attempts=PluginEvent.attempts + 1)
+            .returning(PluginEvent)
+            .execution_options(synchronize_session=False)
+        )
+        results = await self.session.scalars(statement)
+        return sorted(results.all(), key=lambda event: event.created_at)
+
+    async def purge(self, before: datetime) -> int:
+        """Delete delivered and failed events last handled before `before`.
+
+        Returns:
+            The number of events deleted.
+        """
+        statement = delete(PluginEvent).where(
+            or_(
+                and_(PluginEvent.status == PluginEventStatus.delivered, PluginEvent.delivered_at < before),
+                and_(PluginEvent.status == PluginEventStatus.failed, PluginEvent.available_at < before),
+            ),
+        )
+        result = await self.session.execute(statement.execution_options(synchronize_session=False))
+        return result.rowcount
+
+
+class PluginEventService(SQLAlchemyAsyncRepositoryService[PluginEvent]):
+    """Records and tracks plugin outbox events."""
+
+    repository_type = PluginEventRepository
+
+    def __init__(self, **repo_kwargs: Any) -> None:
+        self.repository: PluginEventRepository = self.repository_type(**repo_kwargs)
+        self.model_type = self.repository.model_type
+
+    def record(
+        self,
+        entity: PluginEntity,
+        event: PluginEventType,
+        item_id: UUID,
+        payload: dict[str, Any] | None = None,
+    ) -> PluginEvent:
+        """Add an event to the current transaction without flushing it.
+
+        `payload` is stored as JSON types, so it reads back the same whatever
+        the JSON serializer of the engine.
+        """
+        if payload is not None:
+            payload = serialization.from_json(serialization.to_json(payload))
+        obj = PluginEvent(entity=entity, event=event, item_id=item_id, payload=payload)
+        self.repository.session.add(obj)
+        return obj
+
+    async def claim_pending(self) -> list[PluginEvent]:
+        return await self.repository.claim_pending(
+            limit=settings.worker.PLUGIN_OUTBOX_BATCH_SIZE,
+            lease=timedelta(seconds=settings.worker.PLUGIN_OUTBOX_LEASE),
+        )
+
+    async def purge(self) -> int:
+        return await self.repository.purge(
+            before=datetime.now(UTC) - timedelta(seconds=settings.worker.PLUGIN_OUTBOX_RETENTION),
+        )
+
+    async def mark_delivered(self, event: PluginEvent) -> None:
+        await self.repository.session.execute(
+            update(PluginEvent)
+            .where(PluginEvent.id == event.id)
+            .values(status=PluginEventStatus.delivered, delivered_at=datetime.now(UTC), last_error=None),
+        )
+
+    async def mark_failed(self, event: PluginEvent, error: str) -> None:
+        """Schedule a retry with exponential backoff, or give up after the last attempt."""
+        exhausted = event.attempts >= settings.worker.PLUGIN_OUTBOX_MAX_ATTEMPTS
+        delay = settings.worker.PLUGIN_OUTBOX_RETRY_DELAY * 2 ** (event.attempts - 1)
+        await self.repository.session.execute(
+            update(PluginEvent)
+            .where(PluginEvent.id == event.id)
+            .values(
+                status=PluginEventStatus.failed if exhausted else PluginEventStatus.pending,
+                available_at=datetime.now(UTC) + timedelta(seconds=delay),
+                last_error=error,
+            ),
+        )
@@ -1,23 +1,48 @@
 import asyncio
+from typing import Any
 
 from saq.types import Context
 
-from app.lib import log
+from app.domain.system.models import PluginEntity
+from app.domain.system.services import PluginEventService
+from app.lib import db, log, plugin, settings
 
-__all__ = ["background_worker_task", "system_task", "system_upkeep"]
+__all__ = [
+    "background_worker_task",
+    "deliver_plugin_events",
+    "plugin_events_shutdown",
+    "plugin_events_startup",
+    "purge_plugin_events",
+    "rollup_sprint_burndown",
+    "run_plugin_task",
+    "system_task",
+]
 
 
 logger = log.get_logger()
 
 
-async def system_upkeep(_: Context) -> None:
-    await logger.ainfo("Performing system upkeep operations.")
-    await logger.ainfo("Simulating a long running operation.  Sleeping for 60 seconds.")
-    await asyncio.sleep(60)
-    await logger.ainfo("Simulating an even long running operation.  Sleeping for 120 seconds.")
-    await asyncio.sleep(120)
-    await logger.ainfo("Long running process complete.")
-    await logger.ainfo("Performing system upkeep operations.")
+async def rollup_sprint_burndown(_: Context) -> int:
+    """Roll sprintlogs changed since the last run up into today's burndown rows.
+
+    Returns:
+        The number of sprints rolled up.
+    """
+    # imported here, the domain models import this package
+    from app.domain.analytics.queries import analytics_queries
+    from app.domain.sprintlogs.models import Status
+
+    async with db.session() as session:
+        connection = await (await session.connection()).get_raw_connection()
+        rolled = await analytics_queries.rollup_sprint_burndown(
+            connection.driver_connection,
+            overlap=settings.worker.BURNDOWN_WATERMARK_OVERLAP,
+            completed=Status.completed.value,
+            cancelled=Status.cancelled.value,
+        )
+        await session.commit()
+    await logger.ainfo("Sprint burndown rolled up", sprints=rolled)
+    return rolled
 
 
 async def background_worker_task(_: Context) -> None:
@@ -30,3 +55,76 @@ async def system_task(_: Context) -> None:
     await logger.ainfo("Performing simple system task")
     await asyncio.sleep(2)
     await logger.ainfo("System task complete.")
+
+
+async def run_plugin_task(_: Context, *, task: str, **kwargs: Any) -> Any:
+    """Run a plugin task, `<module>.<function>` of a plugin module's `tasks`."""
+    return await plugin.registry.load().task(task)(**kwargs)
+
+
+async def plugin_events_startup(_: Context) -> None:
+    await plugin.registry.load().startup()
+
+
+async def plugin_events_shutdown(_: Context) -> None:
+    await plugin.registry.shutdown()
+
+
+async def purge_plugin_events(_: Context) -> int:
+    """Delete plugin outbox events kept longer than the retention period.
+
+    Returns:
+        The number of events deleted.
+    """
+    async with db.session() as session:
+        purged = await PluginEventService(session=session).purge()
+        await session.commit()
+    await logger.ainfo("Plugin outbox purged", events=purged)
+    return purged
+
+
+async def deliver_plugin_events(_: Context) -> int:
+    """Deliver pending plugin outbox events.
+
+    Each event is committed on its own, so a failing plugin only delays the
+    events of the item it failed on.
+
+    Returns:
+        The number of events delivered.
+    """
+    # imported here, the domain models import this package
+    from app.domain.projects.models import ProjectService
+    from app.domain.sprintlogs.models import SprintlogService
+
+    registry = plugin.registry.load()
+    handlers = {
+        PluginEntity.sprintlog: (SprintlogService, registry.sprintlog),
+        PluginEntity.project: (ProjectService, registry.project),
+    }
+    delivered = 0
+    async with db.session() as session:
+        outbox = PluginEventService(session=session)
+        events = await outbox.claim_pending()
+        await session.commit()
+        session.expunge_all()
+        for event in events:
+            service_type, plugins = handlers[event.entity]
+            try:
+                async with service_type.new(session=session) as service:
+                    service.plugins = plugins
+                    await service.deliver_plugin_event(event)
+                await outbox.mark_delivered(event)
+                delivered += 1
+            except Exception as exc:  # noqa: BLE001
+                await session.rollback()
+                await logger.aerror(
+                    "Plugin event delivery failed",
+                    event_id=str(event.id),
+                    entity=event.entity,
+                    event_type=event.event,
+                    attempts=event.attempts,
+                    exc_info=exc,
+                )
+                await outbox.mark_failed(event, repr(exc))
+            await session.commit()
+    return delivered
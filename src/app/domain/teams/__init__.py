@@ -1,4 +1,4 @@
 """Team Application Module."""
-from . import controllers, dependencies, dtos, guards, models, services
+from . import claims, controllers, dependencies, dtos, guards, models, services
 
-__all__ = ["controllers", "models", "guards", "services", "dtos", "dependencies"]
+__all__ = ["claims", "controllers", "models", "guards", "services", "dtos", "dependencies"]
@@ -0,0 +1,65 @@
+"""Team membership claims carried by access tokens.
+
+With `APP_JWT_TEAM_CLAIMS` enabled, tokens are minted with a compact
+`team id -> [role, is_owner]` map and a digest of the memberships they were
+built from.  Team guards answer from that map with a dict lookup.  When the
+memberships change, the digest no longer matches the (cached) user and the
+claims are dropped for the request, so guards fall back to the user's
+memberships until the client fetches a new token from the refresh route.
+"""
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING, Any
+
+from litestar.contrib.jwt import Token
+
+from app.domain.teams.models import TeamRoles
+
+if TYPE_CHECKING:
+    from litestar.connection import ASGIConnection
+
+    from app.domain.accounts.models import User
+
+__all__ = ["TEAMS_CLAIM", "TEAMS_DIGEST_CLAIM", "drop_stale_team_claims", "team_claims", "team_roles"]
+
+TEAMS_CLAIM = "teams"
+"""Token extra holding the `team id -> [role, is_owner]` map."""
+TEAMS_DIGEST_CLAIM = "teams_digest"
+"""Token extra holding the digest of the memberships the map was built from."""
+
+TeamRoleMap = dict[str, tuple[str, bool]]
+
+
+def _role_map(user: User) -> TeamRoleMap:
+    return {str(member.team_id): (TeamRoles(member.role).value, member.is_owner) for member in user.teams}
+
+
+def _digest(roles: TeamRoleMap) -> str:
+    payload = ";".join(f"{team_id}:{role}:{int(is_owner)}" for team_id, (role, is_owner) in sorted(roles.items()))
+    return hashlib.blake2b(payload.encode(), digest_size=8).hexdigest()
+
+
+def team_claims(user: User) -> dict[str, Any]:
+    """Token extras describing the team memberships loaded on `user`."""
+    roles = _role_map(user)
+    return {TEAMS_CLAIM: roles, TEAMS_DIGEST_CLAIM: _digest(roles)}
+
+
+def drop_stale_team_claims(token: Token, user: User) -> None:
+    """Remove team claims from `token` that no longer match the memberships of `user`."""
+    if TEAMS_CLAIM in token.extras and token.extras.get(TEAMS_DIGEST_CLAIM) != _digest(_role_map(user)):
+        token.extras.pop(TEAMS_CLAIM)
+        token.extras.pop(TEAMS_DIGEST_CLAIM, None)
+
+
+def team_roles(connection: ASGIConnection) -> TeamRoleMap:
+    """`team id -> (role, is_owner)` for the connection user.
+
+    Read from the token claims when present, otherwise built from the
+    memberships loaded with the user.
+    """
+    token = connection.auth
+    if isinstance(token, Token) and TEAMS_CLAIM in token.extras:
+        return token.extras[TEAMS_CLAIM]
+    return _role_map(connection.user)
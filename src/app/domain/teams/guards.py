@@ -4,6 +4,7 @@ from litestar.connection import ASGIConnection
 from litestar.exceptions import PermissionDeniedException
 from litestar.handlers.base import BaseRouteHandler
 
+from app.domain.teams.claims import team_roles
 from app.domain.teams.models import TeamRoles
 
 __all__ = ["requires_team_admin", "requires_team_membership", "requires_team_ownership"]
@@ -24,7 +25,7 @@ def requires_team_membership(connection: ASGIConnection, _: BaseRouteHandler) ->
         return
     if connection.user.is_superuser:
         return
-    if any(membership.team.id == team_id for membership in connection.user.teams):
+    if str(team_id) in team_roles(connection):
         return
     raise PermissionDeniedException(detail="Insufficient permissions to access workspace.")
 
@@ -44,9 +45,8 @@ def requires_team_admin(connection: ASGIConnection, _: BaseRouteHandler) -> None
         return
     if connection.user.is_superuser:
         return
-    if any(
-        membership.team.id == team_id and membership.role == TeamRoles.ADMIN for membership in connection.user.teams
-    ):
+    role, _ = team_roles(connection).get(str(team_id), (None, False))
+    if role == TeamRoles.ADMIN:
         return
     raise PermissionDeniedException(detail="Insufficient permissions to access team.")
 
@@ -61,12 +61,13 @@ def requires_team_ownership(connection: ASGIConnection, _: BaseRouteHandler) ->
     Raises:
         PermissionDeniedException: _description_
     """
-    team_id = UUID(connection.path_params["team_id"])
+    team_id = connection.path_params["team_id"]
     if connection.scope.get("method") == "OPTIONS":
         return
     if connection.user.is_superuser:
         return
-    if any(membership.team.id == team_id and membership.is_owner for membership in connection.user.teams):
+    _, is_owner = team_roles(connection).get(str(team_id), (None, False))
+    if is_owner:
         return
     msg = "Insufficient permissions to access team."
     raise PermissionDeniedException(msg)
@@ -5,6 +5,7 @@ from uuid import UUID, uuid4
 from sqlalchemy import select
 from sqlalchemy.orm import InstrumentedAttribute, joinedload, noload, selectinload
 
+from app.domain.accounts import cache
 from app.domain.tags.dependencies import provide_tags_service
 from app.domain.teams.models import Team, TeamInvitation, TeamMember, TeamRoles
 from app.lib.dependencies import FilterTypes
@@ -83,7 +84,10 @@ class TeamService(SQLAlchemyAsyncRepositoryService[Team]):
             for tag_text in tags_added:
                 tag, _ = await tags_service.get_or_create(match_fields=["name"], upsert=False, name=tag_text)
                 db_obj.tags.append(tag)
-        return await super().create(db_obj)
+        db_obj = await super().create(db_obj)
+        if owner_id:
+            await cache.invalidate_users(self.repository.session, [owner_id])
+        return db_obj
 
     async def update(
         self,
@@ -128,7 +132,25 @@ class TeamService(SQLAlchemyAsyncRepositoryService[Team]):
             for tag_text in tags_to_add:
                 tag, _ = await tags_service.get_or_create(name=tag_text)
                 data.tags.append(tag)
-        return await super().update(item_id, data)
+        db_obj = await super().update(item_id, data)
+        await cache.invalidate_team(self.repository.session, db_obj.id)
+        return db_obj
+
+    async def delete(
+        self,
+        item_id: Any,
+        auto_commit: bool | None = None,
+        auto_expunge: bool | None = None,
+        id_attribute: str | InstrumentedAttribute | None = None,
+    ) -> Team:
+        """Delete a team and evict the cached snapshots of its members."""
+        await cache.invalidate_team(self.repository.session, item_id)
+        return await super().delete(
+            item_id=item_id,
+            auto_commit=auto_commit,
+            auto_expunge=auto_expunge,
+            id_attribute=id_attribute,
+        )
 
     async def to_model(self, data: Team | dict[str, Any], operation: str | None = None) -> Team:
         if isinstance(data, dict) and "slug" not in data and operation == "create":
@@ -143,10 +165,59 @@ class TeamMemberRepository(SQLAlchemyAsyncRepository[TeamMember]):
 
 
 class TeamMemberService(SQLAlchemyAsyncRepositoryService[TeamMember]):
-    """Team Member Service."""
+    """Team Member Service.
+
+    Every change evicts the cached snapshot of the member's user, which
+    carries its team memberships.
+    """
 
     repository_type = TeamMemberRepository
 
+    async def create(self, data: TeamMember | dict[str, Any]) -> TeamMember:
+        db_obj = await super().create(data)
+        await cache.invalidate_users(self.repository.session, [db_obj.user_id])
+        return db_obj
+
+    async def update(
+        self,
+        data: TeamMember | dict[str, Any],
+        item_id: Any | None = None,
+        attribute_names: Iterable[str] | None = None,
+        with_for_update: bool | None = None,
+        auto_commit: bool | None = None,
+        auto_expunge: bool | None = None,
+        auto_refresh: bool | None = None,
+        id_attribute: str | InstrumentedAttribute | None = None,
+    ) -> TeamMember:
+        db_obj = await super().update(
+            data=data,
+            item_id=item_id,
+            attribute_names=attribute_names,
+            with_for_update=with_for_update,
+            auto_commit=auto_commit,
+            auto_expunge=auto_expunge,
+            auto_refresh=auto_refresh,
+            id_attribute=id_attribute,
+        )
+        await cache.invalidate_users(self.repository.session, [db_obj.user_id])
+        return db_obj
+
+    async def delete(
+        self,
+        item_id: Any,
+        auto_commit: bool | None = None,
+        auto_expunge: bool | None = None,
+        id_attribute: str | InstrumentedAttribute | None = None,
+    ) -> TeamMember:
+        db_obj = await super().delete(
+            item_id=item_id,
+            auto_commit=auto_commit,
+            auto_expunge=auto_expunge,
+            id_attribute=id_attribute,
+        )
+        await cache.invalidate_users(self.repository.session, [db_obj.user_id])
+        return db_obj
+
 
 class TeamInvitationRepository(SQLAlchemyAsyncRepository[TeamInvitation]):
     """Team Invitation Repository."""
@@ -10,6 +10,7 @@ TAG_DETAILS = "/api/tags/{tag_id:uuid}"
 
 ACCOUNT_LOGIN = "/api/access/login"
 ACCOUNT_REGISTER = "/api/access/signup"
+ACCOUNT_REFRESH = "/api/access/refresh"
 ACCOUNT_PROFILE = "/api/me"
 ACCOUNT_LIST = "/api/users"
 ACCOUNT_DELETE = "/api/users/{user_id:uuid}"
@@ -28,3 +29,6 @@ TEAM_INVITATION_LIST = "/api/workspaces/{team_id:uuid}/invitations"
 
 
 STATS_WEEKLY_NEW_USERS = "/api/stats/weekly-new-users"
+STATS_SPRINT_BURNDOWN = "/api/stats/sprint-burndown/{project_slug:str}/{sprint_number:int}"
+
+SYSTEM_PLUGINS_RELOAD = "/api/system/plugins/reload"
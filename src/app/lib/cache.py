@@ -1,18 +1,47 @@
 from __future__ import annotations
 
+import asyncio
+import time
+from collections import OrderedDict, defaultdict
+from contextvars import ContextVar
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
+import msgspec
 from litestar.config.response_cache import ResponseCacheConfig, default_cache_key_builder
+from litestar.stores.base import Store
 from litestar.stores.redis import RedisStore
 from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 
-from app.lib import constants, settings
+from app.lib import constants, log, settings
 
-__all__ = ["cache_key_builder", "on_shutdown"]
+__all__ = [
+    "PROJECTS_TAG",
+    "TwoTierCache",
+    "TwoTierStore",
+    "cache_key_builder",
+    "invalidate_after_commit",
+    "invalidate_tags",
+    "on_shutdown",
+    "project_cache_key",
+    "project_tag",
+    "shared_cache_key_builder",
+    "single_flight_middleware",
+    "tagged_key",
+    "tagged_key_builder",
+]
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from litestar.connection import Request
+    from litestar.types import CacheKeyBuilder
+    from litestar.types.asgi_types import ASGIApp, Receive, Scope, Send
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 
 redis = Redis.from_url(  # type:ignore[call-overload]
@@ -28,14 +57,24 @@ redis = Redis.from_url(  # type:ignore[call-overload]
 [CacheSettings][app.lib.config.CacheSettings].
 """
 
+logger = log.get_logger()
+
+TAG_SEPARATOR = "#"
+"""Separates a response cache key from the tags it is invalidated by."""
+PROJECTS_TAG = "projects"
+"""Tag of cached responses listing projects."""
+INVALIDATIONS_KEY = "cache_invalidations"
+
 
 async def on_shutdown() -> None:
     """On Shutdown."""
     await redis.aclose()
 
 
-def cache_key_builder(request: Request) -> str:
-    """App name prefixed cache key builder.
+def shared_cache_key_builder(request: Request) -> str:
+    """App name prefixed cache key builder shared by every user.
+
+    Only use it for responses that do not depend on who is asking.
 
     Parameters
     ----------
@@ -50,12 +89,499 @@ def cache_key_builder(request: Request) -> str:
     return f"{settings.app.slug}:{default_cache_key_builder(request)}"
 
 
+def cache_key_builder(request: Request) -> str:
+    """App name prefixed cache key builder, scoped to the authenticated user.
+
+    Parameters
+    ----------
+    request : Request
+        Current request instance.
+
+    Returns:
+    -------
+    str
+        App slug prefixed cache key, including the user id when there is one.
+    """
+    user = request.scope.get("user")
+    if user is None:
+        return shared_cache_key_builder(request)
+    return f"{settings.app.slug}:user:{user.id}:{default_cache_key_builder(request)}"
+
+
+def project_cache_key(name: str, project_slug: str) -> str:
+    """App name prefixed cache key shared by every request for a project.
+
+    Parameters
+    ----------
+    name : str
+        Name of the cached resource.
+    project_slug : str
+        Project the resource belongs to.
+
+    Returns:
+    -------
+    str
+        App slug prefixed cache key.
+    """
+    return f"{settings.app.slug}:{name}:{project_slug}"
+
+
+def project_tag(project_slug: str) -> str:
+    """Tag of cached responses derived from the items of a project."""
+    return f"project:{project_slug}"
+
+
+def tagged_key(key: str, *tags: str) -> str:
+    """Attach invalidation tags to a response cache key."""
+    return f"{key}{TAG_SEPARATOR}{','.join(tags)}" if tags else key
+
+
+def _split_tags(key: str) -> tuple[str, tuple[str, ...]]:
+    key, _, tags = key.partition(TAG_SEPARATOR)
+    return key, tuple(tag for tag in tags.split(",") if tag)
+
+
+def tagged_key_builder(*tags: Callable[[Request], str]) -> CacheKeyBuilder:
+    """User scoped cache key builder for responses invalidated by `tags`.
+
+    Parameters
+    ----------
+    *tags : Callable[[Request], str]
+        Build one tag each from the request.
+
+    Returns:
+    -------
+    CacheKeyBuilder
+        Cache key builder for a route handler.
+    """
+
+    def builder(request: Request) -> str:
+        return tagged_key(cache_key_builder(request), *(tag(request) for tag in tags))
+
+    return builder
+
+
+_flights_taken_off: ContextVar[list[tuple[TwoTierStore, str, asyncio.Future[bytes | None]]] | None] = ContextVar(
+    "flights_taken_off",
+    default=None,
+)
+"""Response cache flights the current request computes, see `single_flight_middleware`."""
+
+_encode_envelope = msgspec.msgpack.Encoder().encode
+_decode_envelope = msgspec.msgpack.Decoder(tuple[float, bytes]).decode
+
+
 def redis_store_factory(name: str) -> RedisStore:
     return RedisStore(redis, namespace=f"{settings.app.slug}:{name}")
 
 
+class TwoTierCache:
+    """Per-process LRU in front of Redis.
+
+    Reads are answered by the local LRU while its entry is fresh, then by
+    Redis, which also refills the LRU.  Local entries only live for
+    `local_expiration` seconds, which bounds how long another process keeps
+    serving a value after it was deleted elsewhere.  When Redis fails the
+    cache degrades to the LRU alone and Redis is left alone for
+    `redis_backoff` seconds.
+
+    Entries can carry tags; `invalidate_tags` drops every entry stored with
+    one of them.  Redis keeps a set of keys per tag for that.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        expiration: int,
+        local_expiration: float,
+        local_size: int,
+        redis_backoff: float = 5.0,
+    ) -> None:
+        self.namespace = f"{settings.app.slug}:{name}"
+        self.expiration = expiration
+        self.local_expiration = local_expiration
+        self.local_size = local_size
+        self.redis_backoff = redis_backoff
+        self._local: OrderedDict[str, tuple[float, bytes, tuple[str, ...]]] = OrderedDict()
+        self._redis_down_until = 0.0
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.namespace}:tag:{tag}"
+
+    def _lock_key(self, key: str) -> str:
+        return f"{self.namespace}:lock:{key}"
+
+    def _redis_available(self) -> bool:
+        return time.monotonic() >= self._redis_down_until
+
+    def _redis_failed(self, operation: str) -> None:
+        self._redis_down_until = time.monotonic() + self.redis_backoff
+        logger.warning("Redis unavailable, using the local cache only", cache=self.namespace, operation=operation)
+
+    def get_local(self, key: str) -> bytes | None:
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        expires_at, value, _ = entry
+        if expires_at <= time.monotonic():
+            del self._local[key]
+            return None
+        self._local.move_to_end(key)
+        return value
+
+    def set_local(
+        self,
+        key: str,
+        value: bytes,
+        expires_in: float | None = None,
+        tags: Iterable[str] = (),
+    ) -> None:
+        expiration = self.local_expiration if expires_in is None else min(expires_in, self.local_expiration)
+        self._local[key] = (time.monotonic() + expiration, value, tuple(tags))
+        self._local.move_to_end(key)
+        while len(self._local) > self.local_size:
+            self._local.popitem(last=False)
+
+    def evict_local(self, *keys: str) -> None:
+        for key in keys:
+            self._local.pop(key, None)
+
+    def evict_local_tags(self, *tags: str) -> None:
+        stale = set(tags)
+        self.evict_local(*(key for key, (_, _, key_tags) in self._local.items() if stale.intersection(key_tags)))
+
+    async def get(self, key: str, tags: Iterable[str] = ()) -> bytes | None:
+        value = self.get_local(key)
+        if value is not None or not self._redis_available():
+            return value
+        try:
+            value = await redis.get(self._redis_key(key))
+        except (RedisError, OSError):
+            self._redis_failed("get")
+            return None
+        if value is not None:
+            self.set_local(key, value, tags=tags)
+        return value
+
+    async def set(self, key: str, value: bytes, expires_in: int | None = None, tags: Iterable[str] = ()) -> None:
+        tags = tuple(tags)
+        expires_in = self.expiration if expires_in is None else expires_in
+        self.set_local(key, value, expires_in, tags)
+        if not self._redis_available():
+            return
+        redis_key = self._redis_key(key)
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.set(redis_key, value, ex=expires_in)
+                for tag in tags:
+                    pipe.sadd(self._tag_key(tag), redis_key)
+                    pipe.expire(self._tag_key(tag), constants.CACHE_TAG_EXPIRATION)
+                await pipe.execute()
+        except (RedisError, OSError):
+            self._redis_failed("set")
+
+    async def delete(self, *keys: str) -> None:
+        self.evict_local(*keys)
+        if not keys:
+            return
+        try:
+            await redis.delete(*(self._redis_key(key) for key in keys))
+        except (RedisError, OSError):
+            self._redis_failed("delete")
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        self.evict_local_tags(*tags)
+        if not tags:
+            return
+        tag_keys = [self._tag_key(tag) for tag in tags]
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                for tag_key in tag_keys:
+                    pipe.smembers(tag_key)
+                members = await pipe.execute()
+            await redis.delete(*tag_keys, *(key for keys in members for key in keys))
+        except (RedisError, OSError):
+            self._redis_failed("invalidate")
+
+    async def lock(self, key: str, timeout: float) -> bool:
+        """Take the cross-process lock of `key` for `timeout` seconds.
+
+        Without Redis every process is on its own, so the lock is granted.
+        """
+        if not self._redis_available():
+            return True
+        try:
+            return bool(await redis.set(self._lock_key(key), b"1", nx=True, px=int(timeout * 1000)))
+        except (RedisError, OSError):
+            self._redis_failed("lock")
+            return True
+
+    async def unlock(self, key: str) -> None:
+        if not self._redis_available():
+            return
+        try:
+            await redis.delete(self._lock_key(key))
+        except (RedisError, OSError):
+            self._redis_failed("unlock")
+
+    async def clear(self) -> None:
+        self._local.clear()
+        try:
+            async for key in redis.scan_iter(match=f"{self.namespace}:*"):
+                await redis.delete(key)
+        except (RedisError, OSError):
+            self._redis_failed("clear")
+
+    async def ttl(self, key: str) -> int | None:
+        try:
+            ttl = await redis.ttl(self._redis_key(key))
+        except (RedisError, OSError):
+            self._redis_failed("ttl")
+            return None
+        return None if ttl < 0 else ttl
+
+
+class TwoTierStore(Store):
+    """Litestar store backed by a [`TwoTierCache`][app.lib.cache.TwoTierCache].
+
+    Keys built with `tagged_key` are stored under their tags, so writes can
+    invalidate the cached responses that depend on them.
+
+    Reads are single-flight.  The expiration a response is stored with is
+    its soft TTL; it stays in the cache for `stale_expiration` more seconds
+    (the hard TTL).  A stale read makes one request, across all processes,
+    recompute the response while the others keep getting the stale copy.
+    On a miss, one request computes the response while the others in the
+    same process wait for it and the others elsewhere poll Redis, for at
+    most `lock_timeout` seconds before they compute it themselves.  A flight
+    whose response is never stored (the handler raised, or the response is
+    not cacheable) is abandoned by `single_flight_middleware` as soon as
+    the request ends, and the waiting requests compute it themselves.
+    """
+
+    def __init__(
+        self,
+        cache: TwoTierCache,
+        *,
+        stale_expiration: int = 0,
+        lock_timeout: float = 5.0,
+        poll_interval: float = 0.05,
+    ) -> None:
+        self.cache = cache
+        self.stale_expiration = stale_expiration
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+        self._flights: dict[str, tuple[float, asyncio.Future[bytes | None]]] = {}
+
+    async def set(self, key: str, value: str | bytes, expires_in: int | timedelta | None = None) -> None:
+        key, tags = _split_tags(key)
+        if isinstance(expires_in, timedelta):
+            expires_in = int(expires_in.total_seconds())
+        soft_expiration = self.cache.expiration if expires_in is None else expires_in
+        value = value.encode() if isinstance(value, str) else value
+        envelope = _encode_envelope((time.time() + soft_expiration, value))
+        await self.cache.set(key, envelope, soft_expiration + self.stale_expiration, tags)
+        await self._land(key, value)
+
+    async def get(self, key: str, renew_for: int | timedelta | None = None) -> bytes | None:
+        key, tags = _split_tags(key)
+        entry = await self._get_entry(key, tags)
+        if entry is not None:
+            fresh_until, value = entry
+            if time.time() < fresh_until or not await self._take_off(key):
+                return value
+            return None
+        flight = self._flights.get(key)
+        if flight is not None and flight[0] > time.monotonic():
+            try:
+                return await asyncio.wait_for(asyncio.shield(flight[1]), flight[0] - time.monotonic())
+            except TimeoutError:
+                return None
+        if await self._take_off(key):
+            return None
+        return await self._wait_for_flight(key, tags)
+
+    async def _get_entry(self, key: str, tags: Iterable[str]) -> tuple[float, bytes] | None:
+        envelope = await self.cache.get(key, tags)
+        if envelope is None:
+            return None
+        try:
+            return _decode_envelope(envelope)
+        except msgspec.DecodeError:
+            return None
+
+    async def _take_off(self, key: str) -> bool:
+        """Make the calling request the one that computes `key`, unless another one already does."""
+        flight = self._flights.get(key)
+        if flight is not None and flight[0] > time.monotonic():
+            return False
+        if not await self.cache.lock(key, self.lock_timeout):
+            return False
+        future: asyncio.Future[bytes | None] = asyncio.get_running_loop().create_future()
+        self._flights[key] = (time.monotonic() + self.lock_timeout, future)
+        taken_off = _flights_taken_off.get()
+        if taken_off is not None:
+            taken_off.append((self, key, future))
+        return True
+
+    async def _land(self, key: str, value: bytes) -> None:
+        flight = self._flights.pop(key, None)
+        if flight is None:
+            return
+        if not flight[1].done():
+            flight[1].set_result(value)
+        await self.cache.unlock(key)
+
+    async def abandon(self, key: str, future: asyncio.Future[bytes | None]) -> None:
+        """Release the flight `future` of `key` without a response.
+
+        Requests waiting for it get a miss and compute the response
+        themselves.  Does nothing if the flight has landed already.
+        """
+        flight = self._flights.get(key)
+        if flight is None or flight[1] is not future:
+            return
+        del self._flights[key]
+        if not future.done():
+            future.set_result(None)
+        await self.cache.unlock(key)
+
+    async def _wait_for_flight(self, key: str, tags: Iterable[str]) -> bytes | None:
+        """Poll for the response another process is computing."""
+        deadline = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            entry = await self._get_entry(key, tags)
+            if entry is not None:
+                return entry[1]
+        return None
+
+    async def delete(self, key: str) -> None:
+        await self.cache.delete(_split_tags(key)[0])
+
+    async def delete_all(self) -> None:
+        await self.cache.clear()
+
+    async def exists(self, key: str) -> bool:
+        return await self.get(key) is not None
+
+    async def expires_in(self, key: str) -> int | None:
+        return await self.cache.ttl(_split_tags(key)[0])
+
+
+response_cache = TwoTierCache(
+    "response_cache",
+    expiration=constants.CACHE_EXPIRATION,
+    local_expiration=constants.RESPONSE_CACHE_LOCAL_EXPIRATION,
+    local_size=constants.RESPONSE_CACHE_LOCAL_SIZE,
+)
+"""Process wide response cache."""
+
 config = ResponseCacheConfig(
     default_expiration=constants.CACHE_EXPIRATION,
     key_builder=cache_key_builder,
 )
 """Cache configuration for application."""
+
+response_store = TwoTierStore(
+    response_cache,
+    stale_expiration=settings.redis.CACHE_STALE_EXPIRATION,
+    lock_timeout=settings.redis.CACHE_LOCK_TIMEOUT,
+)
+"""Store registered as the response cache store (`config.store`)."""
+
+
+def single_flight_middleware(app: ASGIApp) -> ASGIApp:
+    """Middleware that abandons the response cache flights of a request
+    once it is done.
+
+    A store only lands a flight when the response is cached, so without it
+    a request that raised, or whose response is not cached, would keep the
+    others waiting for the response until the lock times out.
+
+    Args:
+        app: The previous ASGI app in the call chain.
+
+    Returns:
+        A new ASGI app that abandons the unlanded flights of each request.
+    """
+
+    async def middleware(scope: Scope, receive: Receive, send: Send) -> None:
+        """Track and abandon the flights taken off by the request.
+
+        Args:
+            scope: ASGI connection scope.
+            receive: ASGI receive handler.
+            send: ASGI send handler.
+        """
+        if scope["type"] != "http":
+            await app(scope, receive, send)
+            return
+        taken_off: list[tuple[TwoTierStore, str, asyncio.Future[bytes | None]]] = []
+        token = _flights_taken_off.set(taken_off)
+        try:
+            await app(scope, receive, send)
+        finally:
+            _flights_taken_off.reset(token)
+            for store, key, future in taken_off:
+                await store.abandon(key, future)
+
+    return middleware
+
+
+_invalidations: set[asyncio.Task[None]] = set()
+
+
+def invalidate_after_commit(
+    session: AsyncSession | Session,
+    cache: TwoTierCache,
+    *,
+    keys: Iterable[str] = (),
+    tags: Iterable[str] = (),
+) -> None:
+    """Delete `keys` and the entries tagged with `tags` from `cache` once `session` commits.
+
+    Invalidating after the commit keeps concurrent requests from caching
+    the rows the transaction is replacing.
+    """
+    pending: dict[TwoTierCache, tuple[set[str], set[str]]] = session.info.setdefault(INVALIDATIONS_KEY, {})
+    cache_keys, cache_tags = pending.setdefault(cache, (set(), set()))
+    cache_keys.update(keys)
+    cache_tags.update(tags)
+
+
+def invalidate_tags(session: AsyncSession | Session, *tags: str) -> None:
+    """Invalidate cached responses tagged with `tags` once `session` commits."""
+    invalidate_after_commit(session, response_cache, tags=tags)
+
+
+async def _invalidate(pending: dict[TwoTierCache, tuple[set[str], set[str]]]) -> None:
+    for cache, (keys, tags) in pending.items():
+        await cache.delete(*keys)
+        await cache.invalidate_tags(*tags)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    pending: dict[TwoTierCache, tuple[set[str], set[str]]] | None = session.info.pop(INVALIDATIONS_KEY, None)
+    if not pending:
+        return
+    for cache, (keys, tags) in pending.items():
+        cache.evict_local(*keys)
+        cache.evict_local_tags(*tags)
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    task = loop.create_task(_invalidate(pending))
+    _invalidations.add(task)
+    task.add_done_callback(_invalidations.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_invalidations(session: Session) -> None:
+    session.info.pop(INVALIDATIONS_KEY, None)
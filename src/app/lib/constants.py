@@ -4,14 +4,42 @@ from __future__ import annotations
 DB_SESSION_DEPENDENCY_KEY = "db_session"
 """The name of the key used for dependency injection of the database
 session."""
+DB_PRIMARY_COOKIE = "db-primary"
+"""Cookie making a client read from the primary database right after a write."""
 USER_DEPENDENCY_KEY = "current_user"
 """The name of the key used for dependency injection of the database
 session."""
+PLUGIN_REGISTRY_STATE_KEY = "plugins"
+"""The name of the key used for storing the plugin registry in app state."""
 DTO_INFO_KEY = "info"
 """The name of the key used for storing DTO information."""
 DEFAULT_PAGINATION_SIZE = 20
 """Default page size to use."""
 CACHE_EXPIRATION: int = 60
 """Default cache key expiration in seconds."""
+BOARD_CACHE_EXPIRATION: int = 300
+"""Expiration in seconds of cached sprint board summaries."""
+LIST_CACHE_EXPIRATION: int = 60
+"""Expiration in seconds of cached, tag invalidated list responses."""
+RESPONSE_CACHE_LOCAL_EXPIRATION: float = 2.0
+"""Expiration in seconds of responses in the per-process cache."""
+RESPONSE_CACHE_LOCAL_SIZE: int = 1024
+"""Maximum number of responses kept in the per-process cache."""
+CACHE_TAG_EXPIRATION: int = 86400
+"""Expiration in seconds of the Redis key sets kept per cache tag."""
 SYSTEM_HEALTH: str = "/health"
 """Default path for the service health check endpoint."""
+USER_CACHE_EXPIRATION: int = 300
+"""Expiration in seconds of cached user snapshots in Redis."""
+USER_CACHE_LOCAL_EXPIRATION: float = 5.0
+"""Expiration in seconds of user snapshots in the per-process cache."""
+USER_CACHE_LOCAL_SIZE: int = 2048
+"""Maximum number of user snapshots kept in the per-process cache."""
+ZULIP_STREAM_CACHE_EXPIRATION: int = 3600
+"""Expiration in seconds of cached Zulip stream ids in Redis."""
+ZULIP_STREAM_CACHE_LOCAL_EXPIRATION: float = 60.0
+"""Expiration in seconds of Zulip stream ids in the per-process cache."""
+ZULIP_STREAM_CACHE_LOCAL_SIZE: int = 1024
+"""Maximum number of Zulip stream ids kept in the per-process cache."""
+ZULIP_DISPATCHER_STATS_INTERVAL: float = 15.0
+"""Seconds between updates of the Zulip dispatcher stats each process keeps in Redis."""
@@ -1,20 +1,74 @@
 from __future__ import annotations
 
+import asyncio
 import base64
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any, TypeVar
 
-from litestar.utils.sync import AsyncCallable
+from litestar.exceptions import TooManyRequestsException
 from passlib.context import CryptContext
 from pydantic import SecretBytes, SecretStr
 
-__all__ = ["get_encryption_key", "get_password_hash", "verify_password"]
+from app.lib import settings
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+__all__ = ["get_encryption_key", "get_password_hash", "on_shutdown", "verify_password"]
 
 
 logger = logging.getLogger()
 
+T = TypeVar("T")
 
 password_crypt_context = CryptContext(schemes=["argon2"], deprecated="auto")
 
+_executor: ThreadPoolExecutor | None = None
+_in_flight = 0
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor  # noqa: PLW0603
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.app.PASSWORD_HASH_WORKERS,
+            thread_name_prefix="password-hash",
+        )
+    return _executor
+
+
+async def _run_hasher(fn: Callable[..., T], **kwargs: Any) -> T:
+    """Run an argon2 call on the dedicated password hashing executor.
+
+    argon2 releases the GIL while hashing, so a small thread pool gives real
+    parallelism without taking threads from the default executor used by
+    `sync_to_thread` handlers.  Calls beyond the workers plus
+    `APP_PASSWORD_HASH_QUEUE_DEPTH` waiting ones are rejected instead of
+    queued.
+
+    Raises:
+        TooManyRequestsException: the executor is saturated.
+    """
+    global _in_flight  # noqa: PLW0603
+    if _in_flight >= settings.app.PASSWORD_HASH_WORKERS + settings.app.PASSWORD_HASH_QUEUE_DEPTH:
+        msg = "Too many concurrent logins, try again shortly."
+        raise TooManyRequestsException(msg, headers={"Retry-After": "1"})
+    _in_flight += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_get_executor(), partial(fn, **kwargs))
+    finally:
+        _in_flight -= 1
+
+
+async def on_shutdown() -> None:
+    """Stop the password hashing executor."""
+    global _executor  # noqa: PLW0603
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
 
 def get_encryption_key(secret: str) -> bytes:
     """Get Encryption Key.
@@ -40,7 +94,7 @@ async def get_password_hash(password: SecretBytes | SecretStr | str | bytes) ->
     """
     if isinstance(password, SecretBytes | SecretStr):
         password = password.get_secret_value()
-    return await AsyncCallable(password_crypt_context.hash)(secret=password)
+    return await _run_hasher(password_crypt_context.hash, secret=password)
 
 
 async def verify_password(plain_password: SecretBytes | SecretStr | str | bytes, hashed_password: str) -> bool:
@@ -55,7 +109,8 @@ async def verify_password(plain_password: SecretBytes | SecretStr | str | bytes,
     """
     if isinstance(plain_password, SecretBytes | SecretStr):
         plain_password = plain_password.get_secret_value()
-    valid, _ = await AsyncCallable(password_crypt_context.verify_and_update)(
+    valid, _ = await _run_hasher(
+        password_crypt_context.verify_and_update,
         secret=plain_password,
         hash=hashed_password,
     )
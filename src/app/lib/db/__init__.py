@@ -1,12 +1,15 @@
 """Core DB Package."""
 from __future__ import annotations
 
-from app.lib.db import orm, utils
+from app.lib.db import orm, utils, write_behind
 from app.lib.db.base import (
     async_session_factory,
     config,
     engine,
+    on_shutdown,
     plugin,
+    replica_engine,
+    replica_session_factory,
     session,
 )
 
@@ -15,7 +18,11 @@ __all__ = [
     "config",
     "plugin",
     "engine",
+    "replica_engine",
     "session",
     "async_session_factory",
+    "replica_session_factory",
+    "on_shutdown",
     "orm",
+    "write_behind",
 ]
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from contextlib import asynccontextmanager
-from typing import TYPE_CHECKING, Any
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
 
 from advanced_alchemy.config import AlembicAsyncConfig
 from advanced_alchemy.extensions.litestar.plugins.init.config import (
@@ -10,50 +11,96 @@ from advanced_alchemy.extensions.litestar.plugins.init.config import (
 from advanced_alchemy.extensions.litestar.plugins.init.config.asyncio import (
     autocommit_before_send_handler,
 )
+from advanced_alchemy.extensions.litestar.plugins.init.config.common import SESSION_SCOPE_KEY
 from advanced_alchemy.extensions.litestar.plugins.init.plugin import (
     SQLAlchemyInitPlugin,
 )
+from litestar.constants import HTTP_RESPONSE_START
+from litestar.datastructures import Cookie, MutableScopeHeaders
+from litestar.utils import get_litestar_scope_state, set_litestar_scope_state
 from sqlalchemy import event
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
 from sqlalchemy.pool import NullPool
 
 from app.lib import constants, serialization, settings
+from app.lib.log import sql
 
-__all__ = ["session"]
+__all__ = ["RoutingSession", "replica_session_factory", "session"]
 
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
+    from litestar.datastructures.state import State
+    from litestar.types import Message, Scope
+    from sqlalchemy.engine import Engine
     from sqlalchemy.ext.asyncio import AsyncSession
 
-engine = create_async_engine(
-    settings.db.URL,
-    future=True,
-    json_serializer=serialization.to_json,
-    json_deserializer=serialization.from_json,
-    echo=settings.db.ECHO,
-    echo_pool=True if settings.db.ECHO_POOL == "debug" else settings.db.ECHO_POOL,
-    max_overflow=settings.db.POOL_MAX_OVERFLOW,
-    pool_size=settings.db.POOL_SIZE,
-    pool_timeout=settings.db.POOL_TIMEOUT,
-    pool_recycle=settings.db.POOL_RECYCLE,
-    pool_pre_ping=settings.db.POOL_PRE_PING,
-    pool_use_lifo=True,  # use lifo to reduce the number of idle connections
-    poolclass=NullPool if settings.db.POOL_DISABLE else None,
-    connect_args=settings.db.CONNECT_ARGS,
-)
+REPLICA_INFO_KEY = "use_replica"
+"""Session info flag routing the reads of the session to the replica."""
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        future=True,
+        json_serializer=serialization.to_json,
+        json_deserializer=serialization.from_json,
+        echo=settings.db.ECHO,
+        echo_pool=True if settings.db.ECHO_POOL == "debug" else settings.db.ECHO_POOL,
+        max_overflow=settings.db.POOL_MAX_OVERFLOW,
+        pool_size=settings.db.POOL_SIZE,
+        pool_timeout=settings.db.POOL_TIMEOUT,
+        pool_recycle=settings.db.POOL_RECYCLE,
+        pool_pre_ping=settings.db.POOL_PRE_PING,
+        pool_use_lifo=True,  # use lifo to reduce the number of idle connections
+        poolclass=NullPool if settings.db.POOL_DISABLE else None,
+        connect_args=settings.db.CONNECT_ARGS,
+    )
+
+
+engine = _create_engine(settings.db.URL)
+replica_engine = _create_engine(settings.db.REPLICA_URL) if settings.db.REPLICA_URL else None
+"""Read replica engine, when `DB_REPLICA_URL` is set."""
+
+
+class RoutingSession(Session):
+    """Session sending the reads of replica sessions to the read replica.
+
+    A session whose `info` carries `REPLICA_INFO_KEY` runs plain SELECTs,
+    and connections requested with `bind_arguments={"replica": True}`, on
+    the replica.  Its first flush or other statement goes to the primary and
+    keeps the rest of the session there, so it reads its own writes.
+    """
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, replica: bool = False, **kw: Any) -> Engine:
+        if replica_engine is not None and self.info.get(REPLICA_INFO_KEY):
+            if not self._flushing and (replica or (clause is not None and clause.is_select)):
+                return replica_engine.sync_engine
+            self.info[REPLICA_INFO_KEY] = False
+        return super().get_bind(mapper, clause=clause, **kw)
+
+
 async_session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
     engine,
     expire_on_commit=False,
+    sync_session_class=RoutingSession,
 )
 """Database session factory.
 
 See [`async_sessionmaker()`][sqlalchemy.ext.asyncio.async_sessionmaker].
 """
+replica_session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
+    engine,
+    expire_on_commit=False,
+    sync_session_class=RoutingSession,
+    info={REPLICA_INFO_KEY: True},
+)
+"""Factory of sessions reading from the replica (the primary without one)."""
 
 
-@event.listens_for(engine.sync_engine, "connect")
 def _sqla_on_connect(dbapi_connection: Any, _: Any) -> Any:  # pragma: no cover
     """Using msgspec for serialization of the json column values means that the
     output is binary, not `str` like `json.dumps` would output.
@@ -92,11 +139,70 @@ def _sqla_on_connect(dbapi_connection: Any, _: Any) -> Any:  # pragma: no cover
     )
 
 
-config = SQLAlchemyAsyncConfig(
+for _engine in (engine, replica_engine):
+    if _engine is not None:
+        event.listen(_engine.sync_engine, "connect", _sqla_on_connect)
+        sql.instrument(_engine)
+
+
+def _reads_from_replica(scope: Scope) -> bool:
+    """Whether the request may read from the replica.
+
+    Only safe requests qualify, unless they come right after a write of the
+    same client (the primary cookie) or produce a cached response, which
+    must not be filled from a lagging replica.
+    """
+    if scope["type"] != "http" or scope["method"] not in SAFE_METHODS:
+        return False
+    route_handler = scope.get("route_handler")
+    if route_handler is not None and getattr(route_handler, "cache", False):
+        return False
+    cookie = f"{constants.DB_PRIMARY_COOKIE}=".encode()
+    return not any(name == b"cookie" and cookie in value for name, value in scope["headers"])
+
+
+async def before_send_handler(message: Message, scope: Scope) -> None:
+    """Commit the request session and make the client stick to the primary after a write."""
+    if (
+        replica_engine is not None
+        and message["type"] == HTTP_RESPONSE_START
+        and scope["method"] not in SAFE_METHODS
+        and 200 <= message["status"] < 300  # noqa: PLR2004
+        and get_litestar_scope_state(scope, SESSION_SCOPE_KEY) is not None
+    ):
+        cookie = Cookie(
+            key=constants.DB_PRIMARY_COOKIE,
+            value="1",
+            max_age=settings.db.REPLICA_STICKINESS,
+            httponly=True,
+        )
+        MutableScopeHeaders.from_message(message).add("set-cookie", cookie.to_header(header=""))
+    await autocommit_before_send_handler(message, scope)
+
+
+@dataclass
+class RoutingSQLAlchemyAsyncConfig(SQLAlchemyAsyncConfig):
+    """Opens the request session on the replica for read only requests."""
+
+    def provide_session(self, state: State, scope: Scope) -> AsyncSession:
+        session = cast("AsyncSession | None", get_litestar_scope_state(scope, SESSION_SCOPE_KEY))
+        if session is None and replica_engine is not None and _reads_from_replica(scope):
+            session = replica_session_factory()
+            set_litestar_scope_state(scope, SESSION_SCOPE_KEY, session)
+        return super().provide_session(state, scope)
+
+
+async def on_shutdown() -> None:
+    """Dispose of the replica engine."""
+    if replica_engine is not None:
+        await replica_engine.dispose()
+
+
+config = RoutingSQLAlchemyAsyncConfig(
     session_dependency_key=constants.DB_SESSION_DEPENDENCY_KEY,
     engine_instance=engine,
     session_maker=async_session_factory,
-    before_send_handler=autocommit_before_send_handler,
+    before_send_handler=before_send_handler,
     alembic_config=AlembicAsyncConfig(
         version_table_name=settings.db.MIGRATION_DDL_VERSION_TABLE,
         script_config=settings.db.MIGRATION_CONFIG,
@@ -2,20 +2,35 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from advanced_alchemy.base import AuditColumns, orm_registry
 from advanced_alchemy.base import UUIDAuditBase as TimestampedDatabaseModel
 from advanced_alchemy.base import UUIDBase as DatabaseModel
 from advanced_alchemy.repository.typing import ModelT
-from sqlalchemy import String
+from sqlalchemy import String, bindparam, case, cast, func
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import (
     Mapped,
     declarative_mixin,
     mapped_column,
 )
 
-__all__ = ["DatabaseModel", "TimestampedDatabaseModel", "orm_registry", "model_from_dict", "AuditColumns", "SlugKey"]
+from app.lib.serialization import to_json
+
+if TYPE_CHECKING:
+    from sqlalchemy import ColumnElement
+    from sqlalchemy.orm import InstrumentedAttribute
+
+__all__ = [
+    "DatabaseModel",
+    "TimestampedDatabaseModel",
+    "orm_registry",
+    "model_from_dict",
+    "jsonb_patch",
+    "AuditColumns",
+    "SlugKey",
+]
 
 
 @declarative_mixin
@@ -34,3 +49,29 @@ def model_from_dict(model: ModelT, **kwargs: Any) -> ModelT:
         if column_val is not None:
             data[column.name] = column_val
     return model(**data)  # type: ignore
+
+
+def _jsonb_object(value: dict[str, Any]) -> ColumnElement[Any]:
+    # bound as text so the JSONB column codecs do not encode the value a second time
+    return cast(bindparam(None, to_json(value).decode(), type_=String), JSONB)
+
+
+def jsonb_patch(column: InstrumentedAttribute[Any], old: Any, new: Any) -> ColumnElement[Any]:
+    """Value that moves a JSONB `column` from `old` to `new` by touching only the keys that changed.
+
+    When both are mappings this is `column - removed_keys || changed_items`,
+    so keys written concurrently by someone else survive.  A stored value
+    that is not a JSON object (such as an encoded legacy value), or a `new`
+    that is not a mapping, is replaced outright.
+    """
+    if not isinstance(new, dict):
+        return bindparam(None, new, type_=column.type)
+    if not isinstance(old, dict):
+        old = {}
+    merged: ColumnElement[Any] = column
+    removed = [key for key in old if key not in new]
+    if removed:
+        merged = merged.op("-", return_type=JSONB)(bindparam(None, removed, type_=ARRAY(String)))
+    changed = {key: value for key, value in new.items() if key not in old or old[key] != value}
+    merged = merged.op("||", return_type=JSONB)(_jsonb_object(changed))
+    return case((func.jsonb_typeof(column) == "object", merged), else_=_jsonb_object(new))
@@ -0,0 +1,137 @@
+"""Write-behind buffers for append-only rows.
+
+Rows queued on a session are written with one multi-row INSERT per model
+when the session commits, and dropped when it rolls back.  With
+`DB_WRITE_BEHIND_BACKGROUND` enabled, committed rows are instead handed to
+an in-process flusher that batches them across requests; those rows are
+lost if the process dies before the next flush.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import event, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.lib import log, settings
+from app.lib.db.base import async_session_factory
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.lib.db.orm import DatabaseModel
+
+__all__ = ["WriteBehindFlusher", "flusher", "queue"]
+
+PENDING_KEY = "write_behind_pending"
+COMMITTED_KEY = "write_behind_committed"
+
+logger = log.get_logger()
+
+Rows = dict[type["DatabaseModel"], list[dict[str, Any]]]
+
+
+def queue(session: AsyncSession | Session, model: type[DatabaseModel], rows: list[dict[str, Any]]) -> None:
+    """Buffer `rows` of `model` until `session` commits."""
+    if rows:
+        session.info.setdefault(PENDING_KEY, defaultdict(list))[model].extend(rows)
+
+
+class WriteBehindFlusher:
+    """Batches committed rows from many sessions into periodic INSERTs."""
+
+    def __init__(self) -> None:
+        self._pending: Rows = defaultdict(list)
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def put(self, rows: Rows) -> None:
+        for model, model_rows in rows.items():
+            self._pending[model].extend(model_rows)
+        if sum(len(model_rows) for model_rows in self._pending.values()) >= settings.db.WRITE_BEHIND_BATCH_SIZE:
+            self._wakeup.set()
+
+    async def startup(self) -> None:
+        if settings.db.WRITE_BEHIND_BACKGROUND and not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def shutdown(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        pending, self._pending = self._pending, defaultdict(list)
+        if not pending:
+            return
+        async with async_session_factory() as db_session:
+            try:
+                for model, rows in pending.items():
+                    await db_session.execute(insert(model), rows)
+                await db_session.commit()
+            except IntegrityError:
+                # e.g. the parent row was deleted before the flush; keep the rest of the batch
+                await db_session.rollback()
+                await self._flush_rows(db_session, pending)
+            except Exception:
+                logger.exception("Dropped write-behind rows", count=sum(len(rows) for rows in pending.values()))
+
+    async def _flush_rows(self, db_session: AsyncSession, pending: Rows) -> None:
+        dropped = 0
+        for model, rows in pending.items():
+            for row in rows:
+                try:
+                    async with db_session.begin_nested():
+                        await db_session.execute(insert(model), [row])
+                except IntegrityError:
+                    dropped += 1
+        await db_session.commit()
+        if dropped:
+            logger.warning("Dropped write-behind rows", count=dropped)
+
+    async def _run(self) -> None:
+        while True:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=settings.db.WRITE_BEHIND_INTERVAL)
+            self._wakeup.clear()
+            await self.flush()
+
+
+flusher = WriteBehindFlusher()
+"""Process wide background flusher, started with the application."""
+
+
+@event.listens_for(Session, "before_commit")
+def _write_pending(session: Session) -> None:
+    pending: Rows | None = session.info.pop(PENDING_KEY, None)
+    if not pending:
+        return
+    if flusher.running:
+        session.info[COMMITTED_KEY] = pending
+        return
+    for model, rows in pending.items():
+        session.execute(insert(model), rows)
+
+
+@event.listens_for(Session, "after_commit")
+def _hand_off_committed(session: Session) -> None:
+    committed: Rows | None = session.info.pop(COMMITTED_KEY, None)
+    if committed:
+        flusher.put(committed)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(PENDING_KEY, None)
+    session.info.pop(COMMITTED_KEY, None)
@@ -8,27 +8,36 @@ from uuid import UUID
 from advanced_alchemy.filters import (
     BeforeAfter,
     CollectionFilter,
-    FilterTypes,
     LimitOffset,
     OrderBy,
     SearchFilter,
 )
 from litestar.di import Provide
+from litestar.exceptions import ValidationException
 from litestar.params import Dependency, Parameter
 
 from app.lib import constants
+from app.lib.filters import ArrayFilter, FilterTypes
+from app.lib.pagination import KeysetPagination
 
 __all__ = [
     "create_collection_dependencies",
     "provide_created_filter",
     "provide_filter_dependencies",
     "provide_id_filter",
+    "provide_if_match_version",
+    "provide_labels_all_filter",
+    "provide_labels_any_filter",
+    "provide_labeled_filter_dependencies",
+    "provide_keyset_pagination",
     "provide_limit_offset_pagination",
     "provide_updated_filter",
     "provide_search_filter",
     "provide_order_by",
+    "ArrayFilter",
     "BeforeAfter",
     "CollectionFilter",
+    "KeysetPagination",
     "LimitOffset",
     "OrderBy",
     "SearchFilter",
@@ -37,6 +46,7 @@ __all__ = [
 
 DTorNone = datetime | None
 StringOrNone = str | None
+StringListOrNone = list[str] | None
 UuidOrNone = UUID | None
 BooleanOrNone = bool | None
 SortOrderOrNone = Literal["asc", "desc"] | None
@@ -45,9 +55,14 @@ FILTERS_DEPENDENCY_KEY = "filters"
 CREATED_FILTER_DEPENDENCY_KEY = "created_filter"
 ID_FILTER_DEPENDENCY_KEY = "id_filter"
 LIMIT_OFFSET_DEPENDENCY_KEY = "limit_offset"
+KEYSET_PAGINATION_DEPENDENCY_KEY = "keyset"
 UPDATED_FILTER_DEPENDENCY_KEY = "updated_filter"
 ORDER_BY_DEPENDENCY_KEY = "order_by"
 SEARCH_FILTER_DEPENDENCY_KEY = "search_filter"
+LABELS_ANY_FILTER_DEPENDENCY_KEY = "labels_any_filter"
+LABELS_ALL_FILTER_DEPENDENCY_KEY = "labels_all_filter"
+LABELED_FILTERS_DEPENDENCY_KEY = "labeled_filters"
+IF_MATCH_VERSION_DEPENDENCY_KEY = "if_match_version"
 
 
 def provide_id_filter(
@@ -67,6 +82,37 @@ def provide_id_filter(
     return CollectionFilter(field_name="id", values=ids or [])
 
 
+def provide_if_match_version(
+    if_match: StringOrNone = Parameter(header="If-Match", default=None, required=False),
+) -> int | None:
+    """Return the row version a conditional update expects.
+
+    Parameters
+    ----------
+    if_match : str | None
+        `ETag` sent back by the client, as returned by `app.utils.entity_tag`.
+
+    Returns:
+    -------
+    int | None
+        The version, or `None` when the update is unconditional.  Tags that
+        are not a version never match, so they give `0`.
+
+    Raises:
+    ------
+    ValidationException
+        The header lists more than one `ETag`; a row has one version.
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+    tags = [tag.strip() for tag in if_match.split(",") if tag.strip()]
+    if len(tags) > 1:
+        msg = "If-Match must carry a single ETag"
+        raise ValidationException(msg)
+    tag = tags[0].removeprefix("W/").strip('"') if tags else ""
+    return int(tag) if tag.isdigit() else 0
+
+
 def provide_created_filter(
     before: DTorNone = Parameter(query="createdBefore", default=None, required=False),
     after: DTorNone = Parameter(query="createdAfter", default=None, required=False),
@@ -107,6 +153,46 @@ def provide_search_filter(
     return SearchFilter(field_name=field, value=search, ignore_case=ignore_case or False)  # type: ignore[arg-type]
 
 
+def provide_labels_any_filter(
+    labels_any: StringListOrNone = Parameter(
+        title="Has any of the labels",
+        query="labelsAny",
+        default=None,
+        required=False,
+    ),
+) -> ArrayFilter[str]:
+    """Add labels filter matching any of the labels.
+
+    Return type consumed by `Repository._filter_by_array()` (`labels && :labels_any`).
+
+    Parameters
+    ----------
+    labels_any : list[str] | None
+        Records with at least one of these labels.
+    """
+    return ArrayFilter(field_name="labels", values=labels_any or [])
+
+
+def provide_labels_all_filter(
+    labels_all: StringListOrNone = Parameter(
+        title="Has all of the labels",
+        query="labelsAll",
+        default=None,
+        required=False,
+    ),
+) -> ArrayFilter[str]:
+    """Add labels filter matching all of the labels.
+
+    Return type consumed by `Repository._filter_by_array()` (`labels @> :labels_all`).
+
+    Parameters
+    ----------
+    labels_all : list[str] | None
+        Records with every one of these labels.
+    """
+    return ArrayFilter(field_name="labels", values=labels_all or [], match_all=True)
+
+
 def provide_order_by(
     field_name: StringOrNone = Parameter(title="Order by field", query="orderBy", default=None, required=False),
     sort_order: SortOrderOrNone = Parameter(title="Field to search", query="sortOrder", default="desc", required=False),
@@ -166,6 +252,29 @@ def provide_limit_offset_pagination(
     return LimitOffset(page_size, page_size * (current_page - 1))
 
 
+def provide_keyset_pagination(
+    cursor: StringOrNone = Parameter(title="Pagination cursor", query="cursor", default=None, required=False),
+    page_size: int = Parameter(
+        query="pageSize",
+        ge=1,
+        default=constants.DEFAULT_PAGINATION_SIZE,
+        required=False,
+    ),
+) -> KeysetPagination:
+    """Add keyset pagination.
+
+    Return type consumed by `SQLAlchemyAsyncRepositoryService.list_keyset()`.
+
+    Parameters
+    ----------
+    cursor : str | None
+        Cursor returned with the previous page, omit for the first page.
+    page_size : int
+        LIMIT to apply to select.
+    """
+    return KeysetPagination(limit=page_size, cursor=cursor)
+
+
 def provide_filter_dependencies(
     created_filter: BeforeAfter = Dependency(skip_validation=True),
     updated_filter: BeforeAfter = Dependency(skip_validation=True),
@@ -213,6 +322,36 @@ def provide_filter_dependencies(
     return filters
 
 
+def provide_labeled_filter_dependencies(
+    filters: list[FilterTypes] = Dependency(skip_validation=True),
+    labels_any_filter: ArrayFilter = Dependency(skip_validation=True),
+    labels_all_filter: ArrayFilter = Dependency(skip_validation=True),
+) -> list[FilterTypes]:
+    """Provide the collection route filters plus the labels filters.
+
+    Only for routes of models with a `labels` array column, e.g:
+
+        @get
+        def get_collection_handler(labeled_filters: list[FilterTypes]) -> ...:
+            ...
+
+    Parameters
+    ----------
+    filters : list[FilterTypes]
+        Common collection route filters.
+    labels_any_filter : ArrayFilter
+        Filter for records with any of the labels.
+    labels_all_filter : ArrayFilter
+        Filter for records with all of the labels.
+
+    Returns:
+    -------
+    list[FilterTypes]
+        List of filters parsed from connection.
+    """
+    return [*filters, *(labels for labels in (labels_any_filter, labels_all_filter) if labels.values)]
+
+
 def create_collection_dependencies() -> dict[str, Provide]:
     """Create ORM dependencies.
 
@@ -224,10 +363,15 @@ def create_collection_dependencies() -> dict[str, Provide]:
     """
     return {
         LIMIT_OFFSET_DEPENDENCY_KEY: Provide(provide_limit_offset_pagination, sync_to_thread=False),
+        KEYSET_PAGINATION_DEPENDENCY_KEY: Provide(provide_keyset_pagination, sync_to_thread=False),
         UPDATED_FILTER_DEPENDENCY_KEY: Provide(provide_updated_filter, sync_to_thread=False),
         CREATED_FILTER_DEPENDENCY_KEY: Provide(provide_created_filter, sync_to_thread=False),
         ID_FILTER_DEPENDENCY_KEY: Provide(provide_id_filter, sync_to_thread=False),
         SEARCH_FILTER_DEPENDENCY_KEY: Provide(provide_search_filter, sync_to_thread=False),
         ORDER_BY_DEPENDENCY_KEY: Provide(provide_order_by, sync_to_thread=False),
+        LABELS_ANY_FILTER_DEPENDENCY_KEY: Provide(provide_labels_any_filter, sync_to_thread=False),
+        LABELS_ALL_FILTER_DEPENDENCY_KEY: Provide(provide_labels_all_filter, sync_to_thread=False),
         FILTERS_DEPENDENCY_KEY: Provide(provide_filter_dependencies, sync_to_thread=False),
+        LABELED_FILTERS_DEPENDENCY_KEY: Provide(provide_labeled_filter_dependencies, sync_to_thread=False),
+        IF_MATCH_VERSION_DEPENDENCY_KEY: Provide(provide_if_match_version, sync_to_thread=False),
     }
@@ -17,7 +17,7 @@ from litestar.exceptions import (
 from litestar.middleware.exceptions._debug_response import create_debug_response
 from litestar.middleware.exceptions.middleware import create_exception_response
 from litestar.repository.exceptions import ConflictError, NotFoundError, RepositoryError
-from litestar.status_codes import HTTP_409_CONFLICT, HTTP_500_INTERNAL_SERVER_ERROR
+from litestar.status_codes import HTTP_409_CONFLICT, HTTP_412_PRECONDITION_FAILED, HTTP_500_INTERNAL_SERVER_ERROR
 from structlog.contextvars import bind_contextvars
 
 if TYPE_CHECKING:
@@ -30,6 +30,8 @@ if TYPE_CHECKING:
 
 __all__ = (
     "AuthorizationError",
+    "ConcurrentUpdateError",
+    "PreconditionFailedError",
     "HealthCheckConfigurationError",
     "ApplicationError",
     "after_exception_hook_handler",
@@ -48,6 +50,14 @@ class AuthorizationError(ApplicationClientError):
     """A user tried to do something they shouldn't have."""
 
 
+class ConcurrentUpdateError(ApplicationClientError):
+    """The row was updated by someone else while it was being updated."""
+
+
+class PreconditionFailedError(ApplicationClientError):
+    """The row no longer has the version the client read (`If-Match`)."""
+
+
 class HealthCheckConfigurationError(ApplicationError):
     """An error occurred while registering an health check."""
 
@@ -58,6 +68,12 @@ class _HTTPConflictException(HTTPException):
     status_code = HTTP_409_CONFLICT
 
 
+class _HTTPPreconditionFailedException(HTTPException):
+    """The precondition of a conditional request does not hold."""
+
+    status_code = HTTP_412_PRECONDITION_FAILED
+
+
 async def after_exception_hook_handler(exc: Exception, _scope: Scope) -> None:
     """Binds `exc_info` key with exception instance as value to structlog
     context vars.
@@ -91,7 +107,9 @@ def exception_to_http_response(
     http_exc: type[HTTPException]
     if isinstance(exc, NotFoundError):
         http_exc = NotFoundException
-    elif isinstance(exc, ConflictError | RepositoryError):
+    elif isinstance(exc, PreconditionFailedError):
+        http_exc = _HTTPPreconditionFailedException
+    elif isinstance(exc, ConflictError | RepositoryError | ConcurrentUpdateError):
         http_exc = _HTTPConflictException
     elif isinstance(exc, AuthorizationError):
         http_exc = PermissionDeniedException
@@ -99,4 +117,4 @@ def exception_to_http_response(
         http_exc = InternalServerException
     if request.app.debug:
         return create_debug_response(request, exc)
-    return create_exception_response(request, http_exc(detail=str(exc.__cause__)))
+    return create_exception_response(request, http_exc(detail=str(exc.__cause__ or exc)))
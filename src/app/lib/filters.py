@@ -0,0 +1,37 @@
+"""Collection filters beyond the ones shipped with advanced-alchemy."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Generic, TypeAlias, TypeVar
+
+if TYPE_CHECKING:
+    from advanced_alchemy.filters import (
+        BeforeAfter,
+        CollectionFilter,
+        LimitOffset,
+        NotInCollectionFilter,
+        NotInSearchFilter,
+        OnBeforeAfter,
+        OrderBy,
+        SearchFilter,
+    )
+
+__all__ = ["ArrayFilter", "FilterTypes"]
+
+T = TypeVar("T")
+
+
+@dataclass
+class ArrayFilter(Generic[T]):
+    """Match rows on the elements of a Postgres `ARRAY` column."""
+
+    field_name: str
+    """Name of the array column."""
+    values: list[T]
+    """Elements to look for, the filter is skipped when empty."""
+    match_all: bool = False
+    """Require every value (`@>`) instead of any of them (`&&`)."""
+
+
+FilterTypes: TypeAlias = "BeforeAfter | OnBeforeAfter | CollectionFilter[Any] | LimitOffset | OrderBy | SearchFilter | NotInCollectionFilter[Any] | NotInSearchFilter | ArrayFilter[Any]"  # noqa: E501
+"""Aggregate type alias of the types supported for collection filtering."""
@@ -11,7 +11,7 @@ from litestar.logging.config import LoggingConfig
 
 from app.lib import settings
 
-from . import controller, worker
+from . import controller, sql, worker
 from .utils import EventFilter, msgspec_json_renderer
 
 if TYPE_CHECKING:
@@ -26,6 +26,7 @@ __all__ = (
     "config",
     "configure",
     "controller",
+    "sql",
     "worker",
 )
 
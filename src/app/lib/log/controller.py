@@ -14,6 +14,7 @@ from typing import TYPE_CHECKING
 import structlog
 from litestar.constants import SCOPE_STATE_RESPONSE_COMPRESSED
 from litestar.data_extractors import ConnectionDataExtractor, ResponseDataExtractor
+from litestar.datastructures import MutableScopeHeaders
 from litestar.enums import ScopeType
 from litestar.status_codes import (
     HTTP_200_OK,
@@ -24,14 +25,17 @@ from litestar.utils.scope import get_litestar_scope_state
 
 from app.lib import constants, settings
 
-__all__ = ["BeforeSendHandler", "drop_health_logs", "middleware_factory"]
+from . import sql
+
+__all__ = ["BeforeSendHandler", "drop_health_logs", "middleware_factory", "on_app_init"]
 
 
 if TYPE_CHECKING:
     from typing import Any, Literal
 
+    from litestar.config.app import AppConfig
     from litestar.connection import Request
-    from litestar.types.asgi_types import ASGIApp, Message, Receive, Scope, Send
+    from litestar.types.asgi_types import ASGIApp, HTTPResponseStartEvent, Message, Receive, Scope, Send
     from structlog.types import EventDict, WrappedLogger
 
 LOGGER = structlog.get_logger()
@@ -61,7 +65,8 @@ def drop_health_logs(_: WrappedLogger, __: str, event_dict: EventDict) -> EventD
 
 
 def middleware_factory(app: ASGIApp) -> ASGIApp:
-    """Middleware to ensure that every request has a clean structlog context.
+    """Middleware to ensure that every request has a clean structlog context
+    and its own SQL statement statistics.
 
     Args:
         app: The previous ASGI app in the call chain.
@@ -79,11 +84,30 @@ def middleware_factory(app: ASGIApp) -> ASGIApp:
             send: ASGI send handler.
         """
         structlog.contextvars.clear_contextvars()
+        sql.start()
         await app(scope, receive, send)
 
     return middleware
 
 
+def on_app_init(app_config: AppConfig) -> AppConfig:
+    """Move the logging middleware in front of the others.
+
+    Authentication is then part of the logged request, including its SQL
+    statements.
+
+    Args:
+        app_config: The application config.
+
+    Returns:
+        The application config.
+    """
+    if middleware_factory in app_config.middleware:
+        app_config.middleware.remove(middleware_factory)
+        app_config.middleware.insert(0, middleware_factory)
+    return app_config
+
+
 class BeforeSendHandler:
     """Extraction of request and response data from connection scope."""
 
@@ -91,6 +115,8 @@ class BeforeSendHandler:
         "do_log_request",
         "do_log_response",
         "exclude_paths",
+        "server_timing",
+        "sql_repeat_threshold",
         "include_compressed_body",
         "logger",
         "request_extractor",
@@ -103,6 +129,8 @@ class BeforeSendHandler:
         self.do_log_request = bool(settings.log.REQUEST_FIELDS)
         self.do_log_response = bool(settings.log.RESPONSE_FIELDS)
         self.include_compressed_body = settings.log.INCLUDE_COMPRESSED_BODY
+        self.server_timing = settings.log.SERVER_TIMING
+        self.sql_repeat_threshold = settings.log.SQL_REPEAT_THRESHOLD
         self.request_extractor = ConnectionDataExtractor(
             extract_body="body" in settings.log.REQUEST_FIELDS,
             extract_client="client" in settings.log.REQUEST_FIELDS,
@@ -143,6 +171,7 @@ class BeforeSendHandler:
                 logging.ERROR if message["status"] >= HTTP_500_INTERNAL_SERVER_ERROR else logging.INFO
             )
             scope["state"][HTTP_RESPONSE_START] = message
+            await self.log_queries(message)
         # ignore intermediate content of streaming responses for now.
         elif message["type"] == HTTP_RESPONSE_BODY and message["more_body"] is False:
             scope["state"][HTTP_RESPONSE_BODY] = message
@@ -158,6 +187,28 @@ class BeforeSendHandler:
                 structlog.contextvars.clear_contextvars()
                 await LOGGER.aerror("Error in logging before-send handler!", exc_info=exc)
 
+    async def log_queries(self, message: HTTPResponseStartEvent) -> None:
+        """Report the SQL statements of the request.
+
+        Adds the statement count and time to the log context and the
+        `Server-Timing` header, and warns about statements repeated more
+        than `LOG_SQL_REPEAT_THRESHOLD` times.
+
+        Args:
+            message: The response start event.
+        """
+        stats = sql.current()
+        if stats is None:
+            return
+        structlog.contextvars.bind_contextvars(
+            db={"queries": stats.count, "duration_ms": round(stats.duration * 1000, 1)}
+        )
+        if self.server_timing:
+            # replaces the header replayed from cached responses
+            MutableScopeHeaders.from_message(message)["server-timing"] = stats.server_timing()
+        for statement, count in stats.repeated(self.sql_repeat_threshold):
+            await LOGGER.awarning("Repeated SQL statement, possible N+1 query", statement=statement, count=count)
+
     async def log_request(self, scope: Scope) -> None:
         """Handle extracting the request data and logging the message.
 
@@ -0,0 +1,88 @@
+"""Per-request SQL statement statistics.
+
+`instrument` hooks an engine so that every statement executed while a
+request is being handled is counted and timed on the `QueryStats` of that
+request.  Statements are grouped by shape (their SQL with bind parameter
+lists collapsed), which makes N+1 patterns stand out as one shape executed
+many times.
+"""
+from __future__ import annotations
+
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+from sqlalchemy import event
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from sqlalchemy.engine import Connection, ExceptionContext
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+__all__ = ["QueryStats", "current", "instrument", "start"]
+
+_PARAMETERS = re.compile(r"\$\d+(?:, \$\d+)*")
+_START_TIMES_KEY = "query_start_times"
+
+_query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+class QueryStats:
+    """Statements executed while handling one request."""
+
+    __slots__ = ("count", "duration", "shapes")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+        self.shapes: Counter[str] = Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.shapes[_PARAMETERS.sub("?", statement)] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statement shapes executed more than `threshold` times, most frequent first."""
+        return [(shape, count) for shape, count in self.shapes.most_common() if count > threshold]
+
+    def server_timing(self) -> str:
+        """`Server-Timing` header value."""
+        return f'db;dur={self.duration * 1000:.1f};desc="{self.count} queries"'
+
+
+def start() -> QueryStats:
+    """Collect the statements of the current context on fresh stats."""
+    stats = QueryStats()
+    _query_stats.set(stats)
+    return stats
+
+
+def current() -> QueryStats | None:
+    return _query_stats.get()
+
+
+def _before_cursor_execute(conn: Connection, *_: Any) -> None:
+    conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn: Connection, _: Any, statement: str, *__: Any) -> None:
+    started = conn.info[_START_TIMES_KEY].pop()
+    stats = _query_stats.get()
+    if stats is not None:
+        stats.record(statement, time.perf_counter() - started)
+
+
+def _handle_error(context: ExceptionContext) -> None:
+    if context.connection is not None and context.connection.info.get(_START_TIMES_KEY):
+        context.connection.info[_START_TIMES_KEY].pop()
+
+
+def instrument(engine: AsyncEngine) -> None:
+    """Record the statements executed by `engine` on the stats of the current request."""
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine.sync_engine, "handle_error", _handle_error)
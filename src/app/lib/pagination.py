@@ -0,0 +1,45 @@
+"""Keyset (cursor) pagination."""
+from __future__ import annotations
+
+import binascii
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+import msgspec
+from litestar.exceptions import ValidationException
+
+if TYPE_CHECKING:
+    from app.lib.db import orm
+
+__all__ = ["KeysetPagination", "decode_cursor", "encode_cursor"]
+
+
+@dataclass
+class KeysetPagination:
+    """Seek pagination over rows ordered by `updated_at DESC, id DESC`."""
+
+    limit: int
+    """Maximum number of rows in a page."""
+    cursor: str | None = None
+    """Cursor returned with the previous page, `None` for the first page."""
+
+
+def encode_cursor(obj: orm.TimestampedDatabaseModel) -> str:
+    """Opaque cursor pointing just past `obj`."""
+    return urlsafe_b64encode(msgspec.json.encode((obj.updated_at, obj.id))).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor produced by `encode_cursor`.
+
+    Raises:
+        ValidationException: the cursor was not issued by this API.
+    """
+    try:
+        return msgspec.json.decode(urlsafe_b64decode(cursor), type=tuple[datetime, UUID])
+    except (binascii.Error, ValueError, msgspec.DecodeError) as e:
+        msg = "Invalid pagination cursor"
+        raise ValidationException(msg) from e
@@ -1,15 +1,30 @@
+import asyncio
+import importlib
+import math
+import pkgutil
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from collections.abc import Awaitable, Callable, Iterable
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, ClassVar
 from uuid import UUID
 
+from app.lib import constants, log, settings
+
 if TYPE_CHECKING:
+    from litestar.config.app import AppConfig
+
     from app.domain.projects.models import Project
     from app.domain.sprintlogs.models import SprintLog
 
-__all__ = ["SprintlogPlugin", "ProjectPlugin"]
+__all__ = ["SprintlogPlugin", "ProjectPlugin", "PluginRegistry", "gather_hooks", "on_app_init", "registry"]
+
+logger = log.get_logger()
 
 
 class SprintlogPlugin(ABC):
+    hook_timeout: ClassVar[float | None] = None
+    """Seconds each `after_*` hook may run, `PLUGIN_HOOK_TIMEOUT` when `None` and unbounded when `math.inf`."""
+
     @abstractmethod
     async def before_create(self, data: "SprintLog") -> "SprintLog":
         return data
@@ -45,6 +60,9 @@ class SprintlogPlugin(ABC):
 
 
 class ProjectPlugin(ABC):
+    hook_timeout: ClassVar[float | None] = None
+    """Seconds each `after_*` hook may run, `PLUGIN_HOOK_TIMEOUT` when `None` and unbounded when `math.inf`."""
+
     @abstractmethod
     async def before_create(self, data: "Project") -> "Project":
         return data
@@ -73,3 +91,184 @@ class ProjectPlugin(ABC):
     @abstractmethod
     async def after_delete(self, data: "Project") -> "Project":
         return data
+
+
+async def gather_hooks(
+    plugins: Iterable[SprintlogPlugin | ProjectPlugin],
+    hook: str,
+    *,
+    suppress_errors: bool = False,
+    **kwargs: Any,
+) -> list[Any]:
+    """Run the `hook` method of every plugin concurrently.
+
+    Meant for the `after_*` hooks, whose results do not feed each other;
+    `before_*` hooks are awaited in plugin order by the services.  Each hook
+    is cancelled after the `hook_timeout` of its plugin, `math.inf` leaves it
+    to the plugin's own timeouts.  A hook that fails or times out does not
+    stop the others: once every hook is done the failures are raised together
+    as an `ExceptionGroup`, so the outbox retries the event.  With
+    `suppress_errors` they are only logged and give `None`.
+    Hooks share the instance they are given, so they should set their own
+    `plugin_meta` keys rather than replace the mapping.  A retried event runs
+    every hook again, so hooks should check `plugin_meta` for work already done.
+
+    Returns:
+        The hook results, in plugin order.
+
+    Raises:
+        ExceptionGroup: The hooks that failed, unless `suppress_errors` is set.
+    """
+
+    async def run(plugin: SprintlogPlugin | ProjectPlugin) -> Any:
+        timeout = settings.plugin.HOOK_TIMEOUT if plugin.hook_timeout is None else plugin.hook_timeout
+        try:
+            return await asyncio.wait_for(getattr(plugin, hook)(**kwargs), None if math.isinf(timeout) else timeout)
+        except Exception as exc:  # noqa: BLE001
+            await logger.aerror("Plugin hook failed", plugin=type(plugin).__name__, hook=hook, exc_info=exc)
+            failures.append(exc)
+            return None
+
+    failures: list[Exception] = []
+    results = await asyncio.gather(*(run(plugin) for plugin in plugins))
+    if failures and not suppress_errors:
+        msg = f"{len(failures)} plugin {hook} hook(s) failed"
+        raise ExceptionGroup(msg, failures)
+    return results
+
+
+class PluginRegistry:
+    """Plugin instances discovered from the `app.plugins` package.
+
+    Discovery imports every enabled plugin module and instantiates each
+    `SprintlogPlugin` / `ProjectPlugin` subclass it defines.  This is done
+    once and the instances are shared by every request, so plugins must not
+    keep per-request state on `self`.
+
+    A plugin module may also define async `on_startup` / `on_shutdown`
+    functions to manage process wide resources such as HTTP clients, an async
+    `health` function whose mapping is reported by the health check, and list
+    async functions in `tasks` to run them as worker jobs through
+    `run_plugin_task`.
+    """
+
+    __slots__ = ("package", "enabled", "modules", "sprintlog", "project", "_loaded")
+
+    def __init__(self, package: str = "app.plugins", enabled: Iterable[str] | None = None) -> None:
+        self.package = package
+        self.enabled = enabled
+        self.modules: tuple[ModuleType, ...] = ()
+        self.sprintlog: tuple[SprintlogPlugin, ...] = ()
+        self.project: tuple[ProjectPlugin, ...] = ()
+        self._loaded = False
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def names(self) -> list[str]:
+        """Class names of the active plugins."""
+        return [type(obj).__name__ for obj in (*self.sprintlog, *self.project)]
+
+    def load(self) -> "PluginRegistry":
+        """Discover plugins if that has not happened yet."""
+        if not self._loaded:
+            self._discover(reload_modules=False)
+        return self
+
+    def reload(self) -> "PluginRegistry":
+        """Re-import the enabled plugin modules and rebuild every instance."""
+        self._discover(reload_modules=True)
+        return self
+
+    def task(self, name: str) -> Callable[..., Awaitable[Any]]:
+        """The task `<module>.<function>` listed in the `tasks` of a loaded plugin module.
+
+        Raises:
+            LookupError: When no loaded module lists the task.
+        """
+        module_name, _, function = name.rpartition(".")
+        for module in self.modules:
+            if module.__name__ == f"{self.package}.{module_name}":
+                for task in getattr(module, "tasks", ()):
+                    if task.__name__ == function:
+                        return task
+        msg = f"Unknown plugin task {name!r}"
+        raise LookupError(msg)
+
+    async def startup(self) -> None:
+        """Run the `on_startup` hook of each loaded plugin module."""
+        await self._run_hooks("on_startup")
+
+    async def shutdown(self) -> None:
+        """Run the `on_shutdown` hook of each loaded plugin module."""
+        await self._run_hooks("on_shutdown")
+
+    async def health(self) -> dict[str, Any]:
+        """Result of the `health` function of each loaded plugin module, by module name."""
+        status: dict[str, Any] = {}
+        for module in self.modules:
+            hook = getattr(module, "health", None)
+            if hook is None:
+                continue
+            name = module.__name__.rpartition(".")[2]
+            try:
+                status[name] = await hook()
+            except Exception as exc:  # noqa: BLE001
+                await logger.aerror("Plugin health check failed", plugin=name, exc_info=exc)
+                status[name] = {"status": "offline"}
+        return status
+
+    async def _run_hooks(self, name: str) -> None:
+        for module in self.modules:
+            hook = getattr(module, name, None)
+            if hook is not None:
+                await hook()
+
+    def _discover(self, reload_modules: bool) -> None:
+        enabled = set(self.enabled if self.enabled is not None else settings.plugin.ENABLED)
+        package = importlib.import_module(self.package)
+        modules: list[ModuleType] = []
+        sprintlog: list[SprintlogPlugin] = []
+        project: list[ProjectPlugin] = []
+        for _, name, _ in pkgutil.iter_modules(package.__path__):
+            if name not in enabled:
+                continue
+            module = importlib.import_module(f"{self.package}.{name}")
+            if reload_modules:
+                module = importlib.reload(module)
+            modules.append(module)
+            sprintlog.extend(_instances_of(module, SprintlogPlugin))
+            project.extend(_instances_of(module, ProjectPlugin))
+        self.modules = tuple(modules)
+        self.sprintlog = tuple(sprintlog)
+        self.project = tuple(project)
+        self._loaded = True
+
+
+def _instances_of(module: ModuleType, base: type) -> list[Any]:
+    return [
+        obj()
+        for obj in vars(module).values()
+        if isinstance(obj, type) and issubclass(obj, base) and obj is not base and obj.__module__ == module.__name__
+    ]
+
+
+registry = PluginRegistry()
+"""Process wide plugin registry.
+
+Loaded on application init and exposed on `app.state`; background workers
+load it lazily on first use.
+"""
+
+
+def on_app_init(app_config: "AppConfig") -> "AppConfig":
+    """Executes on application init.
+
+    Loads the plugin registry into app state and ties the plugin module hooks
+    to the application lifespan.
+    """
+    app_config.state[constants.PLUGIN_REGISTRY_STATE_KEY] = registry.load()
+    app_config.on_startup.append(registry.startup)
+    app_config.on_shutdown.append(registry.shutdown)
+    return app_config
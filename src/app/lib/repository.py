@@ -4,14 +4,26 @@ import random
 import string
 from typing import TYPE_CHECKING, Any
 
-from advanced_alchemy.repository import SQLAlchemyAsyncRepository
+from advanced_alchemy.exceptions import RepositoryError
+from advanced_alchemy.repository import SQLAlchemyAsyncRepository as _SQLAlchemyAsyncRepository
+from advanced_alchemy.repository._util import get_instrumented_attr, wrap_sqlalchemy_exception
 from advanced_alchemy.repository.typing import ModelT
 from litestar.repository.handlers import on_app_init as _on_app_init
+from sqlalchemy import inspect, type_coerce
+from sqlalchemy.orm import MANYTOONE
+from sqlalchemy.orm.exc import StaleDataError
 
+from app.lib.exceptions import ConcurrentUpdateError, PreconditionFailedError
+from app.lib.filters import ArrayFilter
 from app.utils import slugify
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from litestar.config.app import AppConfig
+    from sqlalchemy import ColumnElement, StatementLambdaElement
+
+    from app.lib.filters import FilterTypes
 __all__ = ["SQLAlchemyAsyncRepository", "SQLAlchemyAsyncSlugRepository", "on_app_init"]
 
 
@@ -26,6 +38,111 @@ def on_app_init(app_config: "AppConfig") -> "AppConfig":
     return _on_app_init(app_config)
 
 
+class SQLAlchemyAsyncRepository(_SQLAlchemyAsyncRepository[ModelT]):
+    """Extends the repository with the application's own filter types."""
+
+    def _apply_filters(
+        self,
+        *filters: FilterTypes | ColumnElement[bool],
+        apply_pagination: bool = True,
+        statement: StatementLambdaElement,
+    ) -> StatementLambdaElement:
+        remaining = []
+        for filter_ in filters:
+            if isinstance(filter_, ArrayFilter):
+                statement = self._filter_by_array(
+                    filter_.field_name,
+                    filter_.values,
+                    match_all=filter_.match_all,
+                    statement=statement,
+                )
+            else:
+                remaining.append(filter_)
+        return super()._apply_filters(*remaining, apply_pagination=apply_pagination, statement=statement)
+
+    async def update_versioned(self, data: ModelT, version: int | None = None) -> tuple[ModelT, dict[str, Any]]:
+        """Update the row of `data` with one SELECT and one UPDATE.
+
+        The row is loaded once, with its eager relationships, and `data` is
+        merged into it, so the flush writes only the columns that changed.
+        For models mapped with a `version_id_col` the UPDATE is guarded by
+        the loaded version and bumps it.  Relationships whose foreign keys
+        changed are reloaded.
+
+        Args:
+            data: Instance carrying the id of the row and its new values.
+            version: Version the client read, if the update is conditional.
+
+        Returns:
+            The updated instance and the column values of the row before the update.
+
+        Raises:
+            PreconditionFailedError: The row is not at `version`.
+            ConcurrentUpdateError: The row was updated after it was loaded.
+        """
+        with wrap_sqlalchemy_exception():
+            instance = await self.get(self.get_id_attribute_value(data))
+            old_data = instance.to_dict()
+            mapper = inspect(instance).mapper
+            if version is not None and mapper.version_id_col is not None:
+                current = old_data[mapper.get_property_by_column(mapper.version_id_col).key]
+                if current != version:
+                    msg = f"{self.model_type.__name__} is at version {current}, not {version}"
+                    raise PreconditionFailedError(msg)
+            instance = await self._attach_to_session(data, strategy="merge")
+            changed = {attr.key for attr in inspect(instance).attrs if attr.history.has_changes()}
+            try:
+                await self.session.flush()
+            except StaleDataError as exc:
+                msg = f"{self.model_type.__name__} was updated concurrently"
+                raise ConcurrentUpdateError(msg) from exc
+            stale = [
+                relationship.key
+                for relationship in mapper.relationships
+                if relationship.direction is MANYTOONE
+                and changed.intersection(c.key for c in relationship.local_columns)
+            ]
+            if stale:
+                await self.session.refresh(instance, attribute_names=stale)
+            return instance, old_data
+
+    async def update_many(
+        self,
+        data: list[ModelT],
+        auto_commit: bool | None = None,
+        auto_expunge: bool | None = None,
+    ) -> list[ModelT]:
+        """Update a batch of rows by primary key.
+
+        For models mapped with a `version_id_col` each row is matched on the
+        version in `data`, which the UPDATE bumps.
+
+        Raises:
+            ConcurrentUpdateError: A row is no longer at its version in `data`.
+        """
+        try:
+            return await super().update_many(data, auto_commit=auto_commit, auto_expunge=auto_expunge)
+        except RepositoryError as exc:
+            if not isinstance(exc.__cause__, StaleDataError):
+                raise
+            msg = f"{self.model_type.__name__} was updated concurrently"
+            raise ConcurrentUpdateError(msg) from exc.__cause__
+
+    def _filter_by_array(
+        self,
+        field_name: str,
+        values: Collection[Any],
+        match_all: bool,
+        statement: StatementLambdaElement,
+    ) -> StatementLambdaElement:
+        """Filter an `ARRAY` column with `@>` (all values) or `&&` (any value), both GIN indexable."""
+        if not values:
+            return statement
+        field = get_instrumented_attr(self.model_type, field_name)
+        expression = field.op("@>" if match_all else "&&")(type_coerce(list(values), field.type))
+        return self._filter_by_expression(statement=statement, expression=expression)
+
+
 class SQLAlchemyAsyncSlugRepository(
     SQLAlchemyAsyncRepository[ModelT],
 ):
@@ -13,16 +13,19 @@ from typing import TYPE_CHECKING, Any, TypeAlias, TypeVar, overload
 from advanced_alchemy.filters import (
     FilterTypes,
     LimitOffset,
+    OrderBy,
 )
 from advanced_alchemy.repository.typing import ModelT
 from advanced_alchemy.service import (
     SQLAlchemyAsyncRepositoryService as _SQLAlchemyAsyncRepositoryService,
 )
 from litestar.dto import DTOData
-from litestar.pagination import OffsetPagination
+from litestar.pagination import CursorPagination, OffsetPagination
 from pydantic.type_adapter import TypeAdapter
+from sqlalchemy import tuple_
 
 from app.lib.db import async_session_factory
+from app.lib.pagination import decode_cursor, encode_cursor
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
@@ -32,6 +35,8 @@ if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
     from sqlalchemy.sql import ColumnElement
 
+    from app.lib.pagination import KeysetPagination
+
 __all__ = ["SQLAlchemyAsyncRepositoryService"]
 
 SQLAlchemyAsyncRepoServiceT = TypeVar(
@@ -50,8 +55,45 @@ class SQLAlchemyAsyncRepositoryService(_SQLAlchemyAsyncRepositoryService[ModelT]
     This is the standard Advanced Alchemy Service with a few additional helper methods added:
         - Methods for formatting responses
         - Context manager for creating new services
+        - Keyset pagination
     """
 
+    async def list_keyset(
+        self,
+        keyset: KeysetPagination,
+        *filters: FilterTypes | ColumnElement[bool],
+        **kwargs: Any,
+    ) -> CursorPagination[str, ModelT]:
+        """List the page of rows following `keyset.cursor`, newest first.
+
+        Rows are ordered by `updated_at DESC, id DESC` and the page seeks past
+        the previous cursor instead of skipping an offset, so every page costs
+        the same no matter how deep it is.  No total is counted; the returned
+        cursor is `None` on the last page.
+
+        Args:
+            keyset: Page size and the cursor of the previous page.
+            *filters: Collection route filters.  Offset pagination and ordering are ignored.
+            **kwargs: Instance attribute value filters.
+
+        Returns:
+            The page of instances and the cursor of the next page.
+        """
+        model = self.repository.model_type
+        order = (model.updated_at.desc(), model.id.desc())
+        statement = self.repository.statement + (lambda s: s.order_by(None).order_by(*order))
+        page_filters = [filter_ for filter_ in filters if not isinstance(filter_, LimitOffset | OrderBy)]
+        if keyset.cursor:
+            page_filters.append(tuple_(model.updated_at, model.id) < tuple_(*decode_cursor(keyset.cursor)))
+        items = await self.repository.list(
+            *page_filters,
+            LimitOffset(limit=keyset.limit + 1, offset=0),
+            statement=statement,
+            **kwargs,
+        )
+        next_cursor = encode_cursor(items[keyset.limit - 1]) if len(items) > keyset.limit else None
+        return CursorPagination(items=items[: keyset.limit], results_per_page=keyset.limit, cursor=next_cursor)
+
     @overload
     def to_dto(self, data: ModelT) -> ModelT:
         ...
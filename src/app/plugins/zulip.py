@@ -1,20 +1,44 @@
+import asyncio
 import json
 import logging
+import math
+import os
+import socket
+import time
 from enum import Enum
 from typing import Any
 from uuid import UUID
 
 import httpx
+from redis.exceptions import RedisError, WatchError
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
 
+from app.domain.plugins import get_queue
 from app.domain.projects.models import Project
 from app.domain.sprintlogs.models import SprintLog
-from app.lib import serialization
+from app.lib import cache, constants, db, serialization
+from app.lib.cache import TwoTierCache
 from app.lib.plugin import ProjectPlugin, SprintlogPlugin
-from app.lib.settings import server
+from app.lib.settings import app, server
 
 __all__ = ["ZulipSprintlogPlugin"]
 logger = logging.getLogger(__name__)
 backlog_topic = "📑 [BACKLOG] "
+_client: httpx.AsyncClient | None = None
+_warm_up: asyncio.Task | None = None
+_stats: asyncio.Task | None = None
+_STREAM_EXISTS = b"+"
+_STREAM_MISSING = b"-"
+_EDIT_JOB_TIMEOUT = 300
+
+stream_cache = TwoTierCache(
+    "zulip-stream",
+    expiration=constants.ZULIP_STREAM_CACHE_EXPIRATION,
+    local_expiration=constants.ZULIP_STREAM_CACHE_LOCAL_EXPIRATION,
+    local_size=constants.ZULIP_STREAM_CACHE_LOCAL_SIZE,
+)
+"""Zulip stream name to stream id, `_STREAM_EXISTS` when only known to exist, `_STREAM_MISSING` when known not to."""
 
 
 def log_info(message: str) -> None:
@@ -28,6 +52,168 @@ class StatusFlags(Enum):
     SWITCH_TO_TASK = 8
 
 
+def get_client() -> httpx.AsyncClient:
+    """Pooled client shared by every Zulip API call in this process."""
+    global _client  # noqa: PLW0603
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            auth=httpx.BasicAuth(server.ZULIP_EMAIL_ADDRESS, server.ZULIP_API_KEY),
+            timeout=httpx.Timeout(server.ZULIP_HTTP_TIMEOUT, connect=server.ZULIP_HTTP_CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=server.ZULIP_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=server.ZULIP_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=server.ZULIP_HTTP_KEEPALIVE_EXPIRY,
+            ),
+        )
+    return _client
+
+
+def _retry_after(response: httpx.Response) -> float:
+    """Seconds to wait before retrying a rate limited request."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        try:
+            value = response.json().get("retry-after")
+        except ValueError:
+            value = None
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        return 1.0
+
+
+class RateLimitError(httpx.HTTPStatusError):
+    """Zulip kept answering 429, the caller should retry later."""
+
+
+class Dispatcher:
+    """Sends every Zulip API request of the process through a token bucket.
+
+    The bucket holds `rate` tokens refilled over `period` seconds.  A request
+    reserves a token, or the next one to be refilled and sleeps until then,
+    so bursts are queued instead of tripping the server rate limit.  When
+    Zulip answers 429 anyway, the bucket is emptied and paused for the
+    `Retry-After` delay and the request is queued again, up to `retries`
+    times before `RateLimitError` is raised.
+
+    `queue_depth` is the number of requests currently waiting for a token.
+    """
+
+    def __init__(self, rate: int, period: float, retries: int) -> None:
+        self.rate = rate
+        self.period = period
+        self.retries = retries
+        self.queue_depth = 0
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    async def _acquire(self) -> None:
+        # nothing is awaited between refilling and reserving, so concurrent
+        # callers take turns without a lock and sleep without blocking others
+        now = time.monotonic()
+        self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate / self.period)
+        self._updated = now
+        self._tokens -= 1
+        delay = max(self._paused_until - now, -self._tokens * self.period / self.rate)
+        if delay <= 0:
+            return
+        self.queue_depth += 1
+        try:
+            await asyncio.sleep(delay)
+            # a 429 may have paused the bucket while this request waited
+            while (delay := self._paused_until - time.monotonic()) > 0:
+                await asyncio.sleep(delay)
+        finally:
+            self.queue_depth -= 1
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request once a token is available.
+
+        Raises:
+            RateLimitError: When Zulip still answers 429 after `retries` retries.
+        """
+        for attempt in range(self.retries + 1):
+            await self._acquire()
+            response = await get_client().request(method, url, **kwargs)
+            remaining = response.headers.get("X-RateLimit-Remaining")
+            if remaining is not None and remaining.isdigit():
+                self._tokens = min(self._tokens, float(remaining))
+            if response.status_code != 429:
+                return response
+            if attempt == self.retries:
+                break
+            delay = _retry_after(response)
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = time.monotonic()
+            self._paused_until = max(self._paused_until, self._updated + delay)
+            logger.warning(
+                "zulip rate limit hit, retrying %s %s in %.1fs, queue depth %d",
+                method,
+                url,
+                delay,
+                self.queue_depth,
+            )
+        msg = f"zulip rate limit still hit after {self.retries} retries"
+        raise RateLimitError(msg, request=response.request, response=response)
+
+
+dispatcher = Dispatcher(server.ZULIP_RATE_LIMIT, server.ZULIP_RATE_LIMIT_PERIOD, server.ZULIP_RATE_LIMIT_RETRIES)
+"""Process wide Zulip API dispatcher."""
+
+
+def _dispatcher_stats_key() -> str:
+    return f"{app.slug}:zulip:dispatcher"
+
+
+async def _publish_dispatcher_stats() -> None:
+    """Keep the queue depth of this process' dispatcher in Redis for `health`."""
+    process = f"{socket.gethostname()}:{os.getpid()}"
+    while True:
+        stats = {"queue_depth": dispatcher.queue_depth, "updated": time.time()}
+        try:
+            await cache.redis.hset(_dispatcher_stats_key(), process, json.dumps(stats))
+        except (RedisError, OSError):
+            logger.warning("failed to publish the zulip dispatcher stats.")
+        await asyncio.sleep(constants.ZULIP_DISPATCHER_STATS_INTERVAL)
+
+
+async def health() -> dict[str, Any]:
+    """Zulip API requests waiting for a rate limit token, over every live process."""
+    key = _dispatcher_stats_key()
+    published = {process: json.loads(stats) for process, stats in (await cache.redis.hgetall(key)).items()}
+    expired = time.time() - 2 * constants.ZULIP_DISPATCHER_STATS_INTERVAL
+    stale = [process for process, stats in published.items() if stats["updated"] < expired]
+    if stale:
+        await cache.redis.hdel(key, *stale)
+    live = [stats for process, stats in published.items() if process not in stale]
+    return {"dispatcher_queue_depth": sum(stats["queue_depth"] for stats in live), "dispatcher_processes": len(live)}
+
+
+async def on_startup() -> None:
+    """Open the Zulip client, warm the stream cache and publish the dispatcher stats in the background."""
+    global _warm_up, _stats  # noqa: PLW0603
+    get_client()
+    if server.ZULIP_API_URL and _warm_up is None:
+        _warm_up = asyncio.create_task(_warm_stream_cache())
+    if _stats is None:
+        _stats = asyncio.create_task(_publish_dispatcher_stats())
+
+
+async def on_shutdown() -> None:
+    """Close the Zulip client and its pooled connections."""
+    global _client, _warm_up, _stats  # noqa: PLW0603
+    if _warm_up is not None:
+        _warm_up.cancel()
+        _warm_up = None
+    if _stats is not None:
+        _stats.cancel()
+        _stats = None
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
 async def create_stream(
     name: str,
     description: str,
@@ -35,7 +221,6 @@ async def create_stream(
 ) -> dict[str, str]:
     log_info("creating zulip stream")
     url = f"{server.ZULIP_API_URL}{server.ZULIP_CREATE_STREAM_URL}"
-    auth = httpx.BasicAuth(server.ZULIP_EMAIL_ADDRESS, server.ZULIP_API_KEY)
     subscription = [{"description": description, "name": name}]
     data = {
         "subscriptions": json.dumps(subscription),
@@ -43,13 +228,62 @@ async def create_stream(
         "invite_only": True,
         "history_public_to_subscribers": True,
     }
-    async with httpx.AsyncClient(timeout=1000) as client:
-        response = await client.post(url, auth=auth, data=data)
-        log_info(str(response))
-        if response.status_code == 200:
-            return dict(response.json())
-        msg = f"{response.status_code}, {response.text}"
-        raise httpx.HTTPError(msg)
+    response = await dispatcher.request("POST", url, data=data)
+    log_info(str(response))
+    if response.status_code == 200:
+        await stream_cache.set(name, _STREAM_EXISTS)
+        return dict(response.json())
+    msg = f"{response.status_code}, {response.text}"
+    raise httpx.HTTPError(msg)
+
+
+async def _rebuild_stream(stream_name: str) -> None:
+    await create_stream(
+        stream_name,
+        "Stream rebuild due to inexistance",
+        principals=[*server.ZULIP_ADMIN_EMAIL, server.ZULIP_EMAIL_ADDRESS],
+    )
+
+
+async def resolve_stream_id(stream_name: str) -> int:
+    """Id of `stream_name`, from the stream cache when known."""
+    cached = await stream_cache.get(stream_name)
+    if cached is not None and cached.isdigit():
+        return int(cached)
+    response = await get_stream_id(stream_name)
+    stream_id = int(response["stream_id"])
+    await stream_cache.set(stream_name, str(stream_id).encode())
+    return stream_id
+
+
+async def _warm_stream_cache() -> None:
+    """Cache the stream of every project with a single request for all the streams the bot can see.
+
+    Streams are listed whether or not the bot is subscribed, so only the
+    streams missing from the list are recreated on the next send.
+    """
+    url = f"{server.ZULIP_API_URL}/api/v1/streams"
+    try:
+        response = await dispatcher.request("GET", url)
+        if response.status_code != 200:
+            msg = f"{response.status_code}, {response.text}"
+            raise httpx.HTTPError(msg)
+        streams = {stream["name"]: stream["stream_id"] for stream in response.json()["streams"]}
+        async with db.session() as session:
+            projects = (await session.execute(select(Project.name, Project.pin))).all()
+    except (httpx.HTTPError, SQLAlchemyError, OSError):
+        logger.exception("failed to warm the zulip stream cache.")
+        return
+    for name, pin in projects:
+        stream_name = _gen_stream_name(name, pin)
+        stream_id = streams.get(stream_name)
+        await stream_cache.set(stream_name, _STREAM_MISSING if stream_id is None else str(stream_id).encode())
+
+
+def _load_meta(value: Any) -> dict | None:
+    if isinstance(value, dict):
+        return value
+    return serialization.eval_from_b64(value)
 
 
 def _gen_stream_name(name: str, is_pinned: bool | None = False) -> str:
@@ -63,7 +297,6 @@ async def send_msg(stream_name: str, topic_name: str, content: str | None = "")
     log_info(f"topic name: {topic_name}")
     log_info(f"content: {content}")
     url = f"{server.ZULIP_API_URL}{server.ZULIP_SEND_MESSAGE_URL}"
-    auth = httpx.BasicAuth(server.ZULIP_EMAIL_ADDRESS, server.ZULIP_API_KEY)
     log_info(url)
     data = {
         "type": "stream",
@@ -71,61 +304,84 @@ async def send_msg(stream_name: str, topic_name: str, content: str | None = "")
         "topic": topic_name,
         "content": content,
     }
-    async with httpx.AsyncClient(timeout=1000) as client:
-        response = await client.post(url, auth=auth, data=data)
-        if response.status_code == 200:
-            return dict(response.json())
-        if response.status_code == 400 and dict(response.json()).get("code") == "STREAM_DOES_NOT_EXIST":
-            await create_stream(
-                stream_name,
-                "Stream rebuild due to inexistance",
-                principals=[*server.ZULIP_ADMIN_EMAIL, server.ZULIP_EMAIL_ADDRESS],
-            )
-            response = await client.post(url, auth=auth, data=data)
-            return dict(response.json())
-
-        msg = f"{response.status_code}, {response.text}"
-        raise httpx.HTTPError(msg)
+    cached = await stream_cache.get(stream_name)
+    if cached == _STREAM_MISSING:
+        await _rebuild_stream(stream_name)
+    response = await dispatcher.request("POST", url, data=data)
+    if response.status_code == 200:
+        if cached is None:
+            await stream_cache.set(stream_name, _STREAM_EXISTS)
+        return dict(response.json())
+    if response.status_code == 400 and dict(response.json()).get("code") == "STREAM_DOES_NOT_EXIST":
+        await _rebuild_stream(stream_name)
+        response = await dispatcher.request("POST", url, data=data)
+        return dict(response.json())
+
+    msg = f"{response.status_code}, {response.text}"
+    raise httpx.HTTPError(msg)
 
 
 async def delete_message(msg_id: int) -> dict[str, Any]:
     log_info("deleting message")
     log_info(f"message id: {msg_id}")
     url: str = f"{server.ZULIP_API_URL}{server.ZULIP_DELETE_MESSAGE_URL}/{msg_id}"
-    auth = httpx.BasicAuth(server.ZULIP_EMAIL_ADDRESS, server.ZULIP_API_KEY)
-    async with httpx.AsyncClient(timeout=1000) as client:
-        response = await client.delete(url, auth=auth)
-        if response.status_code == 200:
-            return dict(response.json())
-        msg = f"{response.status_code}, {response.text}"
-        raise httpx.HTTPError(msg)
+    response = await dispatcher.request("DELETE", url)
+    if response.status_code == 200:
+        return dict(response.json())
+    msg = f"{response.status_code}, {response.text}"
+    raise httpx.HTTPError(msg)
 
 
 async def delete_topic(stream_id: int, topic: str) -> dict[str, Any]:
     url: str = f"{server.ZULIP_API_URL}/api/v1/streams/{stream_id}/delete_topic"
-    auth = httpx.BasicAuth(server.ZULIP_EMAIL_ADDRESS, server.ZULIP_API_KEY)
-    async with httpx.AsyncClient(timeout=1000) as client:
-        response = await client.post(url, auth=auth, data={"topic_name": topic})
-        if response.status_code == 200:
-            return dict(response.json())
-        msg = f"{response.status_code}, {response.text}"
-        raise httpx.HTTPError(msg)
+    response = await dispatcher.request("POST", url, data={"topic_name": topic})
+    if response.status_code == 200:
+        return dict(response.json())
+    msg = f"{response.status_code}, {response.text}"
+    raise httpx.HTTPError(msg)
 
 
 async def get_stream_id(stream_name: str) -> dict[str, Any]:
     url: str = f"{server.ZULIP_API_URL}/api/v1/get_stream_id"
-    auth = httpx.BasicAuth(server.ZULIP_EMAIL_ADDRESS, server.ZULIP_API_KEY)
-    async with httpx.AsyncClient(timeout=1000) as client:
-        response = await client.get(url, auth=auth, params={"stream": stream_name})
-        log_info(response)
-        if response.status_code == 200:
-            return dict(response.json())
-        msg = f"{response.status_code}, {response.text}"
-        raise httpx.HTTPError(msg)
+    response = await dispatcher.request("GET", url, params={"stream": stream_name})
+    log_info(response)
+    if response.status_code == 200:
+        return dict(response.json())
+    msg = f"{response.status_code}, {response.text}"
+    raise httpx.HTTPError(msg)
+
+
+def _edit_key(msg_id: int) -> str:
+    return f"{app.slug}:zulip:edit:{msg_id}"
+
+
+async def _drop_edit(key: str, edit: bytes) -> bool:
+    """Delete the queued edit at `key` unless it was replaced since it was read."""
+    async with cache.redis.pipeline(transaction=True) as pipe:
+        try:
+            await pipe.watch(key)
+            if await pipe.get(key) != edit:
+                return False
+            pipe.multi()
+            pipe.delete(key)
+            await pipe.execute()
+        except WatchError:
+            return False
+    return True
+
+
+async def flush_message_edit(msg_id: int) -> None:
+    """Send the queued edit of `msg_id`, raising on failure so the job is retried."""
+    await ZulipSprintlogPlugin()._flush_message_edit(msg_id)  # noqa: SLF001
+
+
+tasks = (flush_message_edit,)
 
 
 class ZulipSprintlogPlugin(SprintlogPlugin):
-    status: StatusFlags
+    # bounded by the HTTP client timeouts, cancelling a POST zulip already
+    # accepted would lose the message id and send it again on retry
+    hook_timeout = math.inf
 
     def __init__(self) -> None:
         ...
@@ -165,8 +421,7 @@ class ZulipSprintlogPlugin(SprintlogPlugin):
                             logger.exception("failed to delete message.")
                 case "topic":
                     try:
-                        stream_id_response = await get_stream_id(stream_name=stream_name)
-                        stream_id = stream_id_response.get("stream_id")
+                        stream_id = await resolve_stream_id(stream_name)
                         response = await delete_topic(stream_id, topic_name)
                         if response and response.get("result") == "success":
                             log_info(f"successfully deleted topic from zulip {response}")
@@ -177,6 +432,8 @@ class ZulipSprintlogPlugin(SprintlogPlugin):
                         httpx.HTTPError,
                     ):
                         logger.exception("failed to delete topic.")
+                        # the cached id may belong to a stream that was since recreated
+                        await stream_cache.delete(stream_name)
 
     async def _update_message(
         self,
@@ -187,7 +444,6 @@ class ZulipSprintlogPlugin(SprintlogPlugin):
         stream_name: str | None = None,
     ) -> dict[str, Any]:
         url = f"{server.ZULIP_API_URL}{server.ZULIP_UPDATE_MESSAGE_URL}/{msg_id}"
-        auth = httpx.BasicAuth(server.ZULIP_EMAIL_ADDRESS, server.ZULIP_API_KEY)
 
         data = {
             "topic": topic_name,
@@ -197,22 +453,84 @@ class ZulipSprintlogPlugin(SprintlogPlugin):
             "content": content,
         }
 
-        async with httpx.AsyncClient(timeout=1000) as client:
-            response = await client.patch(url, auth=auth, data=data)
-            if response.status_code == 200:
-                return dict(response.json())
-            if (
-                response.status_code == 400
-                and dict(response.json()).get("code") == "BAD_REQUEST"
-                and dict(response.json()).get("message") == "Invalid message(s)"
-            ) and stream_name:
-                await create_stream(
-                    stream_name,
-                    "Stream rebuild due to inexistance",
-                    principals=[*server.ZULIP_ADMIN_EMAIL, server.ZULIP_EMAIL_ADDRESS],
+        response = await dispatcher.request("PATCH", url, data=data)
+        if response.status_code == 200:
+            return dict(response.json())
+        if (
+            response.status_code == 400
+            and dict(response.json()).get("code") == "BAD_REQUEST"
+            and dict(response.json()).get("message") == "Invalid message(s)"
+        ) and stream_name:
+            await _rebuild_stream(stream_name)
+        msg = f"{response.status_code}, {response.text}"
+        raise httpx.HTTPError(msg)
+
+    async def _queue_message_edit(
+        self,
+        topic_name: str,
+        msg_id: int,
+        content: str,
+        propagate_mode: str,
+    ) -> None:
+        """Coalesce edits of `msg_id` and send only the latest one.
+
+        The latest edit is kept in Redis and a `flush_message_edit` job keyed
+        on the message is scheduled `ZULIP_EDIT_DEBOUNCE` seconds out.  Edits
+        queued by any worker before the job runs replace the stored one
+        instead of scheduling another job, and a failed send is retried by
+        the job queue with backoff.
+        """
+        window = server.ZULIP_EDIT_DEBOUNCE
+        if window > 0:
+            key = _edit_key(msg_id)
+            edit = json.dumps({"topic_name": topic_name, "content": content, "propagate_mode": propagate_mode})
+            # outlive the job and its retries
+            retries = server.ZULIP_EDIT_RETRIES
+            ttl = window + server.ZULIP_EDIT_RETRY_DELAY * 2**retries + _EDIT_JOB_TIMEOUT * retries
+            try:
+                await cache.redis.set(key, edit, px=int(ttl * 1000))
+                await get_queue("plugin-events").enqueue(
+                    "run_plugin_task",
+                    task="zulip.flush_message_edit",
+                    msg_id=msg_id,
+                    key=key,
+                    scheduled=math.ceil(time.time() + window),
+                    retries=retries,
+                    retry_delay=server.ZULIP_EDIT_RETRY_DELAY,
+                    retry_backoff=True,
+                    timeout=_EDIT_JOB_TIMEOUT,
                 )
-            msg = f"{response.status_code}, {response.text}"
-            raise httpx.HTTPError(msg)
+            except (RedisError, OSError):
+                logger.warning("Redis unavailable, sending zulip message edit %s now", msg_id)
+            else:
+                return
+        await self._send_message_edit(topic_name, msg_id, content, propagate_mode)
+
+    async def _flush_message_edit(self, msg_id: int) -> None:
+        key = _edit_key(msg_id)
+        while (edit := await cache.redis.get(key)) is not None:
+            await self._send_message_edit(msg_id=msg_id, **json.loads(edit))
+            # an edit queued while this one was sent did not get a job of its own
+            if await _drop_edit(key, edit):
+                return
+
+    async def _send_message_edit(
+        self,
+        topic_name: str,
+        msg_id: int,
+        content: str,
+        propagate_mode: str,
+    ) -> None:
+        response = await self._update_message(
+            topic_name=topic_name,
+            msg_id=msg_id,
+            content=content,
+            propagate_mode=propagate_mode,
+        )
+        if response.get("result") != "success":
+            log_info(f"failed to update message to zulip {response!s}")
+        else:
+            log_info(f"successfully update message to zulip {response}")
 
     async def _update_backlog(self, data: SprintLog, meta_data: dict) -> SprintLog:
         msg_id = meta_data.get("msg_id")
@@ -272,17 +590,12 @@ class ZulipSprintlogPlugin(SprintlogPlugin):
         msg_id = meta_data.get("msg_id")
         content, _stream_name, topic_name = self._format_content(data).values()
         if msg_id:
-            response = await self._update_message(
+            await self._queue_message_edit(
                 topic_name=topic_name,
                 msg_id=msg_id,
                 content=content,
                 propagate_mode=propagation,
             )
-            if response:
-                if response.get("result") != "success":
-                    log_info(f"failed to update message to zulip {response!s}")
-                else:
-                    log_info(f"successfully update message to zulip {response}")
         return data
 
     async def before_create(self, data: "SprintLog") -> "SprintLog":
@@ -290,43 +603,31 @@ class ZulipSprintlogPlugin(SprintlogPlugin):
         return data
 
     async def after_create(self, data: "SprintLog") -> "SprintLog":
-        try:
-            log_info(">>> after_create trigger")
-            stream_name = _gen_stream_name(data.project_name, data.pin)
-            content = f"{data.status} {data.priority} {data.progress} **[{data.slug}]** {data.title}  **:time::{data.due_date.strftime('%d-%m-%Y')}** @**{data.assignee_name}** {data.category}"
+        log_info(">>> after_create trigger")
+        if (_load_meta(data.plugin_meta) or {}).get("msg_id"):
+            # sent by an earlier delivery of this event
+            return data
+        stream_name = _gen_stream_name(data.project_name, data.pin)
+        content = f"{data.status} {data.priority} {data.progress} **[{data.slug}]** {data.title}  **:time::{data.due_date.strftime('%d-%m-%Y')}** @**{data.assignee_name}** {data.category}"
 
-            response = await send_msg(stream_name, backlog_topic, content)
-            if response["result"] != "success":
-                log_info(f"failed to send message, response: {response}")
-            else:
-                log_info(f"successfully sent message to zulip {response['id']}")
-                data.plugin_meta = {"msg_id": response["id"]}
-
-        except (
-            httpx.ConnectTimeout,
-            httpx.ReadTimeout,
-            httpx.ConnectError,
-            httpx.HTTPError,
-        ):
-            log_info("failed to send message to zulip: ")
+        response = await send_msg(stream_name, backlog_topic, content)
+        if response["result"] != "success":
+            log_info(f"failed to send message, response: {response}")
+        else:
+            log_info(f"successfully sent message to zulip {response['id']}")
+            data.plugin_meta = {**(_load_meta(data.plugin_meta) or {}), "msg_id": response["id"]}
         return data
 
     def _set_status(self, data: SprintLog, old_data: SprintLog) -> StatusFlags:
         backlogged = data.type == "backlog"
         switched = data.type != old_data.get("type") if isinstance(old_data, dict) else False
         if backlogged and not switched:
-            self.status = StatusFlags.BACKLOG_UPDATE
-            return self.status
+            return StatusFlags.BACKLOG_UPDATE
         if not backlogged and not switched:
-            self.status = StatusFlags.SPRINT_UPDATE
-            return self.status
+            return StatusFlags.SPRINT_UPDATE
         if backlogged and switched:
-            self.status = StatusFlags.SWITCH_TO_BACKLOG
-            return self.status
-        if not backlogged and switched:
-            self.status = StatusFlags.SWITCH_TO_TASK
-            return self.status
-        return None
+            return StatusFlags.SWITCH_TO_BACKLOG
+        return StatusFlags.SWITCH_TO_TASK
 
     async def before_update(
         self,
@@ -335,45 +636,34 @@ class ZulipSprintlogPlugin(SprintlogPlugin):
         old_data: "SprintLog|dict|None" = None,
     ) -> "SprintLog":
         data = await super().before_update(item_id, data)
-        meta_data = (
-            serialization.eval_from_b64(data.plugin_meta)
-            if data.plugin_meta
-            else serialization.eval_from_b64(old_data.plugin_meta)
-        )
+        old_meta = old_data.get("plugin_meta") if isinstance(old_data, dict) else getattr(old_data, "plugin_meta", None)
+        meta_data = _load_meta(data.plugin_meta) or _load_meta(old_meta)
         status = self._set_status(data, old_data)
         project_name = old_data.project_name if isinstance(old_data, SprintLog) else data.project_name
 
         if meta_data:
-            try:
-                log_info(status)
-                match self.status:
-                    case StatusFlags.BACKLOG_UPDATE:
-                        return await self._update_task_message(data, meta_data)
-                    case StatusFlags.SPRINT_UPDATE:
-                        return await self._update_task_message(data, meta_data)
-                    case StatusFlags.SWITCH_TO_BACKLOG:
-                        return await self._switch_topic(
-                            data,
-                            meta_data,
-                            "backlog",
-                            delete_mode="topic",
-                            project_name=project_name,
-                        )
-                    case StatusFlags.SWITCH_TO_TASK:
-                        return await self._switch_topic(
-                            data,
-                            meta_data,
-                            "task",
-                            delete_mode="message",
-                            project_name=project_name,
-                        )
-            except (
-                httpx.ConnectTimeout,
-                httpx.ReadTimeout,
-                httpx.ConnectError,
-                httpx.HTTPError,
-            ):
-                return data
+            log_info(status)
+            match status:
+                case StatusFlags.BACKLOG_UPDATE:
+                    return await self._update_task_message(data, meta_data)
+                case StatusFlags.SPRINT_UPDATE:
+                    return await self._update_task_message(data, meta_data)
+                case StatusFlags.SWITCH_TO_BACKLOG:
+                    return await self._switch_topic(
+                        data,
+                        meta_data,
+                        "backlog",
+                        delete_mode="topic",
+                        project_name=project_name,
+                    )
+                case StatusFlags.SWITCH_TO_TASK:
+                    return await self._switch_topic(
+                        data,
+                        meta_data,
+                        "task",
+                        delete_mode="message",
+                        project_name=project_name,
+                    )
 
         else:
             log_info(f">>>cant get meta: {meta_data}")
@@ -400,6 +690,8 @@ class ZulipSprintlogPlugin(SprintlogPlugin):
 
 
 class ZulipProjectPlugin(ProjectPlugin):
+    hook_timeout = math.inf
+
     def __init__(self) -> None:
         ...
 
@@ -407,23 +699,15 @@ class ZulipProjectPlugin(ProjectPlugin):
         return data
 
     async def after_create(self, data: "Project") -> "Project":
-        try:
-            email = "" if data.owner.email is None else data.owner.email
-            principals = [*server.ZULIP_ADMIN_EMAIL, server.ZULIP_EMAIL_ADDRESS, email]
-            stream_name = _gen_stream_name(data.name, data.pin)
+        email = "" if data.owner.email is None else data.owner.email
+        principals = [*server.ZULIP_ADMIN_EMAIL, server.ZULIP_EMAIL_ADDRESS, email]
+        stream_name = _gen_stream_name(data.name, data.pin)
 
-            response = await create_stream(stream_name, data.description, principals)
-            if response["result"] != "success":
-                log_info(str(response))
-            else:
-                log_info("successfully created zulip stream")
-        except (
-            httpx.ConnectTimeout,
-            httpx.ReadTimeout,
-            httpx.ConnectError,
-            httpx.HTTPError,
-        ):
-            log_info("failed to create zulip stream: ")
+        response = await create_stream(stream_name, data.description, principals)
+        if response["result"] != "success":
+            log_info(str(response))
+        else:
+            log_info("successfully created zulip stream")
         return data
 
     async def before_update(
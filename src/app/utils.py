@@ -18,6 +18,7 @@ __all__ = [
     "case_insensitive_string_compare",
     "check_email",
     "dataclass_as_dict_shallow",
+    "entity_tag",
     "import_string",
     "module_to_os_path",
     "slugify",
@@ -79,6 +80,11 @@ def case_insensitive_string_compare(a: str, b: str, /) -> bool:
     return a.strip().lower() == b.strip().lower()
 
 
+def entity_tag(version: int) -> str:
+    """Strong `ETag` header value of a row version."""
+    return f'"{version}"'
+
+
 def dataclass_as_dict_shallow(dataclass: Any, *, exclude_none: bool = False) -> dict[str, Any]:
     """Convert a dataclass to dict, without deepcopy."""
     ret: dict[str, Any] = {}
@@ -14,9 +14,10 @@ from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.pool import NullPool
 
 from app.domain.accounts.models import User
+from app.domain.projects.models import Project, ProjectService
 from app.domain.security import auth
 from app.domain.teams.models import Team
-from app.lib import db
+from app.lib import cache, db
 from tests.docker_service import DockerServiceRegistry, postgres_responsive, redis_responsive
 
 here = Path(__file__).parent
@@ -153,14 +154,19 @@ async def fx_redis(docker_ip: str, redis_service: None) -> Redis:
 
 
 @pytest.fixture(autouse=True)
-def _patch_redis(app: "Litestar", redis: Redis, monkeypatch: pytest.MonkeyPatch) -> None:
-    cache_config = app.response_cache_config
-    assert cache_config is not None
+async def _patch_redis(app: "Litestar", redis: Redis, monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.domain.accounts.cache import user_cache
+
     saq_plugin = get_saq_plugin(app)
-    monkeypatch.setattr(app.stores.get(cache_config.store), "_redis", redis)
-    if saq_plugin._config.queue_instances is not None:
-        for queue in saq_plugin._config.queue_instances.values():
-            monkeypatch.setattr(queue, "redis", redis)
+    # the response store and the two tier caches share the module level client
+    monkeypatch.setattr(cache, "redis", redis)
+    await redis.flushall()
+    # the database is seeded again for every test, drop per-process entries too
+    await cache.response_cache.clear()
+    await user_cache.clear()
+    # plugins enqueue jobs outside of requests, so create the queues up front
+    for queue in saq_plugin._config.get_queues().queues.values():
+        monkeypatch.setattr(queue, "redis", redis)
 
 
 @pytest.fixture(name="client")
@@ -195,3 +201,21 @@ def fx_user_token_headers() -> dict[str, str]:
     ```
     """
     return {"Authorization": f"Bearer {auth.create_token(identifier='user@example.com')}"}
+
+
+@pytest.fixture(name="project")
+async def fx_project(sessionmaker: async_sessionmaker[AsyncSession]) -> Project:
+    """Project the sprintlog tests file their items under."""
+    async with ProjectService.new(sessionmaker()) as projects_service:
+        project = await projects_service.create(
+            {
+                "slug": "sprint-board",
+                "name": "Sprint Board",
+                "description": "Integration test project",
+                "repo_urls": [],
+                "labels": [],
+                "documents": [],
+            },
+        )
+        await projects_service.repository.session.commit()
+    return project
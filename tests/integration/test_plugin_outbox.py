@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import select, update
+
+from app.domain.sprintlogs.models import SprintLog, SprintlogService
+from app.domain.system import tasks
+from app.domain.system.models import PluginEvent, PluginEventStatus, PluginEventType
+from app.lib import plugin, settings
+from app.lib.plugin import SprintlogPlugin
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    import pytest
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from app.domain.projects.models import Project
+
+
+class RecordingPlugin(SprintlogPlugin):
+    def __init__(self, fail_before_update: bool = False) -> None:
+        self.fail_before_update = fail_before_update
+        self.calls: list[tuple[str, Any]] = []
+
+    async def before_create(self, data: SprintLog) -> SprintLog:
+        data.plugin_meta = {}
+        return data
+
+    async def after_create(self, data: SprintLog) -> SprintLog:
+        self.calls.append(("after_create", data.title))
+        data.plugin_meta = {**(data.plugin_meta or {}), "recorded": True}
+        return data
+
+    async def before_update(self, item_id: Any, data: SprintLog, old_data: Any = None) -> SprintLog:
+        if self.fail_before_update:
+            msg = "plugin backend unavailable"
+            raise RuntimeError(msg)
+        self.calls.append(("before_update", old_data))
+        return data
+
+    async def after_update(self, data: SprintLog, old_data: Any = None) -> SprintLog:
+        self.calls.append(("after_update", data.title))
+        return data
+
+    async def before_delete(self, item_id: UUID) -> UUID:
+        return item_id
+
+    async def after_delete(self, data: SprintLog) -> SprintLog:
+        return data
+
+
+def use_plugin(monkeypatch: pytest.MonkeyPatch, recorder: RecordingPlugin) -> None:
+    monkeypatch.setattr(plugin.registry, "sprintlog", (recorder,))
+    monkeypatch.setattr(plugin.registry, "project", ())
+    monkeypatch.setattr(plugin.registry, "_loaded", True)
+
+
+async def create_sprintlog(
+    sessionmaker: async_sessionmaker[AsyncSession],
+    project: Project,
+    recorder: RecordingPlugin,
+) -> SprintLog:
+    async with SprintlogService.new(sessionmaker()) as service:
+        service.plugins = (recorder,)
+        obj = await service.create(
+            {
+                "title": "original title",
+                "project_slug": project.slug,
+                "sprint_number": 1,
+                "est_days": 1,
+                "beg_date": date.today(),
+                "type": "backlog",
+            },
+        )
+        await service.repository.session.commit()
+    return obj
+
+
+async def outbox(session: AsyncSession) -> list[PluginEvent]:
+    return list((await session.scalars(select(PluginEvent).order_by(PluginEvent.created_at))).all())
+
+
+async def test_outbox_delivers_update_with_old_data(
+    sessionmaker: async_sessionmaker[AsyncSession],
+    project: Project,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    recorder = RecordingPlugin()
+    use_plugin(monkeypatch, recorder)
+    obj = await create_sprintlog(sessionmaker, project, recorder)
+    async with SprintlogService.new(sessionmaker()) as service:
+        service.plugins = (recorder,)
+        await service.update({"title": "new title"}, item_id=obj.id)
+        await service.repository.session.commit()
+
+    async with sessionmaker() as session:
+        events = await outbox(session)
+    assert [(event.event, event.status) for event in events] == [
+        (PluginEventType.create, PluginEventStatus.pending),
+        (PluginEventType.update, PluginEventStatus.pending),
+    ]
+    assert events[1].old_data is not None
+    assert events[1].old_data["title"] == "original title"
+
+    # the update waits until the create of the same item has been delivered
+    assert await tasks.deliver_plugin_events({}) == 1
+    assert [call for call, _ in recorder.calls] == ["after_create"]
+    assert await tasks.deliver_plugin_events({}) == 1
+    assert await tasks.deliver_plugin_events({}) == 0
+
+    # hooks see the row as it is at delivery time, old_data as it was when the update was recorded
+    (_, created), (hook, old_data), (_, updated) = recorder.calls
+    assert created == "new title"
+    assert hook == "before_update"
+    assert old_data["title"] == "original title"
+    assert old_data["type"] == "backlog"
+    assert old_data["id"] == str(obj.id)
+    assert updated == "new title"
+    async with sessionmaker() as session:
+        assert {event.status for event in await outbox(session)} == {PluginEventStatus.delivered}
+        stored = await session.get(SprintLog, obj.id)
+        assert stored is not None
+        assert stored.plugin_meta == {"recorded": True}
+        # storing plugin_meta changes the ETag too
+        assert stored.version == obj.version + 2
+
+
+async def test_outbox_retries_failed_events_with_backoff(
+    sessionmaker: async_sessionmaker[AsyncSession],
+    project: Project,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings.worker, "PLUGIN_OUTBOX_RETRY_DELAY", 10)
+    monkeypatch.setattr(settings.worker, "PLUGIN_OUTBOX_MAX_ATTEMPTS", 3)
+    recorder = RecordingPlugin(fail_before_update=True)
+    use_plugin(monkeypatch, recorder)
+    obj = await create_sprintlog(sessionmaker, project, recorder)
+    async with SprintlogService.new(sessionmaker()) as service:
+        service.plugins = (recorder,)
+        await service.update({"title": "new title"}, item_id=obj.id)
+        await service.repository.session.commit()
+
+    async def make_due(session: AsyncSession) -> None:
+        await session.execute(update(PluginEvent).values(available_at=datetime.now(UTC) - timedelta(seconds=1)))
+        await session.commit()
+
+    # the create event is delivered, then the update fails and is scheduled again
+    assert await tasks.deliver_plugin_events({}) == 1
+    assert await tasks.deliver_plugin_events({}) == 0
+    async with sessionmaker() as session:
+        failed = (await outbox(session))[1]
+        assert (failed.status, failed.attempts) == (PluginEventStatus.pending, 1)
+        assert failed.last_error is not None
+        assert "plugin backend unavailable" in failed.last_error
+        first_delay = failed.available_at - datetime.now(UTC)
+        assert timedelta(seconds=8) < first_delay <= timedelta(seconds=10)
+
+        # not due yet, so it is not claimed again
+        assert await tasks.deliver_plugin_events({}) == 0
+
+        await make_due(session)
+        assert await tasks.deliver_plugin_events({}) == 0
+        session.expire_all()
+        failed = (await outbox(session))[1]
+        assert (failed.status, failed.attempts) == (PluginEventStatus.pending, 2)
+        assert timedelta(seconds=18) < failed.available_at - datetime.now(UTC) <= timedelta(seconds=20)
+
+        await make_due(session)
+        assert await tasks.deliver_plugin_events({}) == 0
+        session.expire_all()
+        failed = (await outbox(session))[1]
+        assert (failed.status, failed.attempts) == (PluginEventStatus.failed, 3)
+
+        await make_due(session)
+        assert await tasks.deliver_plugin_events({}) == 0
+
+
+async def test_purge_keeps_events_within_the_retention(
+    sessionmaker: async_sessionmaker[AsyncSession],
+    project: Project,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings.worker, "PLUGIN_OUTBOX_RETENTION", 3600)
+    recorder = RecordingPlugin()
+    use_plugin(monkeypatch, recorder)
+    obj = await create_sprintlog(sessionmaker, project, recorder)
+    async with SprintlogService.new(sessionmaker()) as service:
+        service.plugins = (recorder,)
+        await service.update({"title": "new title"}, item_id=obj.id)
+        await service.update({"title": "newer title"}, item_id=obj.id)
+        await service.repository.session.commit()
+    assert await tasks.deliver_plugin_events({}) == 1
+    assert await tasks.deliver_plugin_events({}) == 1
+
+    # nothing is old enough yet
+    assert await tasks.purge_plugin_events({}) == 0
+
+    async with sessionmaker() as session:
+        created, delivered, pending = await outbox(session)
+        long_ago = datetime.now(UTC) - timedelta(hours=2)
+        await session.execute(
+            update(PluginEvent).where(PluginEvent.id == created.id).values(delivered_at=long_ago),
+        )
+        await session.execute(
+            update(PluginEvent)
+            .where(PluginEvent.id == delivered.id)
+            .values(status=PluginEventStatus.failed, available_at=long_ago),
+        )
+        await session.execute(update(PluginEvent).where(PluginEvent.id == pending.id).values(available_at=long_ago))
+        await session.commit()
+
+    assert await tasks.purge_plugin_events({}) == 2
+    async with sessionmaker() as session:
+        assert [(event.id, event.status) for event in await outbox(session)] == [
+            (pending.id, PluginEventStatus.pending),
+        ]
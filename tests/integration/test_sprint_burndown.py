@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, timedelta
+from typing import TYPE_CHECKING
+
+from sqlalchemy import insert, select, update
+
+from app.domain.analytics.models import RollupWatermark, SprintBurndown, SprintlogDeletion
+from app.domain.sprintlogs.models import SprintLog, SprintlogService, Status
+from app.domain.system import tasks
+from app.lib import settings
+from app.lib.db import write_behind
+
+if TYPE_CHECKING:
+    import pytest
+    from httpx import AsyncClient
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from app.domain.projects.models import Project
+
+
+async def create_sprintlogs(
+    sessionmaker: async_sessionmaker[AsyncSession],
+    project: Project,
+    *points: int,
+) -> list[SprintLog]:
+    async with SprintlogService.new(sessionmaker()) as service:
+        objs = [
+            await service.create(
+                {
+                    "title": f"item {number}",
+                    "project_slug": project.slug,
+                    "sprint_number": 1,
+                    "est_days": 1,
+                    "points": item_points,
+                    "beg_date": date.today(),
+                    "type": "task",
+                    "plugin_meta": {},
+                },
+            )
+            for number, item_points in enumerate(points)
+        ]
+        await service.repository.session.commit()
+    return objs
+
+
+async def today_burndown(sessionmaker: async_sessionmaker[AsyncSession]) -> tuple[int, int, int, int]:
+    async with sessionmaker() as session:
+        row = (
+            await session.scalars(select(SprintBurndown).where(SprintBurndown.day == datetime.now(UTC).date()))
+        ).one()
+    return row.items, row.points, row.remaining_items, row.remaining_points
+
+
+async def test_rollup_follows_updates_and_deletes(
+    sessionmaker: async_sessionmaker[AsyncSession],
+    project: Project,
+) -> None:
+    first, second, third = await create_sprintlogs(sessionmaker, project, 1, 2, 3)
+    assert await tasks.rollup_sprint_burndown({}) == 1
+    assert await today_burndown(sessionmaker) == (3, 6, 3, 6)
+
+    # nothing changed since the last run
+    assert await tasks.rollup_sprint_burndown({}) == 1
+    async with sessionmaker() as session:
+        await session.execute(update(RollupWatermark).values(watermark=datetime.now(UTC) + timedelta(hours=1)))
+        await session.commit()
+    assert await tasks.rollup_sprint_burndown({}) == 0
+
+    async with SprintlogService.new(sessionmaker()) as service:
+        await service.update({"status": Status.completed}, item_id=first.id)
+        await service.delete(second.id)
+        await service.repository.session.commit()
+    async with sessionmaker() as session:
+        await session.execute(update(RollupWatermark).values(watermark=datetime.now(UTC) - timedelta(seconds=1)))
+        await session.commit()
+    assert await tasks.rollup_sprint_burndown({}) == 1
+    assert await today_burndown(sessionmaker) == (2, 4, 1, 3)
+
+    # a sprint emptied by deletes is rolled up too
+    async with SprintlogService.new(sessionmaker()) as service:
+        await service.delete_many([first.id, third.id])
+        await service.repository.session.commit()
+    async with sessionmaker() as session:
+        await session.execute(update(RollupWatermark).values(watermark=datetime.now(UTC) - timedelta(seconds=1)))
+        await session.commit()
+    assert await tasks.rollup_sprint_burndown({}) == 1
+    assert await today_burndown(sessionmaker) == (0, 0, 0, 0)
+
+
+async def test_rollup_rescans_the_watermark_overlap(
+    sessionmaker: async_sessionmaker[AsyncSession],
+    project: Project,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    (obj,) = await create_sprintlogs(sessionmaker, project, 5)
+    now = datetime.now(UTC)
+    async with sessionmaker() as session:
+        # committed late by a long transaction: updated before the last run
+        await session.execute(
+            update(SprintLog).where(SprintLog.id == obj.id).values(updated_at=now - timedelta(seconds=60)),
+        )
+        await session.execute(insert(RollupWatermark).values(name="sprint_burndown", watermark=now))
+        await session.commit()
+
+    monkeypatch.setattr(settings.worker, "BURNDOWN_WATERMARK_OVERLAP", 30)
+    assert await tasks.rollup_sprint_burndown({}) == 0
+
+    async with sessionmaker() as session:
+        await session.execute(update(RollupWatermark).values(watermark=now))
+        await session.commit()
+    monkeypatch.setattr(settings.worker, "BURNDOWN_WATERMARK_OVERLAP", 300)
+    assert await tasks.rollup_sprint_burndown({}) == 1
+    assert await today_burndown(sessionmaker) == (1, 5, 1, 5)
+
+
+async def test_rollup_prunes_rolled_up_deletions(
+    sessionmaker: async_sessionmaker[AsyncSession],
+    project: Project,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    (obj,) = await create_sprintlogs(sessionmaker, project, 1)
+    # deletions are committed with the delete, not handed to the background write-behind flusher
+    monkeypatch.setattr(settings.db, "WRITE_BEHIND_BACKGROUND", True)
+    monkeypatch.setattr(settings.db, "WRITE_BEHIND_INTERVAL", 3600)
+    await write_behind.flusher.startup()
+    try:
+        async with SprintlogService.new(sessionmaker()) as service:
+            await service.delete(obj.id)
+            await service.repository.session.commit()
+        async with sessionmaker() as session:
+            assert len((await session.scalars(select(SprintlogDeletion))).all()) == 1
+    finally:
+        await write_behind.flusher.shutdown()
+
+    await tasks.rollup_sprint_burndown({})
+    async with sessionmaker() as session:
+        # the deletion is kept while it is within the overlap of the next run
+        assert len((await session.scalars(select(SprintlogDeletion))).all()) == 1
+        await session.execute(update(SprintlogDeletion).values(created_at=datetime.now(UTC) - timedelta(days=1)))
+        await session.commit()
+
+    await tasks.rollup_sprint_burndown({})
+    async with sessionmaker() as session:
+        assert (await session.scalars(select(SprintlogDeletion))).all() == []
+
+
+async def test_sprint_burndown_carries_snapshots_over_gaps(
+    client: AsyncClient,
+    sessionmaker: async_sessionmaker[AsyncSession],
+    project: Project,
+    superuser_token_headers: dict[str, str],
+) -> None:
+    today = datetime.now(UTC).date()
+    async with sessionmaker() as session:
+        await session.execute(
+            insert(SprintBurndown),
+            [
+                {
+                    "project_slug": project.slug,
+                    "sprint_number": 1,
+                    "day": today - timedelta(days=days_ago),
+                    "items": 4,
+                    "points": 8,
+                    "est_days": 4,
+                    "remaining_items": remaining,
+                    "remaining_points": remaining * 2,
+                    "remaining_est_days": remaining,
+                }
+                for days_ago, remaining in ((3, 4), (1, 2))
+            ],
+        )
+        await session.commit()
+
+    response = await client.get(
+        f"/api/stats/sprint-burndown/{project.slug}/1",
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+    days = response.json()["items"]
+    assert [day["day"] for day in days] == [(today - timedelta(days=n)).isoformat() for n in (3, 2, 1, 0)]
+    assert [day["remainingItems"] for day in days] == [4, 4, 2, 2]
+    assert {day["items"] for day in days} == {4}
+
+    response = await client.get(f"/api/stats/sprint-burndown/{project.slug}/2", headers=superuser_token_headers)
+    assert response.json()["items"] == []
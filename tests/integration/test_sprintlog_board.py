@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import TYPE_CHECKING
+
+from sqlalchemy import update
+
+from app.domain.sprintlogs.models import Progress, SprintLog, SprintlogService, Status
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from app.domain.projects.models import Project
+
+
+async def create_sprintlogs(
+    sessionmaker: async_sessionmaker[AsyncSession],
+    project: Project,
+    *items: tuple[int, int, float],
+) -> list[SprintLog]:
+    async with SprintlogService.new(sessionmaker()) as service:
+        objs = [
+            await service.create(
+                {
+                    "title": f"item {number}",
+                    "project_slug": project.slug,
+                    "sprint_number": sprint_number,
+                    "points": points,
+                    "est_days": est_days,
+                    "beg_date": date.today(),
+                    "type": "task",
+                    "labels": [],
+                    "plugin_meta": {},
+                },
+            )
+            for number, (sprint_number, points, est_days) in enumerate(items)
+        ]
+        await service.repository.session.commit()
+    return objs
+
+
+async def test_board_totals_by_grouping_sets(
+    client: AsyncClient,
+    sessionmaker: async_sessionmaker[AsyncSession],
+    project: Project,
+    superuser_token_headers: dict[str, str],
+) -> None:
+    first, *_ = await create_sprintlogs(sessionmaker, project, (1, 2, 1), (1, 3, 2), (2, 5, 0.5))
+    async with SprintlogService.new(sessionmaker()) as service:
+        await service.shift_progress(first.slug, 3)
+        await service.repository.session.commit()
+
+    response = await client.get(f"/api/sprintlogs/board/{project.slug}", headers=superuser_token_headers)
+    assert response.status_code == 200
+    board = response.json()
+    assert board["total"] == {"count": 3, "points": 10, "est_days": 3.5}
+    assert board["sprints"] == [
+        {"sprint_number": 1, "count": 2, "points": 5, "est_days": 3},
+        {"sprint_number": 2, "count": 1, "points": 5, "est_days": 0.5},
+    ]
+    assert board["statuses"] == [
+        {"status": Status.new, "count": 2, "points": 8, "est_days": 2.5},
+        {"status": Status.checked_in, "count": 1, "points": 2, "est_days": 1},
+    ]
+    assert board["progress"] == [
+        {"progress": Progress.empty, "count": 2, "points": 8, "est_days": 2.5},
+        {"progress": Progress.ready, "count": 1, "points": 2, "est_days": 1},
+    ]
+
+    response = await client.get("/api/sprintlogs/board/no-such-project", headers=superuser_token_headers)
+    assert response.json()["total"] == {"count": 0, "points": 0, "est_days": 0}
+    assert response.json()["sprints"] == []
+
+
+async def test_cached_board_is_invalidated_by_transitions(
+    client: AsyncClient,
+    sessionmaker: async_sessionmaker[AsyncSession],
+    project: Project,
+    superuser_token_headers: dict[str, str],
+) -> None:
+    (obj,) = await create_sprintlogs(sessionmaker, project, (1, 2, 1))
+    url = f"/api/sprintlogs/board/{project.slug}"
+    response = await client.get(url, headers=superuser_token_headers)
+    assert response.json()["statuses"] == [{"status": Status.new, "count": 1, "points": 2, "est_days": 1}]
+
+    # a write that bypasses the services is not seen while the board is cached
+    async with sessionmaker() as session:
+        await session.execute(update(SprintLog).where(SprintLog.id == obj.id).values(points=20))
+        await session.commit()
+    response = await client.get(url, headers=superuser_token_headers)
+    assert response.json()["total"]["points"] == 2
+
+    response = await client.put(f"/api/sprintlogs/progress/up/{obj.slug}", headers=superuser_token_headers)
+    assert response.status_code == 200
+    response = await client.get(url, headers=superuser_token_headers)
+    board = response.json()
+    assert board["statuses"] == [{"status": Status.started, "count": 1, "points": 20, "est_days": 1}]
+    assert board["progress"] == [{"progress": Progress.in_progress, "count": 1, "points": 20, "est_days": 1}]
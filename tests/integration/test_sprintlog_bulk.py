@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from sqlalchemy import func, select, update
+
+from app.domain.sprintlogs import models
+from app.domain.sprintlogs.models import Audit, SprintLog, SprintlogService
+from app.lib.exceptions import ConcurrentUpdateError
+from tests.integration.test_sprintlog_transitions import create_sprintlog
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+    from litestar import Litestar
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from app.domain.projects.models import Project
+
+
+def sprintlog_data(project: Project, title: str) -> dict[str, Any]:
+    return {
+        "title": title,
+        "project_slug": project.slug,
+        "sprint_number": 1,
+        "est_days": 1,
+        "beg_date": date.today().isoformat(),
+        "type": "task",
+        "labels": [],
+    }
+
+
+async def test_bulk_create_update_and_delete(
+    client: AsyncClient,
+    sessionmaker: async_sessionmaker[AsyncSession],
+    project: Project,
+    superuser_token_headers: dict[str, str],
+) -> None:
+    response = await client.post(
+        "/api/sprintlogs/bulk",
+        json=[sprintlog_data(project, "first"), sprintlog_data(project, "second")],
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 201
+    created = response.json()
+    assert [item["title"] for item in created] == ["first", "second"]
+    assert len({item["slug"] for item in created}) == 2
+    assert all(item["owner_id"] and item["version"] == 1 for item in created)
+
+    response = await client.put(
+        "/api/sprintlogs/bulk",
+        json=[{**sprintlog_data(project, f"{item['title']} renamed"), "id": item["id"]} for item in created],
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+    updated = response.json()
+    assert [(item["title"], item["version"]) for item in updated] == [("first renamed", 2), ("second renamed", 2)]
+    async with sessionmaker() as session:
+        audits = (await session.scalars(select(Audit).where(Audit.field_name == "title"))).all()
+    assert {(audit.old_value, audit.new_value) for audit in audits} == {
+        ("first", "first renamed"),
+        ("second", "second renamed"),
+    }
+
+    response = await client.delete(
+        "/api/sprintlogs/bulk",
+        params=[("ids", item["id"]) for item in created],
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+    assert {item["id"] for item in response.json()} == {item["id"] for item in created}
+    async with sessionmaker() as session:
+        assert await session.scalar(select(func.count()).select_from(SprintLog)) == 0
+
+
+async def test_bulk_update_conflict_is_a_409(
+    app: Litestar,
+    client: AsyncClient,
+    sessionmaker: async_sessionmaker[AsyncSession],
+    project: Project,
+    superuser_token_headers: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # debug responses are 500s with the traceback
+    monkeypatch.setattr(app, "debug", False)
+    obj = await create_sprintlog(sessionmaker, project)
+    update_many = models.Repository.update_many
+
+    async def update_many_after_another_writer(self: models.Repository, data: list[Any], **kwargs: Any) -> Any:
+        # someone else updates the item between the bulk update loading and writing it
+        async with sessionmaker() as session:
+            await session.execute(
+                update(SprintLog).where(SprintLog.id == obj.id).values(version=SprintLog.version + 1),
+            )
+            await session.commit()
+        return await update_many(self, data, **kwargs)
+
+    monkeypatch.setattr(models.Repository, "update_many", update_many_after_another_writer)
+    response = await client.put(
+        "/api/sprintlogs/bulk",
+        json=[{**sprintlog_data(project, "lost update"), "id": str(obj.id)}],
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 409
+    async with sessionmaker() as session:
+        stored = await session.get(SprintLog, obj.id)
+    assert stored is not None
+    assert stored.title == obj.title
+
+
+async def test_update_many_conflicts_with_concurrent_update(
+    sessionmaker: async_sessionmaker[AsyncSession],
+    project: Project,
+) -> None:
+    obj = await create_sprintlog(sessionmaker, project)
+    async with sessionmaker() as session:
+        await session.execute(update(SprintLog).where(SprintLog.id == obj.id).values(version=SprintLog.version + 1))
+        await session.commit()
+
+    async with SprintlogService.new(sessionmaker()) as service:
+        with pytest.raises(ConcurrentUpdateError):
+            await service.repository.update_many([{"id": obj.id, "title": "stale", "version": obj.version}])
+
+
+async def test_bulk_update_checks_the_versions_sent(
+    app: Litestar,
+    client: AsyncClient,
+    sessionmaker: async_sessionmaker[AsyncSession],
+    project: Project,
+    superuser_token_headers: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(app, "debug", False)
+    first = await create_sprintlog(sessionmaker, project)
+    second = await create_sprintlog(sessionmaker, project)
+    # another user edits the first item after this client read both
+    async with SprintlogService.new(sessionmaker()) as service:
+        await service.update({"title": "their edit"}, item_id=first.id)
+        await service.repository.session.commit()
+
+    response = await client.put(
+        "/api/sprintlogs/bulk",
+        json=[
+            {**sprintlog_data(project, "my edit"), "id": str(obj.id), "version": obj.version} for obj in (first, second)
+        ],
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 412
+    async with sessionmaker() as session:
+        stored = await session.get(SprintLog, first.id)
+    assert stored is not None
+    assert stored.title == "their edit"
+
+    response = await client.put(
+        "/api/sprintlogs/bulk",
+        json=[
+            {**sprintlog_data(project, "my edit"), "id": str(obj.id), "version": version}
+            for obj, version in ((first, first.version + 1), (second, second.version))
+        ],
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+    assert [(item["title"], item["version"]) for item in response.json()] == [
+        ("my edit", first.version + 2),
+        ("my edit", second.version + 1),
+    ]
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import TYPE_CHECKING
+
+import pytest
+
+from app.domain.sprintlogs.models import SprintlogService
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from app.domain.projects.models import Project
+
+
+@pytest.fixture(autouse=True)
+async def _sprintlogs(sessionmaker: async_sessionmaker[AsyncSession], project: Project) -> None:
+    async with SprintlogService.new(sessionmaker()) as service:
+        for title, description, labels in (
+            ("Fix login timeout", "Sessions end too early", []),
+            ("Dashboard polish", "The login page flickers after a timeout", []),
+            ("Billing export", "Monthly CSV", ["Login", "Tech Debt", "bugs"]),
+            ("Release notes", "Nothing to see here", []),
+        ):
+            await service.create(
+                {
+                    "title": title,
+                    "description": description,
+                    "labels": labels,
+                    "project_slug": project.slug,
+                    "sprint_number": 1,
+                    "est_days": 1,
+                    "beg_date": date.today(),
+                    "type": "task",
+                    "plugin_meta": {},
+                },
+            )
+        await service.repository.session.commit()
+
+
+async def search(client: AsyncClient, headers: dict[str, str], q: str) -> dict:
+    response = await client.get("/api/sprintlogs/search", params={"q": q}, headers=headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+async def test_search_ranks_title_matches_first(client: AsyncClient, superuser_token_headers: dict[str, str]) -> None:
+    result = await search(client, superuser_token_headers, "login timeout")
+    assert result["total"] == 2
+    first, second = result["items"]
+    assert (first["title"], second["title"]) == ("Fix login timeout", "Dashboard polish")
+    assert first["rank"] > second["rank"]
+    assert first["title_highlight"] == "Fix <b>login</b> <b>timeout</b>"
+    assert "<b>login</b>" in second["snippet"]
+
+
+async def test_search_web_style_operators(client: AsyncClient, superuser_token_headers: dict[str, str]) -> None:
+    # a quoted phrase needs the words next to each other
+    result = await search(client, superuser_token_headers, '"login timeout"')
+    assert [hit["title"] for hit in result["items"]] == ["Fix login timeout"]
+
+    # labels are searched too, and a leading minus excludes a word
+    result = await search(client, superuser_token_headers, "login -timeout")
+    assert [hit["title"] for hit in result["items"]] == ["Billing export"]
+
+    result = await search(client, superuser_token_headers, "timeout or notes")
+    assert {hit["title"] for hit in result["items"]} == {"Fix login timeout", "Dashboard polish", "Release notes"}
+
+    result = await search(client, superuser_token_headers, "unknown")
+    assert (result["items"], result["total"]) == ([], 0)
+
+
+async def test_search_stems_labels(client: AsyncClient, superuser_token_headers: dict[str, str]) -> None:
+    for q in ("bug", "Bugs", "tech debt", "LOGIN export"):
+        result = await search(client, superuser_token_headers, q)
+        assert [hit["title"] for hit in result["items"]] == ["Billing export"], q
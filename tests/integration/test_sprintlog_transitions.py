@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import event, select
+
+from app.domain.sprintlogs.models import Audit, Progress, SprintLog, SprintlogService, Status
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+    from app.domain.projects.models import Project
+
+
+async def create_sprintlog(sessionmaker: async_sessionmaker[AsyncSession], project: Project) -> SprintLog:
+    async with SprintlogService.new(sessionmaker()) as service:
+        obj = await service.create(
+            {
+                "title": "transition me",
+                "project_slug": project.slug,
+                "sprint_number": 1,
+                "est_days": 1,
+                "beg_date": date.today(),
+                "type": "task",
+                "plugin_meta": {},
+            },
+        )
+        await service.repository.session.commit()
+    return obj
+
+
+async def test_transition_records_audit_rows(sessionmaker: async_sessionmaker[AsyncSession], project: Project) -> None:
+    obj = await create_sprintlog(sessionmaker, project)
+    assert (obj.progress, obj.status) == (Progress.empty, Status.new)
+
+    async with SprintlogService.new(sessionmaker()) as service:
+        moved = await service.shift_progress(obj.slug, 1)
+        await service.repository.session.commit()
+    assert moved is not None
+    assert (moved.progress, moved.status, moved.version) == (Progress.in_progress, Status.started, obj.version + 1)
+
+    async with sessionmaker() as session:
+        audits = (await session.scalars(select(Audit).where(Audit.backlog_id == obj.id))).all()
+    assert {(audit.field_name, audit.old_value, audit.new_value) for audit in audits} == {
+        ("progress", Progress.empty, Progress.in_progress),
+        ("status", Status.new, Status.started),
+    }
+
+    async with SprintlogService.new(sessionmaker()) as service:
+        # an unknown slug updates nothing and records nothing
+        assert await service.shift_progress("no-such-item", 1) is None
+        await service.repository.session.commit()
+    async with sessionmaker() as session:
+        assert len((await session.scalars(select(Audit))).all()) == 2
+
+
+async def test_progress_and_status_move_in_one_update(
+    engine: AsyncEngine,
+    sessionmaker: async_sessionmaker[AsyncSession],
+    project: Project,
+) -> None:
+    obj = await create_sprintlog(sessionmaker, project)
+    statements: list[str] = []
+
+    def record(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        async with SprintlogService.new(sessionmaker()) as service:
+            moved = []
+            for _ in range(3):
+                item = await service.shift_progress(obj.slug, 1)
+                assert item is not None
+                moved.append((item.progress, item.status))
+            await service.repository.session.commit()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
+    assert moved == [
+        (Progress.in_progress, Status.started),
+        (Progress.half_way, Status.started),
+        (Progress.ready, Status.checked_in),
+    ]
+    # one UPDATE per transition, no SELECT before it
+    transitions = [statement for statement in statements if "sprint_log" in statement and "audit" not in statement]
+    assert len(transitions) == 3
+    assert all(statement.lstrip().upper().startswith("WITH") for statement in transitions)
+    assert all("UPDATE sprint_log" in statement for statement in transitions)
+
+
+async def test_progress_stops_at_the_ends_or_wraps(
+    sessionmaker: async_sessionmaker[AsyncSession],
+    project: Project,
+) -> None:
+    obj = await create_sprintlog(sessionmaker, project)
+    async with SprintlogService.new(sessionmaker()) as service:
+        # moving down from the first step stays there
+        down = await service.shift_progress(obj.slug, -1)
+        assert down is not None
+        assert (down.progress, down.status) == (Progress.empty, Status.started)
+
+        ready = await service.shift_progress(obj.slug, 3)
+        assert ready is not None
+        assert (ready.progress, ready.status) == (Progress.ready, Status.checked_in)
+        # moving up from the last step stays there too
+        up = await service.shift_progress(obj.slug, 1)
+        assert up is not None
+        assert (up.progress, up.status) == (Progress.ready, Status.checked_in)
+
+        wrapped = await service.shift_progress(obj.slug, 1, wrap=True)
+        assert wrapped is not None
+        assert (wrapped.progress, wrapped.status, wrapped.version) == (Progress.empty, Status.started, obj.version + 4)
+        await service.repository.session.commit()
+
+    async with sessionmaker() as session:
+        audits = (
+            await session.scalars(
+                select(Audit).where(Audit.backlog_id == obj.id, Audit.field_name == "progress"),
+            )
+        ).all()
+    assert {(audit.old_value, audit.new_value) for audit in audits} == {
+        (Progress.empty, Progress.ready),
+        (Progress.ready, Progress.empty),
+    }
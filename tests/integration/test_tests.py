@@ -4,14 +4,15 @@ from httpx import AsyncClient
 from litestar import get
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.lib import db
+from app.lib import cache, db
 
 if TYPE_CHECKING:
     from litestar import Litestar
-    from litestar.stores.redis import RedisStore
     from redis.asyncio import Redis as AsyncRedis
     from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
 
+    from app.lib.cache import TwoTierStore
+
 
 def test_cache_on_app(app: "Litestar", redis: "AsyncRedis") -> None:
     """Test that the app's cache is patched.
@@ -20,7 +21,9 @@ def test_cache_on_app(app: "Litestar", redis: "AsyncRedis") -> None:
         app: The test Litestar instance
         redis: The test Redis client instance.
     """
-    assert cast("RedisStore", app.stores.get("response_cache"))._redis is redis
+    store = cast("TwoTierStore", app.stores.get("response_cache"))
+    assert isinstance(store, cache.TwoTierStore)
+    assert cache.redis is redis
 
 
 def test_engine_on_app(app: "Litestar", engine: "AsyncEngine") -> None:
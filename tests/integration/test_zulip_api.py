@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import time
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from app.lib import cache
+from app.lib.plugin import PluginRegistry
+from app.lib.settings import server
+from app.plugins import zulip
+
+if TYPE_CHECKING:
+    from app.domain.projects.models import Project
+
+
+@pytest.fixture(name="requests")
+async def fx_requests(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, str]]:
+    """Zulip API requests as `(method, path)`, answered like a server with the listed streams."""
+    requests: list[tuple[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((request.method, request.url.path))
+        match request.url.path:
+            case "/api/v1/streams":
+                streams = [{"name": "PRJ/Sprint Board", "stream_id": 12}]
+                return httpx.Response(200, json={"result": "success", "streams": streams})
+            case "/api/v1/get_stream_id":
+                return httpx.Response(200, json={"result": "success", "stream_id": 34})
+            case "/api/v1/messages":
+                return httpx.Response(200, json={"result": "success", "id": 56})
+        return httpx.Response(200, json={"result": "success"})
+
+    monkeypatch.setattr(server, "ZULIP_API_URL", "http://zulip.test")
+    monkeypatch.setattr(server, "ZULIP_SEND_MESSAGE_URL", "/api/v1/messages")
+    monkeypatch.setattr(server, "ZULIP_CREATE_STREAM_URL", "/api/v1/users/me/subscriptions")
+    monkeypatch.setattr(zulip, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    await zulip.stream_cache.clear()
+    return requests
+
+
+async def test_warm_up_caches_streams_the_bot_is_not_subscribed_to(
+    requests: list[tuple[str, str]],
+    project: Project,
+) -> None:
+    await zulip._warm_stream_cache()  # noqa: SLF001
+
+    assert requests == [("GET", "/api/v1/streams")]
+    assert await zulip.stream_cache.get("PRJ/Sprint Board") == b"12"
+    assert await zulip.resolve_stream_id("PRJ/Sprint Board") == 12
+
+    await zulip.send_msg("PRJ/Sprint Board", "topic", "content")
+    assert requests[1:] == [("POST", "/api/v1/messages")]
+
+
+async def test_stream_known_to_exist_is_not_created_again(requests: list[tuple[str, str]]) -> None:
+    await zulip.send_msg("PRJ/Other", "topic", "content")
+    assert await zulip.stream_cache.get("PRJ/Other") == zulip._STREAM_EXISTS  # noqa: SLF001
+
+    await zulip.send_msg("PRJ/Other", "topic", "content")
+    assert requests == [("POST", "/api/v1/messages"), ("POST", "/api/v1/messages")]
+
+    # only existence is known, the id is looked up once
+    assert await zulip.resolve_stream_id("PRJ/Other") == 34
+    assert await zulip.resolve_stream_id("PRJ/Other") == 34
+    assert requests[2:] == [("GET", "/api/v1/get_stream_id")]
+
+
+async def test_missing_stream_is_created_once(requests: list[tuple[str, str]]) -> None:
+    await zulip.stream_cache.set("PRJ/Gone", zulip._STREAM_MISSING)  # noqa: SLF001
+
+    await zulip.send_msg("PRJ/Gone", "topic", "content")
+    await zulip.send_msg("PRJ/Gone", "topic", "content")
+
+    assert requests == [
+        ("POST", "/api/v1/users/me/subscriptions"),
+        ("POST", "/api/v1/messages"),
+        ("POST", "/api/v1/messages"),
+    ]
+
+
+async def test_health_reports_the_dispatcher_queue_depth_of_live_processes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(zulip.dispatcher, "queue_depth", 3)
+    publisher = asyncio.create_task(zulip._publish_dispatcher_stats())  # noqa: SLF001
+    await asyncio.sleep(0.01)
+    publisher.cancel()
+    stale = {"queue_depth": 5, "updated": time.time() - 3600}
+    await cache.redis.hset(zulip._dispatcher_stats_key(), "gone:1", json.dumps(stale))  # noqa: SLF001
+
+    registry = PluginRegistry(enabled=["zulip"]).load()
+    assert await registry.health() == {"zulip": {"dispatcher_queue_depth": 3, "dispatcher_processes": 1}}
+    assert await cache.redis.hkeys(zulip._dispatcher_stats_key()) == [  # noqa: SLF001
+        f"{socket.gethostname()}:{os.getpid()}".encode(),
+    ]
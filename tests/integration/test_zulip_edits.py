@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from app.domain.plugins import get_queue
+from app.domain.system import tasks
+from app.lib import plugin
+from app.lib.plugin import PluginRegistry
+from app.lib.settings import server
+from app.plugins import zulip
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+
+@pytest.fixture(name="patches")
+async def fx_patches(monkeypatch: pytest.MonkeyPatch) -> list[dict[str, str]]:
+    """Zulip message PATCH requests, answered with success."""
+    patches: list[dict[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        patches.append(dict(httpx.QueryParams(request.content.decode())))
+        return httpx.Response(200, json={"result": "success"})
+
+    monkeypatch.setattr(server, "ZULIP_API_URL", "http://zulip.test")
+    monkeypatch.setattr(server, "ZULIP_UPDATE_MESSAGE_URL", "/api/v1/messages")
+    monkeypatch.setattr(server, "ZULIP_EDIT_DEBOUNCE", 5.0)
+    monkeypatch.setattr(zulip, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(plugin, "registry", PluginRegistry(enabled=["zulip"]).load())
+    return patches
+
+
+async def queue_edit(msg_id: int, content: str) -> None:
+    await zulip.ZulipSprintlogPlugin()._queue_message_edit(  # noqa: SLF001
+        topic_name="topic",
+        msg_id=msg_id,
+        content=content,
+        propagate_mode="change_all",
+    )
+
+
+async def flush(msg_id: int) -> None:
+    await tasks.run_plugin_task({}, task="zulip.flush_message_edit", msg_id=msg_id)
+
+
+async def test_message_edits_are_coalesced_into_one_delayed_job(
+    patches: list[dict[str, str]],
+    redis: Redis,
+) -> None:
+    for content in ("first", "second", "third"):
+        await queue_edit(7, content)
+    assert patches == []
+
+    queue = get_queue("plugin-events")
+    assert await queue.count("incomplete") == 1
+    job = await queue.job(zulip._edit_key(7))  # noqa: SLF001
+    assert job is not None
+    assert job.function == "run_plugin_task"
+    assert job.kwargs == {"task": "zulip.flush_message_edit", "msg_id": 7}
+    assert job.scheduled >= time.time() + 4
+    assert job.retries == server.ZULIP_EDIT_RETRIES
+
+    await flush(7)
+    assert [patch["content"] for patch in patches] == ["third"]
+    assert await redis.get(zulip._edit_key(7)) is None  # noqa: SLF001
+
+    # nothing left to send when a retried job runs again
+    await flush(7)
+    assert len(patches) == 1
+
+
+async def test_failed_message_edit_is_kept_for_the_retry(
+    patches: list[dict[str, str]],
+    redis: Redis,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    responses = iter([httpx.Response(500, text="unavailable")])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        response = next(responses, None)
+        if response is not None:
+            return response
+        patches.append(dict(httpx.QueryParams(request.content.decode())))
+        return httpx.Response(200, json={"result": "success"})
+
+    monkeypatch.setattr(zulip, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    await queue_edit(8, "only")
+
+    with pytest.raises(httpx.HTTPError):
+        await flush(8)
+    assert await redis.get(zulip._edit_key(8)) is not None  # noqa: SLF001
+
+    await flush(8)
+    assert [patch["content"] for patch in patches] == ["only"]
+
+
+async def test_edit_queued_while_sending_is_sent_by_the_same_job(
+    patches: list[dict[str, str]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    send = zulip.ZulipSprintlogPlugin._send_message_edit  # noqa: SLF001
+    queued_during_send = False
+
+    async def send_and_queue(self: zulip.ZulipSprintlogPlugin, **kwargs: str) -> None:
+        nonlocal queued_during_send
+        await send(self, **kwargs)
+        if not queued_during_send:
+            queued_during_send = True
+            await queue_edit(9, "newer")
+
+    monkeypatch.setattr(zulip.ZulipSprintlogPlugin, "_send_message_edit", send_and_queue)
+    await queue_edit(9, "older")
+
+    await flush(9)
+    assert [patch["content"] for patch in patches] == ["older", "newer"]
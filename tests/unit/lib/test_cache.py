@@ -1,12 +1,20 @@
+import asyncio
+from datetime import UTC, datetime
+from types import SimpleNamespace
 from typing import TYPE_CHECKING
+from uuid import uuid4
 
+import pytest
 from litestar.config.response_cache import default_cache_key_builder
 from litestar.testing import RequestFactory
 
+from app.domain.accounts.cache import dump_user, load_user
+from app.domain.accounts.models import User
+from app.domain.teams.models import Team, TeamMember, TeamRoles
 from app.lib import cache, settings
 
 if TYPE_CHECKING:
-    import pytest
+    from litestar.types.asgi_types import Receive, Scope, Send
 
 
 def test_cache_key_builder(monkeypatch: "pytest.MonkeyPatch") -> None:
@@ -14,3 +22,111 @@ def test_cache_key_builder(monkeypatch: "pytest.MonkeyPatch") -> None:
     request = RequestFactory().get("/test")
     default_cache_key = default_cache_key_builder(request)
     assert cache.cache_key_builder(request) == f"the-slug:{default_cache_key}"
+
+
+def test_cache_key_builder_scoped_to_user(monkeypatch: "pytest.MonkeyPatch") -> None:
+    monkeypatch.setattr(settings.AppSettings, "slug", "the-slug")
+    user = SimpleNamespace(id=uuid4())
+    request = RequestFactory().get("/test", user=user)
+    default_cache_key = default_cache_key_builder(request)
+    assert cache.cache_key_builder(request) == f"the-slug:user:{user.id}:{default_cache_key}"
+    assert cache.shared_cache_key_builder(request) == f"the-slug:{default_cache_key}"
+
+
+def test_two_tier_cache_local_tags() -> None:
+    local_cache = cache.TwoTierCache("test", expiration=60, local_expiration=5, local_size=10)
+    local_cache.set_local("board", b"1", tags=[cache.project_tag("alpha")])
+    local_cache.set_local("list", b"2", tags=[cache.project_tag("alpha"), cache.PROJECTS_TAG])
+    local_cache.set_local("other", b"3", tags=[cache.project_tag("beta")])
+
+    local_cache.evict_local_tags(cache.project_tag("alpha"))
+
+    assert local_cache.get_local("board") is None
+    assert local_cache.get_local("list") is None
+    assert local_cache.get_local("other") == b"3"
+    assert cache.tagged_key("key", "a", "b") == "key#a,b"
+
+
+def test_two_tier_cache_local_lru(monkeypatch: "pytest.MonkeyPatch") -> None:
+    local_cache = cache.TwoTierCache("test", expiration=60, local_expiration=5, local_size=2)
+    now = 100.0
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now)
+    local_cache.set_local("a", b"1")
+    local_cache.set_local("b", b"2")
+    assert local_cache.get_local("a") == b"1"
+    local_cache.set_local("c", b"3")
+    assert local_cache.get_local("b") is None
+    assert local_cache.get_local("a") == b"1"
+    now = 106.0
+    assert local_cache.get_local("c") is None
+
+
+async def test_two_tier_store_single_flight(monkeypatch: "pytest.MonkeyPatch") -> None:
+    local_cache = cache.TwoTierCache("test", expiration=60, local_expiration=5, local_size=10)
+    local_cache._redis_down_until = float("inf")
+    store = cache.TwoTierStore(local_cache, stale_expiration=30, lock_timeout=1)
+
+    assert await store.get("key#tag") is None
+    waiters = [asyncio.create_task(store.get("key#tag")) for _ in range(2)]
+    await asyncio.sleep(0)
+    await store.set("key#tag", b"fresh", expires_in=10)
+    assert await asyncio.gather(*waiters) == [b"fresh", b"fresh"]
+
+    now = cache.time.time() + 11
+    monkeypatch.setattr(cache.time, "time", lambda: now)
+    assert await store.get("key#tag") is None
+    assert await store.get("key#tag") == b"fresh"
+
+
+async def test_single_flight_middleware_abandons_failed_flights() -> None:
+    local_cache = cache.TwoTierCache("test", expiration=60, local_expiration=5, local_size=10)
+    local_cache._redis_down_until = float("inf")
+    store = cache.TwoTierStore(local_cache, stale_expiration=30, lock_timeout=60)
+
+    computing, failing = asyncio.Event(), asyncio.Event()
+
+    async def app(scope: "Scope", receive: "Receive", send: "Send") -> None:
+        assert await store.get("key#tag") is None
+        computing.set()
+        await failing.wait()
+        msg = "handler failed"
+        raise RuntimeError(msg)
+
+    request = asyncio.create_task(cache.single_flight_middleware(app)({"type": "http"}, None, None))  # type: ignore
+    await computing.wait()
+    waiter = asyncio.create_task(store.get("key#tag"))
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+    failing.set()
+    with pytest.raises(RuntimeError):
+        await request
+    # the waiter gets a miss right away instead of after the lock timeout
+    assert await asyncio.wait_for(waiter, 1) is None
+    assert store._flights == {}
+
+
+def test_user_snapshot_round_trip() -> None:
+    now = datetime.now(UTC)
+    user = User(
+        id=uuid4(),
+        email="user@example.com",
+        name="User",
+        hashed_password="secret",
+        is_active=True,
+        is_superuser=False,
+        is_verified=True,
+        verified_at=None,
+        created_at=now,
+        updated_at=now,
+    )
+    team = Team(id=uuid4(), slug="team", name="Team", description=None, is_active=True)
+    user.teams = [TeamMember(id=uuid4(), team_id=team.id, role=TeamRoles.ADMIN, is_owner=True, team=team)]
+
+    restored = load_user(dump_user(user))
+
+    assert restored.email == user.email
+    assert restored.hashed_password is None
+    assert restored.created_at == now
+    assert [(m.team.id, m.team_name, m.role, m.is_owner) for m in restored.teams] == [
+        (team.id, "Team", TeamRoles.ADMIN, True),
+    ]
@@ -1,9 +1,11 @@
 # pylint: disable=protected-access
 from __future__ import annotations
 
+import asyncio
 import base64
 
 import pytest
+from litestar.exceptions import TooManyRequestsException
 from pydantic import SecretBytes, SecretStr
 
 from app.lib import crypt
@@ -51,3 +53,17 @@ async def test_verify_password(valid_password: str, tested_password: str, expect
     is_valid = await crypt.verify_password(tested_password, secret_str_hash)
 
     assert is_valid == expected_result
+
+
+async def test_password_hashing_rejects_when_saturated(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that hashing beyond the workers and queue depth is rejected."""
+    monkeypatch.setattr(crypt.settings.app, "PASSWORD_HASH_WORKERS", 1)
+    monkeypatch.setattr(crypt.settings.app, "PASSWORD_HASH_QUEUE_DEPTH", 1)
+    results = await asyncio.gather(
+        *(crypt.get_password_hash("This is a password!") for _ in range(3)),
+        return_exceptions=True,
+    )
+    await crypt.on_shutdown()
+
+    assert sum(isinstance(result, TooManyRequestsException) for result in results) == 1
+    assert all(result.startswith("$argon2") for result in results if isinstance(result, str))
@@ -8,8 +8,13 @@ from unittest.mock import MagicMock
 from advanced_alchemy.extensions.litestar.plugins.init.config.asyncio import autocommit_before_send_handler
 from advanced_alchemy.extensions.litestar.plugins.init.config.common import SESSION_SCOPE_KEY
 from litestar.constants import SCOPE_STATE_NAMESPACE
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.domain.sprintlogs.models import SprintLog
+from app.lib import constants
+from app.lib.db import base, orm
+
 if TYPE_CHECKING:
     from litestar import Litestar
     from litestar.types import HTTPResponseStartEvent, HTTPScope
@@ -43,3 +48,36 @@ async def test_before_send_handler_error_response(
     http_response_start["status"] = random.randint(300, 599)  # noqa: S311
     await autocommit_before_send_handler(http_response_start, http_scope)
     mock_session.rollback.assert_awaited_once()
+
+
+def test_reads_from_replica(http_scope: HTTPScope) -> None:
+    """Test that only safe, uncached requests without the primary cookie read from the replica."""
+    http_scope["method"] = "GET"
+    http_scope["headers"] = []
+    assert base._reads_from_replica(http_scope)
+    http_scope["headers"] = [(b"cookie", f"{constants.DB_PRIMARY_COOKIE}=1".encode())]
+    assert not base._reads_from_replica(http_scope)
+    http_scope["headers"] = []
+    http_scope["route_handler"] = MagicMock(cache=60)
+    assert not base._reads_from_replica(http_scope)
+    http_scope["route_handler"] = MagicMock(cache=False)
+    http_scope["method"] = "POST"
+    assert not base._reads_from_replica(http_scope)
+
+
+def test_jsonb_patch_only_sends_changed_keys() -> None:
+    def compile_patch(old: object, new: object) -> tuple[str, list]:
+        compiled = orm.jsonb_patch(SprintLog.plugin_meta, old, new).compile(dialect=postgresql.dialect())
+        return str(compiled), list(compiled.params.values())
+
+    sql, params = compile_patch({"msg_id": 1, "old": True, "same": 2}, {"msg_id": 3, "same": 2})
+    assert "sprint_log.plugin_meta - " in sql
+    assert "||" in sql
+    assert params == ["object", ["old"], '{"msg_id":3}', '{"msg_id":3,"same":2}']
+
+    sql, params = compile_patch("eyJtc2dfaWQiOjd9", {"msg_id": 7})
+    assert " - " not in sql
+    assert params == ["object", '{"msg_id":7}', '{"msg_id":7}']
+
+    sql, _ = compile_patch({"msg_id": 1}, None)
+    assert "CASE" not in sql
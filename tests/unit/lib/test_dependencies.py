@@ -15,12 +15,14 @@ from advanced_alchemy.filters import (
     SearchFilter,
 )
 from litestar import Litestar, get
+from litestar.exceptions import ValidationException
 from litestar.params import Dependency
 from litestar.testing import RequestFactory, TestClient
 
 from app.domain import security
 from app.domain.accounts.models import User
 from app.lib import dependencies
+from app.lib.filters import ArrayFilter
 
 if TYPE_CHECKING:
     from collections import abc
@@ -93,6 +95,33 @@ def test_limit_offset_pagination() -> None:
     assert dependencies.provide_limit_offset_pagination(10, 100) == LimitOffset(100, 900)
 
 
+def test_labels_filters() -> None:
+    assert dependencies.provide_labels_any_filter(["bug", "ui"]) == ArrayFilter("labels", ["bug", "ui"])
+    assert dependencies.provide_labels_all_filter(["bug"]) == ArrayFilter("labels", ["bug"], match_all=True)
+    assert dependencies.provide_labels_any_filter(None) == ArrayFilter("labels", [])
+
+
+def test_labels_filters_are_only_in_labeled_filters() -> None:
+    limit_offset = LimitOffset(10, 0)
+    filters = dependencies.provide_filter_dependencies(
+        created_filter=BeforeAfter("created_at", None, None),
+        updated_filter=BeforeAfter("updated_at", None, None),
+        id_filter=CollectionFilter("id", []),
+        limit_offset=limit_offset,
+        search_filter=SearchFilter(None, None),  # type: ignore[arg-type]
+        order_by=OrderBy(None),  # type: ignore[arg-type]
+    )
+    assert not any(isinstance(filter_, ArrayFilter) for filter_ in filters)
+
+    labels_any = ArrayFilter("labels", ["bug"])
+    labeled = dependencies.provide_labeled_filter_dependencies(
+        filters=filters,
+        labels_any_filter=labels_any,
+        labels_all_filter=ArrayFilter("labels", [], match_all=True),
+    )
+    assert labeled == [*filters, labels_any]
+
+
 def test_provided_filters(app: Litestar, client: TestClient) -> None:
     called = False
     path = f"/{uuid4()}"
@@ -169,3 +198,16 @@ def test_filters_dependency(app: "Litestar", client: "TestClient") -> None:
         },
     )
     assert called
+
+
+@pytest.mark.parametrize(
+    ("if_match", "version"),
+    [(None, None), ("*", None), ('"3"', 3), ('W/"12"', 12), ('"abc"', 0)],
+)
+def test_provide_if_match_version(if_match: str | None, version: int | None) -> None:
+    assert dependencies.provide_if_match_version(if_match) == version
+
+
+def test_provide_if_match_version_rejects_tag_lists() -> None:
+    with pytest.raises(ValidationException):
+        dependencies.provide_if_match_version('"3", "4"')
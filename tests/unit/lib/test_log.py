@@ -408,3 +408,16 @@ def test_event_filter() -> None:
     log_event = {"a_key": "a_val", "b_key": "b_val"}
     log_event = event_filter(..., "", log_event)  # type:ignore[assignment]
     assert log_event == {"b_key": "b_val"}
+
+
+def test_query_stats_repeated_statements() -> None:
+    stats = log.sql.QueryStats()
+    for _ in range(3):
+        stats.record("SELECT * FROM tag WHERE tag.id = $1", 0.001)
+    stats.record("SELECT * FROM tag WHERE tag.id IN ($1, $2, $3)", 0.002)
+    stats.record("SELECT * FROM tag WHERE tag.id IN ($1)", 0.002)
+
+    assert stats.count == 5
+    assert stats.repeated(2) == [("SELECT * FROM tag WHERE tag.id = ?", 3)]
+    assert stats.repeated(3) == []
+    assert stats.server_timing() == 'db;dur=7.0;desc="5 queries"'
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from litestar.exceptions import ValidationException
+
+from app.lib.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip() -> None:
+    row = SimpleNamespace(updated_at=datetime(2023, 11, 2, 8, 30, 15, 123456, tzinfo=UTC), id=uuid4())
+
+    assert decode_cursor(encode_cursor(row)) == (row.updated_at, row.id)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("cursor", ["garbage!", "WzEsMl0=", ""])
+def test_invalid_cursor(cursor: str) -> None:
+    with pytest.raises(ValidationException):
+        decode_cursor(cursor)
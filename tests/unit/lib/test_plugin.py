@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from app.lib.plugin import PluginRegistry
+
+
+def test_registry_discovers_enabled_plugins() -> None:
+    registry = PluginRegistry(enabled=["zulip"]).load()
+
+    assert registry.loaded
+    assert registry.names() == ["ZulipSprintlogPlugin", "ZulipProjectPlugin"]
+
+
+def test_registry_skips_disabled_plugins() -> None:
+    registry = PluginRegistry(enabled=[]).load()
+
+    assert registry.sprintlog == ()
+    assert registry.project == ()
+
+
+def test_registry_load_is_idempotent_and_reload_rebuilds() -> None:
+    registry = PluginRegistry(enabled=["zulip"]).load()
+    first = registry.sprintlog[0]
+
+    assert registry.load().sprintlog[0] is first
+    assert registry.reload().sprintlog[0] is not first
+
+
+def test_registry_resolves_tasks_of_loaded_modules() -> None:
+    from app.plugins import zulip
+
+    registry = PluginRegistry(enabled=["zulip"]).load()
+
+    assert registry.task("zulip.flush_message_edit") is zulip.flush_message_edit
+    with pytest.raises(LookupError):
+        registry.task("zulip.get_client")
+    with pytest.raises(LookupError):
+        PluginRegistry(enabled=[]).load().task("zulip.flush_message_edit")
+
+
+async def test_registry_lifecycle_manages_zulip_client() -> None:
+    from app.plugins import zulip
+
+    registry = PluginRegistry(enabled=["zulip"]).load()
+
+    await registry.startup()
+    client = zulip.get_client()
+    assert zulip.get_client() is client
+    assert not client.is_closed
+
+    await registry.shutdown()
+    assert client.is_closed
+    assert zulip.get_client() is not client
+    await zulip.on_shutdown()
+
+
+async def test_zulip_dispatcher_queues_and_retries_rate_limited_requests(monkeypatch: pytest.MonkeyPatch) -> None:
+    import httpx
+
+    from app.plugins import zulip
+
+    statuses = iter([429, 200, 200, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(statuses), headers={"Retry-After": "0.05"}, json={})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(zulip, "_client", client)
+    dispatcher = zulip.Dispatcher(rate=2, period=0.1, retries=1)
+
+    started = time.monotonic()
+    responses = await asyncio.gather(*(dispatcher.request("GET", "http://zulip/api") for _ in range(3)))
+
+    assert [response.status_code for response in responses] == [200, 200, 200]
+    assert time.monotonic() - started >= 0.05
+    assert dispatcher.queue_depth == 0
+    await client.aclose()
+
+
+async def test_zulip_dispatcher_waits_concurrently_and_raises_when_still_limited(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import httpx
+
+    from app.plugins import zulip
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = 429 if request.url.path == "/limited" else 200
+        return httpx.Response(status, headers={"Retry-After": "0.05"}, json={})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(zulip, "_client", client)
+    dispatcher = zulip.Dispatcher(rate=1, period=0.05, retries=2)
+
+    started = time.monotonic()
+    requests = asyncio.gather(*(dispatcher.request("GET", "http://zulip/api") for _ in range(4)))
+    await asyncio.sleep(0.01)
+    assert dispatcher.queue_depth == 3
+    await requests
+    # the waits for the three refills overlap instead of queueing on a lock
+    assert time.monotonic() - started < 0.25
+    assert dispatcher.queue_depth == 0
+
+    with pytest.raises(zulip.RateLimitError) as exc_info:
+        await dispatcher.request("GET", "http://zulip/limited")
+    assert exc_info.value.response.status_code == 429
+    assert isinstance(exc_info.value, httpx.HTTPError)
+    await client.aclose()
+
+
+async def test_gather_hooks_isolates_failing_and_slow_plugins() -> None:
+    from app.lib.plugin import gather_hooks
+
+    class Plugin:
+        hook_timeout = 0.05
+
+        def __init__(self, delay: float, fail: bool = False) -> None:
+            self.delay = delay
+            self.fail = fail
+
+        async def after_create(self, data: dict) -> dict:
+            await asyncio.sleep(self.delay)
+            if self.fail:
+                raise RuntimeError
+            return data
+
+    data = {"id": 1}
+    plugins = [Plugin(0.03), Plugin(0.03), Plugin(0, fail=True), Plugin(1)]
+    started = time.monotonic()
+    results = await gather_hooks(plugins, "after_create", suppress_errors=True, data=data)
+
+    assert results == [data, data, None, None]
+    assert time.monotonic() - started < 0.5
+
+    with pytest.raises(ExceptionGroup) as exc_info:
+        await gather_hooks(plugins, "after_create", data=data)
+    assert [type(exc) for exc in exc_info.value.exceptions] == [RuntimeError, TimeoutError]
+    assert await gather_hooks(plugins[:2], "after_create", data=data) == [data, data]
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from datetime import date
+from uuid import uuid4
+
+from app.domain.sprintlogs.models import audit_diff
+
+
+def test_audit_diff_only_changed_fields() -> None:
+    item_id = uuid4()
+    old = {"title": "a", "labels": ["x"], "due_date": date(2023, 1, 2), "updated_at": 1, "assignee_id": None}
+    new = {"title": "b", "labels": ["x"], "due_date": date(2023, 1, 3), "updated_at": 2}
+
+    assert audit_diff(item_id, old, new) == [
+        {"backlog_id": item_id, "field_name": "title", "old_value": "a", "new_value": "b"},
+        {"backlog_id": item_id, "field_name": "due_date", "old_value": "2023-01-02", "new_value": "2023-01-03"},
+    ]
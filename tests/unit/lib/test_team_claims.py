@@ -0,0 +1,42 @@
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+from litestar.contrib.jwt import Token
+
+from app.domain.accounts.models import User
+from app.domain.teams import claims
+from app.domain.teams.models import TeamMember, TeamRoles
+
+
+def _user(*members: TeamMember) -> User:
+    user = User(email="user@example.com")
+    user.teams = list(members)
+    return user
+
+
+def test_team_claims_round_trip() -> None:
+    team_id = uuid4()
+    user = _user(TeamMember(team_id=team_id, role=TeamRoles.ADMIN, is_owner=True))
+    token = Token(exp=datetime.now(UTC) + timedelta(minutes=5), sub=user.email, extras=claims.team_claims(user))
+
+    claims.drop_stale_team_claims(token, user)
+    connection = SimpleNamespace(auth=token, user=_user())
+
+    assert claims.team_roles(connection) == {str(team_id): ("ADMIN", True)}  # type: ignore[arg-type]
+
+
+def test_stale_team_claims_fall_back_to_memberships() -> None:
+    team_id = uuid4()
+    token = Token(
+        exp=datetime.now(UTC) + timedelta(minutes=5),
+        sub="user@example.com",
+        extras=claims.team_claims(_user(TeamMember(team_id=team_id, role=TeamRoles.ADMIN, is_owner=False))),
+    )
+    user = _user(TeamMember(team_id=team_id, role=TeamRoles.MEMBER, is_owner=False))
+
+    claims.drop_stale_team_claims(token, user)
+    connection = SimpleNamespace(auth=token, user=user)
+
+    assert claims.TEAMS_CLAIM not in token.extras
+    assert claims.team_roles(connection) == {str(team_id): ("MEMBER", False)}  # type: ignore[arg-type]
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+from app.lib.db import write_behind
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Row(Base):
+    __tablename__ = "row"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    value: Mapped[str]
+
+
+def _session() -> Session:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    return Session(engine)
+
+
+def test_rows_written_on_commit() -> None:
+    with _session() as session:
+        write_behind.queue(session, Row, [{"value": "a"}, {"value": "b"}])
+        assert session.scalars(select(Row.value)).all() == []
+
+        session.commit()
+
+        assert session.scalars(select(Row.value).order_by(Row.value)).all() == ["a", "b"]
+        assert write_behind.PENDING_KEY not in session.info
+
+
+def test_rows_discarded_on_rollback() -> None:
+    with _session() as session:
+        session.execute(select(Row))
+        write_behind.queue(session, Row, [{"value": "a"}])
+        session.rollback()
+        session.commit()
+
+        assert session.scalars(select(Row.value)).all() == []